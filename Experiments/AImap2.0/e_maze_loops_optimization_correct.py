@@ -185,23 +185,36 @@ def branch_points(grid):
         if grid[y][x]==0 and sum(grid[ny][nx]==0 for nx, ny in neighbors4(x,y)) >= 3
     )
 
+_tile_sheet = None
+
+def load_tile_sheet():
+    """Path (0) and grass (1) tiles stacked into one RGBA array; read from disk once per run"""
+    global _tile_sheet
+    if _tile_sheet is None:
+        grass = Image.open(GRASS_TILE_PATH).convert("RGBA")
+        path_tile = Image.open(PATH_TILE_PATH).convert("RGBA")
+        if path_tile.size != grass.size:
+            path_tile = path_tile.resize(grass.size)
+        _tile_sheet = np.stack([np.asarray(path_tile), np.asarray(grass)])
+    return _tile_sheet
+
+def compose_tiles(grid, tiles):
+    """Image of grid with tiles[value] in every cell, gathered in one NumPy step instead of a paste per tile"""
+    cells = np.asarray(grid, dtype=np.intp)
+    rows, cols = cells.shape
+    _, th, tw, channels = tiles.shape
+    return tiles[cells].transpose(0, 2, 1, 3, 4).reshape(rows * th, cols * tw, channels)
+
 def save_grid_image_tiles(grid, path):
     """Save grid as image using tile graphics"""
     try:
-        grass = Image.open(GRASS_TILE_PATH).convert("RGBA")
-        path_tile = Image.open(PATH_TILE_PATH).convert("RGBA")
+        tiles = load_tile_sheet()
     except FileNotFoundError as e:
         print("Tile image not found:", e)
         print("Fallback to grayscale preview.")
         return save_grid_image_fallback(grid, path)
 
-    tw, th = grass.size
-    out = Image.new("RGBA", (WIDTH*tw, HEIGHT*th))
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            tile = path_tile if grid[y][x]==0 else grass
-            out.paste(tile, (x*tw, y*th))
-    out.save(path)
+    Image.fromarray(compose_tiles(grid, tiles)).save(path)
 
 def save_grid_image_fallback(grid, path):
     """Fallback method to save grid as grayscale image"""
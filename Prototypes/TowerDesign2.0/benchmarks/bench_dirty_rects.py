@@ -0,0 +1,120 @@
+"""
+Benchmark: CPU time per frame of the play screen, full redraw vs dirty rects.
+
+For each shipped level this places towers along the path, simulates a few
+seconds of play, then renders the same frames both ways using the draw order
+of Game.run_game_loop. Runs headless by default (SDL_VIDEODRIVER=dummy).
+
+    python benchmarks/bench_dirty_rects.py --frames 300 --size 1920x1080
+"""
+import argparse
+import time
+
+from common import *
+from game import Game
+from renderer import DirtyRectRenderer, DrawList, LAYER_BULLETS
+
+
+def render_frame(game, scene, screen, renderer, draw_list, redraw_ui, elapsed):
+    """Draw one play-screen frame; renderer=None means a full redraw and flip"""
+    screen_size = screen.get_size()
+    level = scene.level
+
+    if renderer is not None:
+        full_frame = renderer.begin_frame(screen, scene.game_map)
+        play_clip = pygame.Rect(0, UI_HEIGHT, screen_size[0], screen_size[1] - UI_HEIGHT)
+        under_hud_rects = [tower.rect.clip(play_clip) for tower in scene.towers]
+        under_hud_rects += [bullet.rect.clip(play_clip) for bullet in scene.bullets]
+
+        hud_rects = game.get_hud_rects(screen_size)
+        if full_frame or redraw_ui:
+            hud_clip = None
+            redraw_hud = True
+        else:
+            hud_clip = renderer.damaged_region(hud_rects, under_hud_rects)
+            redraw_hud = hud_clip is not None
+        if redraw_hud and not full_frame:
+            renderer.restore(screen, hud_rects if hud_clip is None else [hud_clip])
+        screen.set_clip(play_clip)
+    else:
+        screen.fill(BG_COLOUR)
+        scene.game_map.draw_tiles(screen)
+        redraw_hud = True
+        hud_clip = None
+
+    marker_rects = scene.game_map.draw_markers(screen)
+    for tower in scene.towers:
+        tower.queue_draw(draw_list, screen_size)
+    for bullet in scene.bullets:
+        draw_list.add(LAYER_BULLETS, bullet.image, bullet.rect)
+    draw_list.flush(screen)
+    screen.set_clip(None)
+
+    if redraw_hud:
+        screen.set_clip(hud_clip)
+        game.draw_enhanced_toolbar(screen, screen_size, None, None, 100, level.base_hp, level.name, level)
+        game.draw_wave_panel_with_timing(screen, screen_size, level, elapsed)
+        screen.set_clip(None)
+
+    level.queue_draw(draw_list)
+    draw_list.flush(screen)
+    effect_rects = effect_system.draw(screen)
+
+    if renderer is not None:
+        renderer.mark(rect.clip(play_clip) for rect in marker_rects)
+        renderer.mark(tower.rect.clip(play_clip) for tower in scene.towers)
+        renderer.mark(bullet.rect.clip(play_clip) for bullet in scene.bullets)
+        renderer.mark(enemy.rect.inflate(0, 14) for enemy in level.enemies)
+        renderer.mark(effect_rects)
+        renderer.end_frame(screen)
+    else:
+        pygame.display.flip()
+
+
+def run_mode(level_file, size, frames, use_dirty_rects, ui_interval=6):
+    """Average CPU milliseconds per frame (simulation excluded) and dirty share"""
+    screen = set_window_size(size)
+    game = Game()
+    scene = Scene(level_file)
+    scene.warm_up(8.0)
+
+    renderer = DirtyRectRenderer() if use_dirty_rects else None
+    draw_list = DrawList()
+    dt = 1 / 60
+    draw_cpu = 0.0
+    dirty_area = 0
+    for frame in range(frames):
+        scene.step(dt)
+
+        start = time.process_time()
+        render_frame(game, scene, screen, renderer, draw_list, frame % ui_interval == 0, frame * dt)
+        draw_cpu += time.process_time() - start
+
+        if renderer is not None:
+            dirty_area += renderer.last_dirty_area
+
+    dirty_share = dirty_area / (frames * size[0] * size[1]) if renderer is not None else 1.0
+    return draw_cpu * 1000 / frames, dirty_share
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--size", type=parse_size, default=(1920, 1080))
+    args = parser.parse_args()
+
+    results = []
+    for level_file in shipped_levels():
+        full_ms, _ = run_mode(level_file, args.size, args.frames, use_dirty_rects=False)
+        dirty_ms, dirty_share = run_mode(level_file, args.size, args.frames, use_dirty_rects=True)
+        results.append((level_file.stem, full_ms, dirty_ms, dirty_share))
+
+    print()
+    print(f"Play screen render time at {args.size[0]}x{args.size[1]}, {args.frames} frames per level (CPU ms/frame)")
+    print(f"{'Level':<14}{'Full':>10}{'Dirty':>10}{'Speed-up':>10}{'Redrawn':>10}")
+    for name, full_ms, dirty_ms, dirty_share in results:
+        print(f"{name:<14}{full_ms:>10.2f}{dirty_ms:>10.2f}{full_ms / dirty_ms:>9.1f}x{dirty_share:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: drawing many entities one by one vs through a batched DrawList.
+
+Spreads N enemies (1,000 by default) along the path of a shipped level with
+towers and bullets in flight, then times the entity part of a play-screen
+frame both ways: the per-entity draw() calls used before, and the DrawList
+that queues sprites, health bars and hit flashes and submits them with
+Surface.blits. Runs headless by default (SDL_VIDEODRIVER=dummy).
+
+    python benchmarks/bench_entities.py --enemies 1000 --frames 200 --size 1920x1080
+"""
+import argparse
+import time
+
+from common import *
+from renderer import DrawList, LAYER_BULLETS
+
+
+def draw_individually(scene, screen):
+    for tower in scene.towers:
+        tower.draw(screen)
+    scene.bullets.draw(screen)
+    scene.level.draw(screen)
+
+
+def draw_batched(scene, screen, draw_list):
+    screen_size = screen.get_size()
+    for tower in scene.towers:
+        tower.queue_draw(draw_list, screen_size)
+    for bullet in scene.bullets:
+        draw_list.add(LAYER_BULLETS, bullet.image, bullet.rect)
+    draw_list.flush(screen)
+    scene.level.queue_draw(draw_list)
+    draw_list.flush(screen)
+
+
+def time_frames(draw, scene, screen, frames):
+    """Median CPU milliseconds per frame for the entity draw pass"""
+    samples = []
+    for _ in range(frames):
+        scene.game_map.draw_tiles(screen)
+        start = time.process_time()
+        draw()
+        samples.append(time.process_time() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--enemies", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--size", type=parse_size, default=(1920, 1080))
+    args = parser.parse_args()
+
+    screen = set_window_size(args.size)
+    scene = Scene(shipped_levels()[0], tower_count=40)
+    scene.warm_up(4.0)
+    spread_enemies(scene, args.enemies)
+
+    draw_list = DrawList()
+    individual_ms = time_frames(lambda: draw_individually(scene, screen), scene, screen, args.frames)
+    batched_ms = time_frames(lambda: draw_batched(scene, screen, draw_list), scene, screen, args.frames)
+
+    print()
+    print(f"Entity draw pass at {args.size[0]}x{args.size[1]}: {len(scene.level.enemies)} enemies, "
+          f"{len(scene.towers)} towers, {len(scene.bullets)} bullets (median CPU ms/frame)")
+    print(f"{'One by one':<14}{individual_ms:>10.2f}")
+    print(f"{'DrawList':<14}{batched_ms:>10.2f}{individual_ms / batched_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark: play-screen render time per frame on canned stress scenes.
+
+Builds synthetic scenes on a shipped level - N enemies spread along the
+path, M towers beside it, K bullets in flight and floating text effects -
+at several window sizes up to 3840x2160, then renders the same frame
+repeatedly and times MapComponent.draw, the entity pass (towers, bullets,
+enemies, effects) and the HUD separately. Nothing is simulated between
+frames, so runs are repeatable. Runs headless by default
+(SDL_VIDEODRIVER=dummy).
+
+    python benchmarks/bench_render.py --scene busy --sizes 1920x1080,3840x2160 --frames 200
+"""
+import argparse
+import time
+
+from common import *
+from game import Game
+from renderer import DrawList, LAYER_BULLETS
+
+
+# Scene name -> enemies, towers, bullets, effects
+SCENES = {
+    'quiet': (20, 12, 10, 10),
+    'busy': (200, 40, 100, 100),
+    'stress': (1000, 80, 500, EFFECT_CAP),
+}
+DEFAULT_SIZES = "1280x720,1920x1080,3840x2160"
+PHASES = ("MapComponent.draw", "Entities", "HUD", "Total")
+
+
+def add_bullets(scene, count, seed=2):
+    """Put count bullets somewhere between a tower and an enemy, at random angles"""
+    rng = random.Random(seed)
+    towers = list(scene.towers)
+    enemies = list(scene.level.enemies)
+    if not towers or not enemies:
+        return
+    for _ in range(count):
+        tower = rng.choice(towers)
+        target = rng.choice(enemies)
+        start = pygame.Vector2(tower.rect.center).lerp(target.rect.center, rng.random())
+        bullet = BulletFactory.create_bullet(tower.name, start, target, tower.damage, scene.level.enemies)
+        if bullet is None:
+            continue
+        bullet.image = rng.choice(bullet.frames)
+        scene.bullets.add(bullet)
+
+
+def add_effects(scene, count, seed=3, batches=10):
+    """Spawn count floating texts on enemies, aged in batches so they fade at different levels"""
+    rng = random.Random(seed)
+    enemies = list(scene.level.enemies)
+    if not enemies:
+        return
+    kinds = list(effect_system.kind_index)
+    per_batch = max(1, count // batches)
+    for i in range(count):
+        effect_system.spawn(kinds[i % len(kinds)], rng.choice(enemies).rect.center)
+        if i % per_batch == per_batch - 1:
+            effect_system.update(0.04)
+
+
+def build_scene(level_file, enemies, towers, bullets, effects):
+    scene = Scene(level_file, tower_count=towers)
+    spread_enemies(scene, enemies)
+    add_bullets(scene, bullets)
+    add_effects(scene, effects)
+    return scene
+
+
+def render_frame(game, scene, screen, draw_list, elapsed):
+    """Draw one full play-screen frame; returns the time spent in each phase in ms"""
+    screen_size = screen.get_size()
+    level = scene.level
+
+    start = time.perf_counter()
+    screen.fill(BG_COLOUR)
+    scene.game_map.draw(screen)
+    map_done = time.perf_counter()
+
+    for tower in scene.towers:
+        tower.queue_draw(draw_list, screen_size)
+    for bullet in scene.bullets:
+        draw_list.add(LAYER_BULLETS, bullet.image, bullet.rect)
+    draw_list.flush(screen)
+    level.queue_draw(draw_list)
+    draw_list.flush(screen)
+    effect_system.draw(screen)
+    entities_done = time.perf_counter()
+
+    game.draw_enhanced_toolbar(screen, screen_size, None, None, 100, level.base_hp, level.name, level)
+    game.draw_wave_panel_with_timing(screen, screen_size, level, elapsed)
+    hud_done = time.perf_counter()
+
+    return ((map_done - start) * 1000, (entities_done - map_done) * 1000,
+            (hud_done - entities_done) * 1000, (hud_done - start) * 1000)
+
+
+def run_scene(game, level_file, size, counts, frames, warm_up_frames=10):
+    """Per-phase frame times in ms, plus the entity counts actually placed"""
+    screen = set_window_size(size)
+    scene = build_scene(level_file, *counts)
+
+    draw_list = DrawList()
+    dt = 1 / 60
+    samples = [[] for _ in PHASES]
+    for frame in range(warm_up_frames + frames):
+        # Only the map's home/spawn animations advance - everything else stays put
+        scene.game_map.update(dt, scene.level.enemies)
+        phase_ms = render_frame(game, scene, screen, draw_list, frame * dt)
+        pygame.display.flip()
+        if frame >= warm_up_frames:
+            for phase_samples, ms in zip(samples, phase_ms):
+                phase_samples.append(ms)
+
+    placed = (len(scene.level.enemies), len(scene.towers), len(scene.bullets), effect_system.get_stats()['active'])
+    return samples, placed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scene", choices=list(SCENES) + ["all"], default="all")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma separated, e.g. 1920x1080,3840x2160")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--level", type=int, default=0, help="index into the shipped levels")
+    parser.add_argument("--enemies", type=int, help="override the scene's enemy count")
+    parser.add_argument("--towers", type=int, help="override the scene's tower count")
+    parser.add_argument("--bullets", type=int, help="override the scene's bullet count")
+    parser.add_argument("--effects", type=int, help="override the scene's effect count")
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    scene_names = list(SCENES) if args.scene == "all" else [args.scene]
+    level_file = shipped_levels()[args.level]
+    overrides = (args.enemies, args.towers, args.bullets, args.effects)
+
+    set_window_size(sizes[0])
+    game = Game()
+
+    for scene_name in scene_names:
+        counts = tuple(preset if override is None else override
+                       for preset, override in zip(SCENES[scene_name], overrides))
+        for size in sizes:
+            samples, placed = run_scene(game, level_file, size, counts, args.frames)
+
+            print()
+            print(f"Scene '{scene_name}' on {level_file.stem} at {size[0]}x{size[1]}: {placed[0]} enemies, "
+                  f"{placed[1]} towers, {placed[2]} bullets, {placed[3]} effects (ms/frame, {args.frames} frames)")
+            print(f"{'Phase':<20}{'Median':>10}{'p95':>10}{'p99':>10}")
+            for phase, phase_samples in zip(PHASES, samples):
+                median, p95, p99 = percentiles(phase_samples)
+                print(f"{phase:<20}{median:>10.2f}{p95:>10.2f}{p99:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
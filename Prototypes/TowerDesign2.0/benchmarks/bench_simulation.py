@@ -0,0 +1,152 @@
+"""
+Benchmark: simulation ticks per second on the stress scenarios in scenarios/.
+
+Each scenario JSON names a shipped level, a tower mix placed beside the
+path, enemies already on the path ("prespawn") and a single wave spawned by
+Level.update, then runs a fixed number of 1/60 s ticks with nothing drawn.
+The scenarios cover long waves, swarms of 2,000 and 10,000 enemies,
+Wiregeist-heavy waves (aura checks against every other enemy) and Volt Cow
+swarms (chain lightning searches). Reports ticks/second, median and p99
+tick time and peak memory. With more than one scenario each runs in its
+own process so peak memory is per scenario. Runs headless by default
+(SDL_VIDEODRIVER=dummy).
+
+    python benchmarks/bench_simulation.py                      # every scenario
+    python benchmarks/bench_simulation.py wiregeist_heavy --ticks 60
+"""
+import argparse
+import json
+import subprocess
+import time
+
+from common import *
+
+try:
+    import resource
+except ImportError:  # Not available on Windows - fall back to tracemalloc
+    resource = None
+import tracemalloc
+
+
+SCENARIO_DIR = BENCH_DIR / "scenarios"
+
+
+def find_scenario(name):
+    """Path of a scenario given its name or a path to its JSON file"""
+    path = Path(name)
+    if path.suffix == ".json" and path.exists():
+        return path
+    return SCENARIO_DIR / f"{name}.json"
+
+
+def build_scenario(scenario, seed=1):
+    """Scene with the scenario's towers, enemies on the path and wave queued up"""
+    rng = random.Random(seed)
+    tower_types = {tower_type['name']: tower_type for tower_type in TOWER_TYPES}
+    placement = [tower_types[name] for name, count in scenario.get("tower_mix", {}).items() for _ in range(count)]
+
+    scene = Scene(LEVELS_DIR / scenario["level"], tower_count=0, seed=seed)
+    if placement:
+        scene.place_towers(len(placement), placement)
+
+    wave = scenario.get("wave", {})
+    composition = wave.get("composition") or {name: 1 for name in ENEMY_TYPES}
+    enemy_types, weights = zip(*composition.items())
+
+    prespawn = scenario.get("prespawn", 0)
+    if prespawn:
+        spread_enemies(scene, prespawn, seed, rng.choices(enemy_types, weights, k=prespawn))
+
+    # One wave replacing the level's own, so the run never reaches a wave break
+    level = scene.level
+    level.total_waves = 1
+    level.enemies_in_wave = wave.get("enemies", 0)
+    level.delay = wave.get("spawn_delay", level.delay)
+    level.current_enemy_queue = rng.choices(enemy_types, weights, k=level.enemies_in_wave)
+    level.enemy_spawn_index = 0
+    return scene
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process in MB, or None without the resource module"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_scenario(scenario, ticks, size):
+    """Tick times in ms plus the peak enemies, bullets and memory seen"""
+    set_window_size(size)
+    if resource is None:
+        tracemalloc.start()
+
+    scene = build_scenario(scenario)
+    dt = 1 / 60
+    tick_ms = []
+    peak_enemies = peak_bullets = 0
+    for _ in range(ticks):
+        start = time.perf_counter()
+        scene.step(dt)
+        tick_ms.append((time.perf_counter() - start) * 1000)
+        peak_enemies = max(peak_enemies, len(scene.level.enemies))
+        peak_bullets = max(peak_bullets, len(scene.bullets))
+
+    if resource is None:
+        memory_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    else:
+        memory_mb = peak_memory_mb()
+    return tick_ms, peak_enemies, peak_bullets, memory_mb
+
+
+def print_header():
+    print(f"{'Scenario':<18}{'Ticks':>7}{'Ticks/s':>10}{'Median':>9}{'p99':>9}{'Enemies':>9}{'Bullets':>9}{'Peak MB':>9}")
+
+
+def print_result(name, tick_ms, peak_enemies, peak_bullets, memory_mb):
+    median, p99 = percentiles(tick_ms, (50, 99))
+    ticks_per_second = len(tick_ms) / (sum(tick_ms) / 1000)
+    memory = f"{memory_mb:.0f}" if memory_mb is not None else "-"
+    print(f"{name:<18}{len(tick_ms):>7}{ticks_per_second:>10.1f}{median:>9.2f}{p99:>9.2f}"
+          f"{peak_enemies:>9}{peak_bullets:>9}{memory:>9}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help="scenario names or JSON paths (default: all in scenarios/)")
+    parser.add_argument("--ticks", type=int, help="override each scenario's tick count")
+    parser.add_argument("--size", type=parse_size, default=(1280, 720))
+    parser.add_argument("--no-header", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    scenario_files = [find_scenario(name) for name in args.scenarios] or sorted(SCENARIO_DIR.glob("*.json"))
+
+    if not args.no_header:
+        print()
+        print("Simulation ticks (ms per tick, peak memory of each run)")
+        print_header()
+
+    if len(scenario_files) > 1:
+        # A fresh process per scenario keeps peak memory from carrying over
+        for scenario_file in scenario_files:
+            command = [sys.executable, __file__, str(scenario_file), "--no-header",
+                       "--size", f"{args.size[0]}x{args.size[1]}"]
+            if args.ticks:
+                command += ["--ticks", str(args.ticks)]
+            # Only keep the result row - pygame prints its banner on import
+            result = subprocess.run(command, stdout=subprocess.PIPE, text=True, check=False)
+            output = result.stdout.strip().splitlines()
+            print(output[-1] if output else f"{scenario_file.stem:<18}failed (exit code {result.returncode})",
+                  flush=True)
+        return
+
+    with open(scenario_files[0], 'r', encoding='utf-8') as f:
+        scenario = json.load(f)
+    ticks = args.ticks or scenario.get("ticks", 600)
+    print_result(scenario.get("name", scenario_files[0].stem), *run_scenario(scenario, ticks, args.size))
+
+
+if __name__ == "__main__":
+    main()
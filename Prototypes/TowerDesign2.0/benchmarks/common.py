@@ -0,0 +1,136 @@
+"""
+Shared helpers for the headless benchmarks - builds a play scene on a shipped
+level without opening a real window.
+"""
+import os
+import sys
+import random
+import logging
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+LEVELS_DIR = BENCH_DIR.parent / "levels"
+
+# Run without a window or sound card unless the caller asked for a real driver
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(SRC_DIR))
+
+import pygame
+from settings import *
+from level import Level
+from map_component import MapComponent
+from tower import TowerFactory
+from bullet import BulletFactory
+from effects import effect_system
+from enemy import EnemyFactory, ENEMY_TYPES
+from game_logging import ROOT_LOGGER
+from level_format import load_level
+
+# Keep the game's wave and level messages out of the results
+logging.getLogger(ROOT_LOGGER).setLevel(logging.WARNING)
+
+
+def parse_size(text):
+    """Parse a window size like '1920x1080'"""
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def set_window_size(size):
+    """(Re)create the display surface at the given size"""
+    return pygame.display.set_mode(size, pygame.RESIZABLE | pygame.DOUBLEBUF)
+
+
+def percentiles(samples, points=(50, 95, 99)):
+    """Nearest-rank percentiles of a list of timings"""
+    ordered = sorted(samples)
+    return [ordered[min(len(ordered) - 1, len(ordered) * point // 100)] for point in points]
+
+
+def shipped_levels():
+    """Paths of the level files that ship with the game"""
+    return sorted(LEVELS_DIR.glob("Level*.json"))
+
+
+class Scene:
+    """A level with towers placed along the path, stepped with a fixed timestep"""
+
+    def __init__(self, level_file, tower_count=12, seed=1):
+        random.seed(seed)
+        level_data = load_level(level_file)
+
+        # Same setup as Game.run_game_loop
+        self.level = Level()
+        self.level.name = level_data.get('name', Path(level_file).stem)
+        self.level.grid = level_data['grid']
+        self.level.load_settings(level_data)
+        self.level.recalculate_path()
+        self.level.start_first_wave()
+        self.level.preparation_time = 0.0
+
+        self.game_map = MapComponent(grid=self.level.grid)
+        self.game_map.set_spawn_and_home(self.level.start, self.level.end)
+        BulletFactory.preload_sprites()
+        BulletFactory.reset()
+        effect_system.clear()
+
+        self.towers = pygame.sprite.Group()
+        self.bullets = pygame.sprite.Group()
+        self.place_towers(tower_count)
+
+    def place_towers(self, count, tower_types=TOWER_TYPES):
+        """Place towers on grass cells next to the path, cycling through tower_types"""
+        grid = self.level.grid
+        placed = 0
+        for gy in range(GRID_H):
+            for gx in range(GRID_W):
+                if placed >= count:
+                    return
+                if grid[gy][gx] != 1:
+                    continue
+                next_to_path = any(grid[y][x] == 0
+                                   for y in range(max(0, gy - 1), min(GRID_H, gy + 2))
+                                   for x in range(max(0, gx - 1), min(GRID_W, gx + 2)))
+                if next_to_path:
+                    self.towers.add(TowerFactory.create_tower(tower_types[placed % len(tower_types)], gx, gy))
+                    placed += 1
+
+    def step(self, dt):
+        """Advance the simulation by one frame, in the same order as the game loop"""
+        self.game_map.update(dt, self.level.enemies)
+        self.level.update(dt)
+        self.bullets.update(dt)
+        BulletFactory.update(dt)
+        effect_system.update(dt)
+        self.towers.update(dt, self.level.enemies, self.bullets)
+
+        # Enemies that reach home are removed instead of ending the run
+        for enemy in list(self.level.enemies):
+            if enemy.path_index >= len(enemy.path) - 1:
+                enemy.kill()
+
+    def warm_up(self, seconds, dt=1 / 60):
+        """Simulate until enemies, bullets and effects are on screen"""
+        for _ in range(int(seconds / dt)):
+            self.step(dt)
+
+
+def spread_enemies(scene, count, seed=1, enemy_types=None):
+    """Add count enemies at random points along the path, some of them flashing
+
+    Enemy types cycle through enemy_types, every type by default.
+    """
+    rng = random.Random(seed)
+    enemy_types = list(enemy_types or ENEMY_TYPES)
+    level = scene.level
+    for i in range(count):
+        enemy_type = enemy_types[i % len(enemy_types)]
+        enemy = EnemyFactory.create_enemy(enemy_type, level.path)
+        enemy.step = rng.randrange(max(1, len(level.path) - 1))
+        enemy.progress = rng.random()
+        enemy.health = rng.randint(1, enemy.max_health)
+        enemy.hit_flash = 0.1 if rng.random() < 0.1 else 0.0
+        enemy._update_position_and_size()
+        level.enemies.add(enemy)
@@ -0,0 +1,153 @@
+"""Images and sounds decoded ahead of use by worker threads, as listed per scene in assets/preload.json"""
+
+import glob
+import json
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from settings import *
+from resource_manager import ResourceManager
+from sprite_variants import to_display_format
+from game_logging import get_logger
+
+logger = get_logger('assets')
+
+
+IMAGE_TYPES = ('.png', '.jpg', '.jpeg', '.bmp')
+SOUND_TYPES = ('.ogg', '.wav')
+
+
+def _key(path):
+    return os.path.normcase(os.path.abspath(str(path)))
+
+
+class AssetCache:
+    """Decoded images and sounds shared by every user of an asset file
+
+    image() and sound() answer from memory once an asset is loaded and
+    otherwise load it on the spot. preload() decodes a scene's assets from
+    the manifest on a thread pool ahead of time; the decoded images still
+    have to be converted to the display format on the main thread, which
+    Preload.update() does a few at a time between frames. Surfaces are
+    shared - copy one before drawing onto it.
+    """
+
+    def __init__(self):
+        self._images = {}  # path key -> surface in the display format
+        self._sounds = {}  # path key -> pygame.mixer.Sound
+        self._manifest = None
+
+    def image(self, path):
+        """The image at path; raises pygame.error or FileNotFoundError like pygame.image.load"""
+        key = _key(path)
+        surface = self._images.get(key)
+        if surface is None:
+            logger.debug("Loading %s on first use", path)
+            surface = self._images[key] = to_display_format(pygame.image.load(str(path)))
+        return surface
+
+    def sound(self, path):
+        """The sound at path; raises pygame.error or FileNotFoundError like pygame.mixer.Sound"""
+        key = _key(path)
+        sound = self._sounds.get(key)
+        if sound is None:
+            logger.debug("Loading %s on first use", path)
+            sound = self._sounds[key] = pygame.mixer.Sound(str(path))
+        return sound
+
+    def manifest_paths(self, scene):
+        """Asset files listed for a scene; entries are paths or glob patterns under assets/"""
+        if self._manifest is None:
+            try:
+                with open(ResourceManager.get_asset_path(PRELOAD_MANIFEST), 'r', encoding='utf-8') as f:
+                    self._manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("Could not read preload manifest: %s", e)
+                self._manifest = {}
+
+        paths = []
+        for pattern in self._manifest.get(scene, []):
+            matches = sorted(glob.glob(str(ResourceManager.get_asset_path(pattern))))
+            if not matches:
+                logger.warning("Preload manifest entry matches no files: %s", pattern)
+            paths.extend(matches)
+        return paths
+
+    def preload(self, scene):
+        """Start decoding the scene's assets that are not loaded yet"""
+        paths = []
+        for path in self.manifest_paths(scene):
+            key = _key(path)
+            if path.lower().endswith(IMAGE_TYPES) and key not in self._images:
+                paths.append(path)
+            elif path.lower().endswith(SOUND_TYPES) and key not in self._sounds and pygame.mixer.get_init():
+                paths.append(path)
+        return Preload(self, dict.fromkeys(paths))  # Drop files listed twice
+
+
+class Preload:
+    """Assets being decoded for one scene; call update() every frame until done"""
+
+    def __init__(self, cache, paths):
+        self.cache = cache
+        self.total = len(paths)
+        self.loaded = 0
+        self.failed = 0
+        self._decoded = queue.SimpleQueue()
+        self._executor = None
+        if paths:
+            self._executor = ThreadPoolExecutor(PRELOAD_WORKERS, thread_name_prefix="preload")
+            for path in paths:
+                self._executor.submit(self._decode, path)
+            self._executor.shutdown(wait=False)
+
+    @property
+    def done(self):
+        return self.loaded + self.failed >= self.total
+
+    @property
+    def progress(self):
+        return 1.0 if not self.total else (self.loaded + self.failed) / self.total
+
+    def update(self, budget_ms=PRELOAD_FRAME_BUDGET_MS):
+        """Main thread: store what the workers decoded, converting images, for up to budget_ms"""
+        deadline = time.perf_counter() + budget_ms / 1000
+        while not self.done and time.perf_counter() < deadline:
+            try:
+                path, asset, error = self._decoded.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                break
+            if error is not None:
+                # Left unloaded - first use tries again and reports the error where it happens
+                logger.warning("Could not preload %s: %s", path, error)
+                self.failed += 1
+            elif isinstance(asset, pygame.Surface):
+                self.cache._images[_key(path)] = to_display_format(asset)
+                self.loaded += 1
+            else:
+                self.cache._sounds[_key(path)] = asset
+                self.loaded += 1
+        return self.done
+
+    def finish(self):
+        """Wait for every asset, e.g. when there is nothing to draw meanwhile"""
+        while not self.update():
+            pass
+
+    def _decode(self, path):
+        """Worker thread: read and decode one file"""
+        try:
+            if path.lower().endswith(IMAGE_TYPES):
+                asset = pygame.image.load(path)
+            else:
+                asset = pygame.mixer.Sound(path)
+            self._decoded.put((path, asset, None))
+        except (pygame.error, OSError) as e:
+            self._decoded.put((path, None, e))
+
+
+assets = AssetCache()
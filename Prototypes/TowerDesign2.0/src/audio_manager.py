@@ -6,6 +6,11 @@ import os
 from pathlib import Path
 from typing import Optional
 from resource_manager import get_music_path, ResourceManager
+from metrics import metrics
+from assets import assets
+from game_logging import get_logger
+
+logger = get_logger('audio')
 
 class AudioManager:
     """Audio manager - handles background music and sound effects"""
@@ -47,25 +52,27 @@ class AudioManager:
         self.sound_enabled = True
         
 
+        # Decoded by the startup preload (see assets.py) and picked up on the first play_sound()
         self.sounds = {}
-        self._load_sounds()
+        self.sounds_loaded = False
         self.in_battle = False
         
         pygame.mixer.music.set_volume(self.music_volume)
         
     def _load_sounds(self):
         """Load all sound effects"""
+        self.sounds_loaded = True
         for sound_name, filename in self.sound_files.items():
             sound_path = self.music_dir / filename
             try:
                 if sound_path.exists():
-                    self.sounds[sound_name] = pygame.mixer.Sound(str(sound_path))
+                    self.sounds[sound_name] = assets.sound(sound_path)
                     self.sounds[sound_name].set_volume(self.effect_volume)
-                    print(f"Loaded sound: {sound_name}")
+                    logger.debug("Loaded sound: %s", sound_name)
                 else:
-                    print(f"Sound file not found: {sound_path}")
+                    logger.warning("Sound file not found: %s", sound_path)
             except pygame.error as e:
-                print(f"Failed to load sound {sound_name}: {e}")
+                logger.error("Failed to load sound %s: %s", sound_name, e)
     
     def play_music(self, music_key: str, loops: int = -1, fade_in_ms: int = 1000):
         """Play background music"""
@@ -73,13 +80,13 @@ class AudioManager:
             return
             
         if music_key not in self.music_files:
-            print(f"Unknown music key: {music_key}")
+            logger.warning("Unknown music key: %s", music_key)
             return
             
         music_path = self.music_dir / self.music_files[music_key]
         
         if not music_path.exists():
-            print(f"Music file not found: {music_path}")
+            logger.warning("Music file not found: %s", music_path)
             return
             
         try:
@@ -96,10 +103,10 @@ class AudioManager:
                 pygame.mixer.music.play(loops)
                 
             self.current_music = music_key
-            print(f"Playing music: {music_key}")
+            logger.info("Playing music: %s", music_key)
             
         except pygame.error as e:
-            print(f"Failed to play music {music_key}: {e}")
+            logger.error("Failed to play music %s: %s", music_key, e)
     
     def stop_music(self, fade_out_ms: int = 1000):
         if pygame.mixer.music.get_busy():
@@ -119,16 +126,20 @@ class AudioManager:
     def play_sound(self, sound_key: str):
         if not self.sound_enabled:
             return
+        
+        if not self.sounds_loaded:
+            self._load_sounds()
             
         if sound_key not in self.sounds:
-            print(f"Unknown sound key: {sound_key}")
+            logger.warning("Unknown sound key: %s", sound_key)
             return
             
         try:
             self.sounds[sound_key].play()
-            print(f"Playing sound: {sound_key}")
+            metrics.count('sounds.played')
+            logger.debug("Playing sound: %s", sound_key)
         except pygame.error as e:
-            print(f"Failed to play sound {sound_key}: {e}")
+            logger.error("Failed to play sound %s: %s", sound_key, e)
     
     def set_music_volume(self, volume: float):
         self.music_volume = max(0.0, min(1.0, volume))
@@ -156,10 +167,10 @@ class AudioManager:
 
         # If the battle state changed, play appropriate music
         if self.in_battle and not was_in_battle:
-            print(f"Entering battle! Enemy count: {count}")
+            logger.debug("Entering battle! Enemy count: %d", count)
             self.play_music('battle', fade_in_ms=500)
         elif not self.in_battle and was_in_battle:
-            print(f"Leaving battle! Enemy count: {count}")
+            logger.debug("Leaving battle! Enemy count: %d", count)
             self.play_music('game', fade_in_ms=500)
     
     def play_menu_music(self):
@@ -201,8 +212,8 @@ class AudioManager:
     
     def stop_all_audio(self):
         pygame.mixer.music.stop()
-        print("Stopped all music")
+        logger.debug("Stopped all music")
         pygame.mixer.stop()
-        print("Stopped all sounds")
+        logger.debug("Stopped all sounds")
 
 audio_manager = AudioManager() 
\ No newline at end of file
@@ -2,25 +2,33 @@
 AI assisted code included in this file, you can see the comments below for details.
 """
 import pygame
-import math
+import heapq
+import itertools
 from abc import ABC, abstractmethod
 from settings import *
 from audio_manager import audio_manager
+from effects import effect_system
+from metrics import metrics
 from resource_manager import get_bullet_path
+from assets import assets
 
 
 class DamageEffect(ABC):
-    """Abstract base class for damage effects"""
+    """Abstract base class for damage effects
+
+    Effects are stateless and shared by every bullet of a strategy, so anything
+    situational (like the enemies group) is passed in per call.
+    """
     
     @abstractmethod
-    def apply(self, enemy, damage, position):
+    def apply(self, enemy, damage, position, enemies_group=None):
         pass
 
 
 class NormalDamageEffect(DamageEffect):
     """Normal damage with no special effects"""
     
-    def apply(self, enemy, damage, position):
+    def apply(self, enemy, damage, position, enemies_group=None):
         if hasattr(enemy, 'hit') and callable(enemy.hit):
             return enemy.hit(damage)
         return True
@@ -29,7 +37,7 @@ class NormalDamageEffect(DamageEffect):
 class BurnDamageEffect(DamageEffect):
     """Burn damage that applies damage over time"""
     
-    def apply(self, enemy, damage, position):
+    def apply(self, enemy, damage, position, enemies_group=None):
         result = True
         if hasattr(enemy, 'hit') and callable(enemy.hit):
             result = enemy.hit(damage)
@@ -42,8 +50,8 @@ class BurnDamageEffect(DamageEffect):
     def _add_burn_effect(self, enemy):
         if not hasattr(enemy, 'burn_effects'):
             enemy.burn_effects = []
-        burn_effect = BurnEffect(enemy.rect.center)
-        enemy.burn_effects.append(burn_effect)
+        enemy.burn_effects.append(BurnEffect())
+        effect_system.spawn('burn', enemy.rect.center)
         audio_manager.play_flame_sound()
 
 
@@ -51,49 +59,36 @@ class ElectricDamageEffect(DamageEffect):
     """Electric damage that affects nearby enemies"""
     """This class is fixed by ChatGPT-o4-mini-high, the code is directly copied from the generated code"""
     
-    def __init__(self, aoe_range=40):
-        self.aoe_range = aoe_range
-        self.enemies_group = None
-    
-    def set_enemies_group(self, enemies_group):
-        """Set the enemies group for chain damage"""
-        self.enemies_group = enemies_group
+    def __init__(self, aoe_range=20):
+        self.aoe_range = aoe_range  # World units around the hit position
     
-    def apply(self, enemy, damage, position):
+    def apply(self, enemy, damage, position, enemies_group=None):
         result = True
         if hasattr(enemy, 'hit') and callable(enemy.hit):
             result = enemy.hit(damage)
 
         if result is not False:  # If not dodged
             self._add_electric_effect(enemy)
-            if self.enemies_group:
-                self._apply_chain_damage(enemy, damage * 0.5, position)
+            if enemies_group:
+                self._apply_chain_damage(enemy, damage * 0.5, position, enemies_group)
         
         return result
     
     def _add_electric_effect(self, enemy):
-        if not hasattr(enemy, 'electric_effects'):
-            enemy.electric_effects = []
-        
-        electric_effect = ElectricEffect(enemy.rect.center)
-        enemy.electric_effects.append(electric_effect)
+        effect_system.spawn('zap', enemy.rect.center)
         
         # Play death (lightning) sound effect
         audio_manager.play_death_sound()
     
-    def _apply_chain_damage(self, primary_enemy, chain_damage, position):
+    def _apply_chain_damage(self, primary_enemy, chain_damage, position, enemies_group):
         """Apply chain damage to nearby enemies"""
-        if not self.enemies_group:
-            return
-            
-        # Find nearby enemies
-        for enemy in self.enemies_group:
+        # Find nearby enemies - position and ranges are in world units
+        for enemy in enemies_group:
             if (hasattr(enemy, 'enemy_type') and 
                 enemy != primary_enemy and 
-                hasattr(enemy, 'rect')):
+                hasattr(enemy, 'world_pos')):
                 
-                distance = math.sqrt((enemy.rect.centerx - position[0])**2 + 
-                                   (enemy.rect.centery - position[1])**2)
+                distance = enemy.world_pos.distance_to(position)
                 
                 if distance <= self.aoe_range:
                     # Apply chain damage
@@ -101,31 +96,23 @@ class ElectricDamageEffect(DamageEffect):
                         enemy.hit(chain_damage)
                     
                     # Add electric effect
-                    if not hasattr(enemy, 'electric_effects'):
-                        enemy.electric_effects = []
-                    
-                    electric_effect = ElectricEffect(enemy.rect.center)
-                    enemy.electric_effects.append(electric_effect)
+                    effect_system.spawn('zap', enemy.rect.center)
                     
                     # Play death sound for chain damage too
                     audio_manager.play_death_sound()
 
 
 class BurnEffect:
-    """This class is fixed by ChatGPT-o4-mini-high, the font size is increased to 32 for better visibility, no more code changes by ChatGPT"""
-    def __init__(self, pos):
-        self.pos = pos
+    """Damage over time left on an enemy by a fire hit - the "Fire" text is drawn by the effect system"""
+    """This class is fixed by ChatGPT-o4-mini-high, no more code changes by ChatGPT"""
+    def __init__(self):
         self.timer = 3.0
         self.damage_timer = 1.0
-        self.font = pygame.font.SysFont('Arial', 32, bold=True)  # 2x larger (16 -> 32)
-        self.text = self.font.render("Fire", True, (255, 0, 0))
-        self.offset_y = 0
         self.damage_per_tick = 5
     
     def update(self, dt, enemy):
         self.timer -= dt
         self.damage_timer -= dt
-        self.offset_y += 10 * dt
 
         if self.damage_timer <= 0:
             if hasattr(enemy, 'hit') and callable(enemy.hit):
@@ -133,50 +120,13 @@ class BurnEffect:
             self.damage_timer = 1.0
         
         return self.timer > 0
-    
-    def draw(self, screen):
-
-        if self.timer > 0:
-            alpha = min(255, int(self.timer * 85))  # Fade out over 3 seconds
-            text_surface = self.text.copy()
-            text_surface.set_alpha(alpha)
-            # Adjust position for larger text
-            text_rect = text_surface.get_rect()
-            pos = (self.pos[0] - text_rect.width//2, self.pos[1] - 30 - self.offset_y)
-            screen.blit(text_surface, pos)
-
-
-class ElectricEffect:
-    """Visual effect for electric attacks"""
-    """This class is fixed by ChatGPT-o4-mini-high, the font size is increased to 32 for better visibility, no more code changes by ChatGPT"""
-    def __init__(self, pos):
-        self.pos = pos
-        self.timer = 0.5  # Show for 0.5 seconds
-        self.font = pygame.font.SysFont('Arial', 32, bold=True)  # 2x larger (16 -> 32)
-        self.text = self.font.render("Zap", True, (255, 255, 0))
-        self.offset_y = 0
-    
-    def update(self, dt):
-        self.timer -= dt
-        self.offset_y += 30 * dt  # Float upward quickly
-        return self.timer > 0
-    
-    def draw(self, screen):
-        if self.timer > 0:
-            alpha = min(255, int(self.timer * 510))  # Fade out quickly
-            text_surface = self.text.copy()
-            text_surface.set_alpha(alpha)
-            # Adjust position for larger text
-            text_rect = text_surface.get_rect()
-            pos = (self.pos[0] - text_rect.width//2, self.pos[1] - 30 - self.offset_y)
-            screen.blit(text_surface, pos)
 
 
 class BulletStrategy(ABC):
     """Abstract strategy for bullet behavior"""
     
     @abstractmethod
-    def create_image(self, bullet_type):
+    def create_image(self, bullet_type, size=BULLET_SIZE):
         pass
     
     @abstractmethod
@@ -189,12 +139,13 @@ class NormalBulletStrategy(BulletStrategy):
     
     def __init__(self, bullet_image_path):
         self.bullet_image_path = bullet_image_path
+        self.damage_effect = NormalDamageEffect()  # Shared by every bullet of this strategy
     
-    def create_image(self, bullet_type):
+    def create_image(self, bullet_type, size=BULLET_SIZE):
         """Create normal bullet image"""
         try:
-            image = pygame.image.load(self.bullet_image_path)
-            image = pygame.transform.scale(image, (40, 40))
+            image = assets.image(self.bullet_image_path)
+            image = pygame.transform.scale(image, (size, size))
             return image
         except (pygame.error, FileNotFoundError):
             """This error handling is fixed by ChatGPT-o4-mini-high, the fallback image is now a simple colored circle"""
@@ -204,7 +155,7 @@ class NormalBulletStrategy(BulletStrategy):
             return image
     
     def get_damage_effect(self):
-        return NormalDamageEffect()
+        return self.damage_effect
 
 
 class FireBulletStrategy(BulletStrategy):
@@ -212,11 +163,12 @@ class FireBulletStrategy(BulletStrategy):
     
     def __init__(self, bullet_image_path):
         self.bullet_image_path = bullet_image_path
+        self.damage_effect = BurnDamageEffect()
     
-    def create_image(self, bullet_type):
+    def create_image(self, bullet_type, size=BULLET_SIZE):
         try:
-            image = pygame.image.load(self.bullet_image_path)
-            image = pygame.transform.scale(image, (40, 40))
+            image = assets.image(self.bullet_image_path)
+            image = pygame.transform.scale(image, (size, size))
             return image
         except (pygame.error, FileNotFoundError):
             """This error handling is fixed by ChatGPT-o4-mini-high, the fallback image is now a simple colored circle"""
@@ -226,7 +178,7 @@ class FireBulletStrategy(BulletStrategy):
             return image
     
     def get_damage_effect(self):
-        return BurnDamageEffect()
+        return self.damage_effect
 
 
 class ElectricBulletStrategy(BulletStrategy):
@@ -234,12 +186,13 @@ class ElectricBulletStrategy(BulletStrategy):
     
     def __init__(self, bullet_image_path):
         self.bullet_image_path = bullet_image_path
+        self.damage_effect = ElectricDamageEffect()
     
-    def create_image(self, bullet_type):
+    def create_image(self, bullet_type, size=BULLET_SIZE):
         try:
-            image = pygame.image.load(self.bullet_image_path)
+            image = assets.image(self.bullet_image_path)
             # Scale to appropriate size (2.5x larger)
-            image = pygame.transform.scale(image, (40, 40))
+            image = pygame.transform.scale(image, (size, size))
             return image
         except (pygame.error, FileNotFoundError):
             """This error handling is fixed by ChatGPT-o4-mini-high, the fallback image is now a simple colored circle"""
@@ -249,7 +202,141 @@ class ElectricBulletStrategy(BulletStrategy):
             return image
     
     def get_damage_effect(self):
-        return ElectricDamageEffect()
+        return self.damage_effect
+
+
+class BulletSpriteCache:
+    """Cache of pre-rotated bullet images, one table per bullet type and size"""
+    _tables = {}
+
+    @classmethod
+    def get_frames(cls, strategy, bullet_type, size=BULLET_SIZE, steps=BULLET_ROTATION_STEPS):
+        """Return the bullet image rotated into `steps` evenly spaced angles"""
+        cache_key = (bullet_type, size, steps)
+
+        if cache_key not in cls._tables:
+            base_image = strategy.create_image(bullet_type, size)
+            if pygame.display.get_surface():
+                base_image = base_image.convert_alpha()
+
+            step_angle = 360 / steps
+            cls._tables[cache_key] = [pygame.transform.rotate(base_image, i * step_angle)
+                                      for i in range(steps)]
+
+        return cls._tables[cache_key]
+
+    @classmethod
+    def clear(cls):
+        """Drop all tables, e.g. after the display format changed"""
+        cls._tables.clear()
+
+
+class BulletPool:
+    """Recycles Bullet sprites so firing a shot doesn't allocate a new object"""
+
+    def __init__(self):
+        self._free = []
+        self._active = set()
+        self.allocated = 0  # Bullets ever created by the pool
+        self.high_water = 0  # Most bullets in flight at the same time
+
+    @property
+    def in_use(self):
+        return len(self._active)
+
+    def acquire(self, start_pos, target, damage, strategy, bullet_type, enemies_group=None,
+                impact_point=None, flight_time=None):
+        """Get a ready-to-fly bullet, reusing a released one when possible"""
+        if self._free:
+            bullet = self._free.pop()
+            bullet.reset(start_pos, target, damage, strategy, bullet_type, enemies_group,
+                         impact_point, flight_time)
+        else:
+            bullet = Bullet(start_pos, target, damage, strategy, bullet_type, enemies_group,
+                            impact_point, flight_time)
+            bullet.pool = self
+            self.allocated += 1
+
+        self._active.add(bullet)
+        self.high_water = max(self.high_water, len(self._active))
+        return bullet
+
+    def release(self, bullet):
+        """Return a bullet to the pool (called from Bullet.kill)"""
+        if bullet not in self._active:
+            return
+        self._active.discard(bullet)
+        bullet.target = None
+        bullet.enemies_group = None
+        self._free.append(bullet)
+
+    def release_all(self):
+        """Reclaim every bullet still in flight, e.g. when a level ends"""
+        for bullet in list(self._active):
+            bullet.kill()
+
+    def get_stats(self):
+        """Pool statistics for profiling"""
+        return {
+            'allocated': self.allocated,
+            'in_use': self.in_use,
+            'free': len(self._free),
+            'high_water': self.high_water,
+        }
+
+
+def compute_intercept(start_pos, target, speed=BULLET_SPEED, iterations=4):
+    """Predict where a straight-line shot meets the target and how long it flies
+
+    start_pos and the returned aim point are world positions. Refines the aim point a few times against the target's predicted path
+    position; this converges quickly while the bullet outruns the target. A target at least as fast as the bullet may never
+    be caught, so the shot is aimed at where it is now.
+    """
+    start = pygame.Vector2(start_pos)
+    aim_point = pygame.Vector2(target.world_pos)
+    flight_time = start.distance_to(aim_point) / speed
+
+    if hasattr(target, 'predict_position') and getattr(target, 'speed', 0) < speed:
+        for _ in range(iterations):
+            aim_point = target.predict_position(flight_time)
+            flight_time = start.distance_to(aim_point) / speed
+
+    return aim_point, flight_time
+
+
+class ImpactScheduler:
+    """Event queue of pre-computed bullet impacts for the 'scheduled' projectile mode"""
+
+    def __init__(self):
+        self._queue = []
+        self._order = itertools.count()  # Tie-breaker so equal times never compare targets
+        self.time = 0.0
+
+    def __len__(self):
+        return len(self._queue)
+
+    def schedule(self, flight_time, target, damage, damage_effect, enemies_group=None):
+        """Queue damage to land on the target after flight_time seconds of game time"""
+        impact_time = self.time + flight_time
+        heapq.heappush(self._queue, (impact_time, next(self._order), target, damage,
+                                     damage_effect, enemies_group))
+        return impact_time
+
+    def update(self, dt):
+        """Advance the game clock and resolve every impact that is now due"""
+        self.time += dt
+        while self._queue and self._queue[0][0] <= self.time:
+            _, _, target, damage, damage_effect, enemies_group = heapq.heappop(self._queue)
+
+            # The target was killed by another shot or reached home - the shot is lost
+            if not target.alive():
+                continue
+            damage_effect.apply(target, damage, target.world_pos, enemies_group)
+
+    def clear(self):
+        """Drop all pending impacts, e.g. when a level ends"""
+        self._queue.clear()
+        self.time = 0.0
 
 
 class BulletFactory:
@@ -261,57 +348,175 @@ class BulletFactory:
         'Banana Blaster': NormalBulletStrategy(str(get_bullet_path('Banana Blaster.png'))),
         'Wood Sage': NormalBulletStrategy(str(get_bullet_path('Wood Sage.png'))),
     }
+    _default_strategy = NormalBulletStrategy('')
+
+    pool = BulletPool()
+    scheduler = ImpactScheduler()
+
+    # Can be switched at runtime, e.g. by a turbo or headless simulation
+    projectile_mode = PROJECTILE_MODE
+    render_scheduled_projectiles = RENDER_SCHEDULED_PROJECTILES
     
+    @classmethod
+    def preload_sprites(cls):
+        """Build the rotation tables for every bullet type up front"""
+        for tower_name, strategy in cls._strategies.items():
+            BulletSpriteCache.get_frames(strategy, tower_name)
+
     @classmethod
     def create_bullet(cls, tower_name, start_pos, target, damage, enemies_group=None):
-        strategy = cls._strategies.get(tower_name, NormalBulletStrategy(''))
-        bullet = Bullet(start_pos, target, damage, strategy, tower_name)
+        """Fire a shot; may return None in scheduled mode when sprites are disabled"""
+        strategy = cls._strategies.get(tower_name, cls._default_strategy)
+        metrics.count('bullets.fired')
 
-        if tower_name == 'Volt Cow' and hasattr(bullet.damage_effect, 'set_enemies_group'):
-            bullet.damage_effect.set_enemies_group(enemies_group)
-        
-        return bullet
+        if cls.projectile_mode == 'scheduled':
+            return cls._fire_scheduled(tower_name, start_pos, target, damage, strategy, enemies_group)
+
+        return cls.pool.acquire(start_pos, target, damage, strategy, tower_name, enemies_group)
+
+    @classmethod
+    def _fire_scheduled(cls, tower_name, start_pos, target, damage, strategy, enemies_group):
+        """Queue the impact up front and only launch a cosmetic bullet towards it"""
+        impact_point, flight_time = compute_intercept(start_pos, target)
+        cls.scheduler.schedule(flight_time, target, damage, strategy.get_damage_effect(), enemies_group)
+
+        if not cls.render_scheduled_projectiles:
+            return None
+
+        return cls.pool.acquire(start_pos, target, damage, strategy, tower_name, enemies_group,
+                                impact_point, flight_time)
+
+    @classmethod
+    def update(cls, dt):
+        """Resolve scheduled impacts; call once per game update"""
+        cls.scheduler.update(dt)
+
+    @classmethod
+    def reset(cls):
+        """Reclaim bullets in flight and drop pending impacts between levels"""
+        cls.pool.release_all()
+        cls.scheduler.clear()
+
+    @classmethod
+    def get_pool_stats(cls):
+        return cls.pool.get_stats()
 
 
 class Bullet(pygame.sprite.Sprite):
     """Enhanced bullet class with rotation and special effects"""
     
-    def __init__(self, start_pos, target, damage, strategy, bullet_type):
+    def __init__(self, start_pos, target, damage, strategy, bullet_type, enemies_group=None,
+                 impact_point=None, flight_time=None):
         super().__init__()
+        self.pool = None
+        self.speed = BULLET_SPEED
+        self.rotation_speed = 360
+        self.max_lifetime = BULLET_MAX_LIFETIME
+        self.reset(start_pos, target, damage, strategy, bullet_type, enemies_group,
+                   impact_point, flight_time)
+
+    def reset(self, start_pos, target, damage, strategy, bullet_type, enemies_group=None,
+              impact_point=None, flight_time=None):
+        """(Re)initialise the bullet for a new shot
+
+        start_pos and impact_point are world positions. With an impact_point and
+        flight_time the bullet is purely cosmetic: the damage is already queued
+        in the ImpactScheduler, so it just flies to the predicted point and
+        disappears without any collision tests.
+        """
         self.strategy = strategy
         self.bullet_type = bullet_type
 
-        self.base_image = strategy.create_image(bullet_type)
-        self.image = self.base_image.copy()
+        # Shared pre-rotated frames - no per-bullet image loading or rotation
+        self.frames = BulletSpriteCache.get_frames(strategy, bullet_type)
+        self.image = self.frames[0]
 
-        self.rect = self.image.get_rect(center=start_pos)
-        self.pos = pygame.Vector2(self.rect.center)
+        # Flight happens in world units; rect is the on-screen copy for drawing
+        self.pos = pygame.Vector2(start_pos)
+        self._update_rect()
         self.target = target
-        self.speed = 300
         self.damage = damage
+        self.enemies_group = enemies_group
 
-        vec = pygame.Vector2(target.rect.center) - pygame.Vector2(start_pos)
+        self.flight_time = flight_time
+        aim_point = impact_point if impact_point is not None else target.world_pos
+        vec = pygame.Vector2(aim_point) - self.pos
         self.dir = vec.normalize() if vec.length() else pygame.Vector2()
 
         self.rotation = 0
-        self.rotation_speed = 360
+        self.age = 0.0
 
         self.damage_effect = strategy.get_damage_effect()
+
+    def retarget(self):
+        """Aim at the nearest living enemy once the original target is gone"""
+        if not self.enemies_group:
+            return False
+
+        best_enemy = None
+        best_dist_sq = BULLET_RETARGET_RANGE * BULLET_RETARGET_RANGE
+        for enemy in self.enemies_group:
+            dist_sq = self.pos.distance_squared_to(enemy.world_pos)
+            if dist_sq <= best_dist_sq:
+                best_enemy = enemy
+                best_dist_sq = dist_sq
+
+        if best_enemy is None:
+            return False
+
+        self.target = best_enemy
+        vec = best_enemy.world_pos - self.pos
+        if vec.length():
+            self.dir = vec.normalize()
+        return True
     
+    def _update_rect(self):
+        """Place the on-screen rect at the world position through the current viewport"""
+        center = current_viewport().world_to_px(*self.pos) if pygame.display.get_surface() else self.pos
+        self.rect = self.image.get_rect(center=center)
+
     def update(self, dt):
-        """Update bullet position and rotation"""
+        """Update bullet position and rotation, expiring stray bullets"""
+        self.age += dt
+        if self.age >= self.max_lifetime:
+            self.kill()
+            return
+
+        # Target died or reached home - find another one nearby or give up.
+        # Scheduled bullets never retarget since their damage is already queued.
+        if not self.target.alive() and (self.flight_time is not None or not self.retarget()):
+            self.kill()
+            return
+
         self.pos += self.dir * self.speed * dt
-        self.rect.center = self.pos
 
         self.rotation += self.rotation_speed * dt
         self.rotation %= 360
 
-        self.image = pygame.transform.rotate(self.base_image, self.rotation)
-        old_center = self.rect.center
-        self.rect = self.image.get_rect()
-        self.rect.center = old_center
+        # Pick the nearest pre-rotated frame instead of rotating every frame
+        frame_index = int(self.rotation * len(self.frames) / 360 + 0.5) % len(self.frames)
+        self.image = self.frames[frame_index]
+        self._update_rect()
+
+        # Left the map - it can no longer hit anything
+        if not (0 <= self.pos.x <= GRID_W * GRID_SIZE and 0 <= self.pos.y <= GRID_H * GRID_SIZE):
+            self.kill()
+            return
 
-        if self.rect.colliderect(self.target.rect):
-            hit_result = self.damage_effect.apply(self.target, self.damage, self.rect.center)
+        if self.flight_time is not None:
+            if self.age >= self.flight_time:
+                self.kill()
+            return
 
+        # Hit box test in world units: the bullet's box overlaps the enemy's
+        reach = (self.target.base_size + BULLET_HIT_SIZE) / 2
+        offset = self.target.world_pos - self.pos
+        if abs(offset.x) <= reach and abs(offset.y) <= reach:
+            self.damage_effect.apply(self.target, self.damage, self.pos, self.enemies_group)
             self.kill()
+
+    def kill(self):
+        """Remove from all groups and hand the bullet back to its pool"""
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
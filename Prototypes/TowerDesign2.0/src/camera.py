@@ -0,0 +1,102 @@
+"""Pan and zoom over the play area"""
+
+import pygame
+from settings import *
+
+
+MAP_CENTER = (GRID_W * GRID_SIZE / 2, GRID_H * GRID_SIZE / 2)
+
+
+class Camera:
+    """Zoom factor and world position shown in the middle of the play area
+
+    Zoom 1 fits the whole map below the toolbar, exactly as without a camera.
+    Every change is handed to the viewports with set_camera_view(), so
+    grid_to_px, px_to_grid and current_viewport() follow the camera.
+    Positions passed in are in render surface pixels.
+    """
+
+    def __init__(self):
+        self.zoom = 1.0
+        self.center = MAP_CENTER
+        self.version = 0  # Bumped on every change, for caches of what the camera shows
+
+    @property
+    def active(self):
+        """True when zoomed in, i.e. part of the map may be off screen"""
+        return self.zoom > 1.0
+
+    def reset(self):
+        """Show the whole map again"""
+        self._set_view(1.0, MAP_CENTER)
+
+    def _set_view(self, zoom, center):
+        zoom = min(max(zoom, 1.0), CAMERA_MAX_ZOOM)
+        if zoom == 1.0:
+            center = MAP_CENTER
+        if (zoom, center) == (self.zoom, self.center):
+            return
+        self.zoom = zoom
+        self.center = center
+        self.version += 1
+        set_camera_view(None if zoom == 1.0 else (zoom, center))
+
+    def _clamped_center(self, zoom, center, screen_size):
+        """Keep the view over the map; a dimension that fits on screen stays centred"""
+        screen_w, screen_h = screen_size
+        scale = get_viewport(screen_w, screen_h).fit_scale * zoom
+        clamped = []
+        for value, view_px, map_units in ((center[0], screen_w, GRID_W * GRID_SIZE),
+                                          (center[1], screen_h - UI_HEIGHT, GRID_H * GRID_SIZE)):
+            half_view = view_px / 2 / scale
+            if half_view * 2 >= map_units:
+                clamped.append(map_units / 2)
+            else:
+                clamped.append(min(max(value, half_view), map_units - half_view))
+        return tuple(clamped)
+
+    def zoom_at(self, steps, screen_pos, screen_size):
+        """Zoom in (steps > 0) or out by CAMERA_ZOOM_STEP per step, keeping the point under screen_pos still"""
+        viewport = get_viewport(*screen_size)
+        world_x, world_y = viewport.px_to_world(*screen_pos)
+        zoom = min(max(self.zoom * CAMERA_ZOOM_STEP ** steps, 1.0), CAMERA_MAX_ZOOM)
+
+        # Centre that maps the world point back to the same pixel at the new scale
+        scale = viewport.fit_scale * zoom
+        center_x = world_x - (screen_pos[0] - screen_size[0] / 2) / scale
+        center_y = world_y - (screen_pos[1] - UI_HEIGHT - (screen_size[1] - UI_HEIGHT) / 2) / scale
+        self._set_view(zoom, self._clamped_center(zoom, (center_x, center_y), screen_size))
+
+    def pan(self, dx, dy, screen_size):
+        """Move the view by (dx, dy) screen pixels"""
+        if not self.active:
+            return
+        scale = get_viewport(*screen_size).scale
+        center = (self.center[0] + dx / scale, self.center[1] + dy / scale)
+        self._set_view(self.zoom, self._clamped_center(self.zoom, center, screen_size))
+
+    def update(self, dt, screen_size):
+        """Pan with the arrow keys, and keep the view over the map if the window was resized"""
+        if not self.active:
+            return
+        self._set_view(self.zoom, self._clamped_center(self.zoom, self.center, screen_size))
+        keys = pygame.key.get_pressed()
+        dx = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+        dy = keys[pygame.K_DOWN] - keys[pygame.K_UP]
+        if dx or dy:
+            self.pan(dx * CAMERA_PAN_SPEED * dt, dy * CAMERA_PAN_SPEED * dt, screen_size)
+
+    def handle_event(self, ev, mouse_pos, screen_size):
+        """Zoom on the mouse wheel, pan on right/middle drag and reset on Home; returns True if handled"""
+        if ev.type == pygame.MOUSEWHEEL:
+            self.zoom_at(ev.y, mouse_pos, screen_size)
+            return True
+        if ev.type == pygame.MOUSEMOTION and (ev.buttons[1] or ev.buttons[2]):
+            # Drag the map along with the mouse; rel is in window pixels, the view in render pixels
+            scale = screen_size[0] / pygame.display.get_surface().get_width()
+            self.pan(-ev.rel[0] * scale, -ev.rel[1] * scale, screen_size)
+            return True
+        if ev.type == pygame.KEYDOWN and ev.key == pygame.K_HOME:
+            self.reset()
+            return True
+        return False
@@ -0,0 +1,125 @@
+"""Central system for floating combat text (MISS / Fire / Zap)"""
+
+from array import array
+from settings import *
+from render_cache import get_font, render_text
+
+
+# kind name -> (text, colour, lifetime in seconds, rise speed in px/s, fade rate in alpha/s)
+EFFECT_KINDS = {
+    'miss': ("MISS", (255, 255, 0), 1.0, 20, 255),
+    'burn': ("Fire", (255, 0, 0), 3.0, 10, 85),
+    'zap': ("Zap", (255, 255, 0), 0.5, 30, 510),
+}
+
+
+class EffectSystem:
+    """Fixed-size pool of floating text effects drawn with one batched blit
+
+    Effects live in preallocated slots (position, age and kind arrays) rather
+    than per-enemy lists, so their cost depends only on how many are alive,
+    never more than `cap`. The faded text is pre-rendered once per kind and
+    quantised alpha level and shared by every effect.
+    """
+
+    def __init__(self, cap=EFFECT_CAP, alpha_levels=EFFECT_ALPHA_LEVELS):
+        self.cap = cap
+        self.alpha_levels = alpha_levels
+
+        kind_names = list(EFFECT_KINDS)
+        self.kind_index = {name: i for i, name in enumerate(kind_names)}
+        self.kind_specs = [EFFECT_KINDS[name] for name in kind_names]
+
+        self.x = array('f', [0.0]) * cap
+        self.y = array('f', [0.0]) * cap
+        self.age = array('f', [0.0]) * cap
+        self.kind = array('b', [-1]) * cap
+
+        self._free = list(range(cap - 1, -1, -1))
+        self._active = []
+        self._glyphs = {}  # (kind index, alpha level) -> (surface, half width)
+        self.dropped = 0  # Effects skipped because every slot was taken
+
+    def spawn(self, kind_name, pos):
+        """Start a floating text effect at pos; dropped silently when the pool is full"""
+        if not self._free:
+            self.dropped += 1
+            return False
+
+        slot = self._free.pop()
+        self.x[slot] = pos[0]
+        self.y[slot] = pos[1]
+        self.age[slot] = 0.0
+        self.kind[slot] = self.kind_index[kind_name]
+        self._active.append(slot)
+        return True
+
+    def update(self, dt):
+        """Age every effect and free the slots of finished ones"""
+        still_active = []
+        for slot in self._active:
+            self.age[slot] += dt
+            if self.age[slot] < self.kind_specs[self.kind[slot]][2]:
+                still_active.append(slot)
+            else:
+                self.kind[slot] = -1
+                self._free.append(slot)
+        self._active = still_active
+
+    def _get_glyph(self, kind_index, level):
+        cache_key = (kind_index, level)
+        if cache_key not in self._glyphs:
+            text, color = self.kind_specs[kind_index][:2]
+            surface = render_text(get_font('Arial', 32, bold=True), text, color).copy()
+            surface.set_alpha(level * 255 // (self.alpha_levels - 1))
+            self._glyphs[cache_key] = (surface, surface.get_width() // 2)
+        return self._glyphs[cache_key]
+
+    def draw(self, screen, view=None):
+        """Draw every live effect with a single Surface.blits call and return the drawn rects
+
+        Effects spawned outside view (a screen rect) are skipped.
+        """
+        top_level = self.alpha_levels - 1
+        batch = []
+        for slot in self._active:
+            if view is not None and not view.collidepoint(self.x[slot], self.y[slot]):
+                continue
+            kind_index = self.kind[slot]
+            _, _, lifetime, rise_speed, fade_rate = self.kind_specs[kind_index]
+            age = self.age[slot]
+
+            alpha = min(255, int((lifetime - age) * fade_rate))
+            level = -(-alpha * top_level // 255)  # Round up so text never vanishes early
+            if level <= 0:
+                continue
+
+            surface, half_width = self._get_glyph(kind_index, level)
+            batch.append((surface, (self.x[slot] - half_width, self.y[slot] - 30 - rise_speed * age)))
+
+        if not batch:
+            return []
+        return screen.blits(batch)
+
+    def clear(self):
+        """Drop every live effect, e.g. when a level ends"""
+        for slot in self._active:
+            self.kind[slot] = -1
+            self._free.append(slot)
+        self._active = []
+
+    @property
+    def active_count(self):
+        """Number of live effects"""
+        return len(self._active)
+
+    def get_stats(self):
+        """Effect statistics for profiling"""
+        return {
+            'active': self.active_count,
+            'cap': self.cap,
+            'dropped': self.dropped,
+        }
+
+
+effect_system = EffectSystem()
@@ -6,9 +6,18 @@ import os
 import math
 import random
 from settings import *
+from render_cache import get_font, render_text
+from effects import effect_system
+from sprite_variants import SpriteVariants, TINTS
+from renderer import LAYER_ENEMIES, LAYER_OVERLAYS
+from metrics import metrics
 from pathfinding import a_star
 from grid import GRID_MAP
 from resource_manager import get_sprite_path
+from assets import assets
+from game_logging import get_logger
+
+logger = get_logger('enemy')
 
 # Enemy type definitions
 ENEMY_TYPES = {
@@ -60,6 +69,8 @@ ENEMY_TYPES = {
 class EnemySprite:
     """Handles enemy sprite loading and animation"""
     """This class is inspired by ChatGPT-o4-mini-high, however only a little number of code is directly copied from the generated code"""
+    _frame_sets = {}  # enemy name -> frames shared by all enemies of that type
+
     def __init__(self, enemy_name):
         self.enemy_name = enemy_name
         self.frames = []
@@ -67,17 +78,24 @@ class EnemySprite:
         self.animation_timer = 0.0
         self.frame_duration = 0.3
         
-        # Load sprite sheet
-        sprite_path = get_sprite_path("enemy", f"{enemy_name}.png")
+        # Frames are loaded once per enemy type and shared by every enemy of
+        # that type, so their scaled variants are also built once per size
+        if enemy_name not in EnemySprite._frame_sets:
+            self.load_sprite_sheet()
+            EnemySprite._frame_sets[enemy_name] = self.frames
+        self.frames = EnemySprite._frame_sets[enemy_name]
+
+    def load_sprite_sheet(self):
+        sprite_path = get_sprite_path("enemy", f"{self.enemy_name}.png")
         try:
             if sprite_path.exists():
-                self.sprite_sheet = pygame.image.load(str(sprite_path))
+                self.sprite_sheet = assets.image(sprite_path)
                 self.load_frames()
-                print(f"Loaded sprite for {enemy_name}")
+                logger.debug("Loaded sprite for %s", self.enemy_name)
             else:
                 raise FileNotFoundError(f"Sprite file not found: {sprite_path}")
         except (pygame.error, FileNotFoundError, OSError) as e:
-            print(f"Could not load sprite: {sprite_path}, using fallback - {e}")
+            logger.warning("Could not load sprite: %s, using fallback - %s", sprite_path, e)
             self.sprite_sheet = None
             self.create_fallback_frames()
     
@@ -130,8 +148,8 @@ class EnemySprite:
             pygame.draw.rect(frame, (255, 255, 255), frame.get_rect(), 2)
             
             # Add text
-            font = pygame.font.SysFont('Arial', 8, bold=True)
-            text = font.render(self.enemy_name[:3], True, (255, 255, 255))
+            font = get_font('Arial', 8, bold=True)
+            text = render_text(font, self.enemy_name[:3], (255, 255, 255))
             text_rect = text.get_rect(center=(16, 16))
             frame.blit(text, text_rect)
             
@@ -152,28 +170,6 @@ class EnemySprite:
             self.animation_timer = 0.0
             self.current_frame = (self.current_frame + 1) % 4
 
-class MissEffect:
-    def __init__(self, pos):
-        self.pos = pos
-        self.timer = 1.0
-        self.font = pygame.font.SysFont('Arial', 32, bold=True)  # 2x larger (16 -> 32)
-        self.text = self.font.render("MISS", True, (255, 255, 0))
-        self.offset_y = 0
-    
-    def update(self, dt):
-        self.timer -= dt
-        self.offset_y += 20 * dt
-        return self.timer > 0
-    
-    def draw(self, screen):
-        if self.timer > 0:
-            alpha = min(255, int(self.timer * 255))
-            text_surface = self.text.copy()
-            text_surface.set_alpha(alpha)
-            text_rect = text_surface.get_rect()
-            pos = (self.pos[0] - text_rect.width//2, self.pos[1] - 30 - self.offset_y)
-            screen.blit(text_surface, pos)
-
 class BaseEnemy(pygame.sprite.Sprite):
     """Base enemy class with common functionality"""
     def __init__(self, path_or_start, end=None, enemy_type='Boxshot'):
@@ -226,73 +222,59 @@ class BaseEnemy(pygame.sprite.Sprite):
         self.image = self.get_scaled_image()
         self.rect = self.image.get_rect()
 
+        # Position along the path in world units (see tile_center_world); rect is its on-screen copy
+        self.world_pos = pygame.Vector2(tile_center_world(*self.path[0]))
         self._update_position_and_size()
-        if self.path:
-            gx, gy = self.path[0]
-            initial_pos = self._tile_center(gx, gy)
-            self.rect.center = (initial_pos.x, initial_pos.y)
 
-        self.miss_effects = []
+        # Burns only deal damage here - floating text is handled by the effect system
         self.burn_effects = []
-        self.electric_effects = []
 
     def get_scaled_image(self):
         """This method is fixed by ChatGPT-4o"""
         current_frame = self.sprite.get_current_frame()
-        screen = pygame.display.get_surface()
-        if screen:
-            screen_w, screen_h = screen.get_size()
-            scaled_grid_size = get_scaled_grid_size(screen_w, screen_h)
-            scale_factor = scaled_grid_size / GRID_SIZE
-            size = max(int(self.base_size * scale_factor), 8)
+        if pygame.display.get_surface():
+            size = max(int(self.base_size * current_viewport().unit_scale), 8)
         else:
             size = self.base_size
         
-        return pygame.transform.scale(current_frame, (size, size))
+        return SpriteVariants.get(current_frame, (size, size))
     
+    def _update_world_pos(self):
+        """Interpolate the world position between the current and next path tile"""
+        if self.step + 1 < len(self.path):
+            current_pos = pygame.Vector2(tile_center_world(*self.path[self.step]))
+            next_pos = pygame.Vector2(tile_center_world(*self.path[self.step + 1]))
+            self.world_pos = current_pos + (next_pos - current_pos) * self.progress
+        elif self.path:
+            self.world_pos = pygame.Vector2(tile_center_world(*self.path[min(self.step, len(self.path) - 1)]))
+
     def _update_position_and_size(self):
-        screen = pygame.display.get_surface()
-        if screen:
-            screen_w, screen_h = screen.get_size()
-            scaled_grid_size = get_scaled_grid_size(screen_w, screen_h)
-            scale_factor = scaled_grid_size / GRID_SIZE
-            self.size = max(int(self.base_size * scale_factor), 8)
-            
+        """Recompute the world position and derive the on-screen size and rect from it"""
+        self._update_world_pos()
+        if pygame.display.get_surface():
+            viewport = current_viewport()
+            self.size = max(int(self.base_size * viewport.unit_scale), 8)
             self.image = self.get_scaled_image()
-            
-            # Recalculate position based on current path progress
-            # This part is generated by ChatGPT-4o, the code is directly copied.
-            if self.step < len(self.path):
-                if self.step + 1 < len(self.path):
-                    current_gx, current_gy = self.path[self.step]
-                    next_gx, next_gy = self.path[self.step + 1]
-                    
-                    current_pos = self._tile_center(current_gx, current_gy)
-                    next_pos = self._tile_center(next_gx, next_gy)
-                    
-                    interp_x = current_pos.x + (next_pos.x - current_pos.x) * self.progress
-                    interp_y = current_pos.y + (next_pos.y - current_pos.y) * self.progress
-                    
-                    self.rect = self.image.get_rect()
-                    self.rect.center = (interp_x, interp_y)
-                else:
-                    gx, gy = self.path[self.step]
-                    pos = self._tile_center(gx, gy)
-                    self.rect = self.image.get_rect()
-                    self.rect.center = (pos.x, pos.y)
-            else:
-                self.rect = self.image.get_rect()
-
-    def _tile_center(self, gx, gy):
-        screen = pygame.display.get_surface()
-        if screen:
-            screen_w, screen_h = screen.get_size()
-            px, py = grid_to_px(gx, gy, screen_w, screen_h)
-            scaled_grid_size = get_scaled_grid_size(screen_w, screen_h)
-            return pygame.Vector2(px + scaled_grid_size//2, py + scaled_grid_size//2)
-        else:
-            px, py = grid_to_px(gx, gy)
-            return pygame.Vector2(px + GRID_SIZE//2, py + GRID_SIZE//2)
+            self.rect = self.image.get_rect(center=viewport.world_to_px(*self.world_pos))
+
+    def predict_position(self, t):
+        """Estimate the world position after t seconds, assuming the current speed holds"""
+        pos = pygame.Vector2(self.world_pos)
+        remaining = self.speed * t
+        step = self.step
+
+        while remaining > 0 and step + 1 < len(self.path):
+            next_pos = pygame.Vector2(tile_center_world(*self.path[step + 1]))
+            segment = next_pos - pos
+            segment_distance = segment.length()
+            if remaining <= segment_distance:
+                pos = pos + segment * (remaining / segment_distance)
+                break
+            remaining -= segment_distance
+            pos = next_pos
+            step += 1
+
+        return pos
 
     def hit(self, dmg):
         """Take damage - can be overridden by specific enemy types"""
@@ -301,6 +283,7 @@ class BaseEnemy(pygame.sprite.Sprite):
         self.flash_time = 0.1
         self.hit_flash = 0.1
         if self.health <= 0 and not self.reward_given:
+            metrics.count('enemies.killed')
             self.is_dead = True
             self.reward_given = True
             self.cleanup_speed_modifiers()
@@ -344,11 +327,8 @@ class BaseEnemy(pygame.sprite.Sprite):
 
         self._update_position_and_size()
 
-        self.miss_effects = [effect for effect in self.miss_effects if effect.update(dt)]
-
-        self.burn_effects = [effect for effect in self.burn_effects if effect.update(dt, self)]
-
-        self.electric_effects = [effect for effect in self.electric_effects if effect.update(dt)]
+        if self.burn_effects:
+            self.burn_effects = [effect for effect in self.burn_effects if effect.update(dt, self)]
         
         # Movement logic
         if self.step < len(self.path):
@@ -356,21 +336,11 @@ class BaseEnemy(pygame.sprite.Sprite):
                 current_gx, current_gy = self.path[self.step]
                 next_gx, next_gy = self.path[self.step + 1]
                 
-                current_pos = self._tile_center(current_gx, current_gy)
-                next_pos = self._tile_center(next_gx, next_gy)
-                
-                segment_distance = (next_pos - current_pos).length()
+                # Speed is in world units per second, so it does not depend on the window size
+                segment_distance = math.hypot(next_gx - current_gx, next_gy - current_gy) * GRID_SIZE
                 
                 if segment_distance > 0:
-                    screen = pygame.display.get_surface()
-                    if screen:
-                        screen_w, screen_h = screen.get_size()
-                        scale_factor = get_scaled_grid_size(screen_w, screen_h) / GRID_SIZE
-                        scaled_speed = self.speed * scale_factor
-                    else:
-                        scaled_speed = self.speed
-                    
-                    progress_increment = (scaled_speed * dt) / segment_distance
+                    progress_increment = (self.speed * dt) / segment_distance
                     self.progress += progress_increment
                     
                     if self.progress >= 1.0:
@@ -393,7 +363,7 @@ class BaseEnemy(pygame.sprite.Sprite):
             self.hit_flash = max(0, self.hit_flash - dt)
     
     def add_miss_effect(self):
-        self.miss_effects.append(MissEffect(self.rect.center))
+        effect_system.spawn('miss', self.rect.center)
     
     def draw(self, surf):
         surf.blit(self.image, self.rect)
@@ -408,21 +378,17 @@ class BaseEnemy(pygame.sprite.Sprite):
         
         # Flash effect
         if self.flash_time > 0 or self.hit_flash > 0:
-            overlay = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 120))
-            surf.blit(overlay, self.rect.topleft)
-        
-        # Draw miss effects
-        for effect in self.miss_effects:
-            effect.draw(surf)
-        
-        # Draw burn effects
-        for effect in self.burn_effects:
-            effect.draw(surf)
+            surf.blit(SpriteVariants.get_overlay(self.rect.size, TINTS['flash']), self.rect.topleft)
+
+    def queue_draw(self, draw_list):
+        """Queue the same sprite, health bar and flash as draw() on a DrawList"""
+        if not draw_list.visible((self.rect.x, self.rect.y - 6, self.rect.w, self.rect.h + 6)):
+            return
+        draw_list.add(LAYER_ENEMIES, self.image, self.rect)
+        draw_list.add_health_bar(self.rect.x, self.rect.y - 6, self.size, int(self.size * self.health / self.max_health))
         
-        # Draw electric effects
-        for effect in self.electric_effects:
-            effect.draw(surf)
+        if self.flash_time > 0 or self.hit_flash > 0:
+            draw_list.add(LAYER_OVERLAYS, SpriteVariants.get_overlay(self.rect.size, TINTS['flash']), self.rect.topleft)
 
 class AdframeEnemy(BaseEnemy):
     def __init__(self, path_or_start, end=None):
@@ -462,20 +428,13 @@ class WiregeistEnemy(BaseEnemy):
         for group in self.groups():
             all_enemies.extend([enemy for enemy in group if enemy != self and hasattr(enemy, 'rect')])
 
-        screen = pygame.display.get_surface()
-        if screen:
-            screen_w, screen_h = screen.get_size()
-            scale = get_scaled_grid_size(screen_w, screen_h) / GRID_SIZE
-            scaled_range = self.aura_range * scale
-        else:
-            scaled_range = self.aura_range
-        
         currently_in_range = set()
 
+        # Ranges are in world units, compared against world positions
         for enemy in all_enemies:
-            distance_sq = (self.rect.centerx - enemy.rect.centerx)**2 + (self.rect.centery - enemy.rect.centery)**2
+            distance_sq = self.world_pos.distance_squared_to(enemy.world_pos)
             
-            if distance_sq <= scaled_range**2:
+            if distance_sq <= self.aura_range**2:
                 currently_in_range.add(enemy)
                 if enemy not in self.affected_enemies:
                     enemy.apply_aura_effect(self, self.speed_boost)
@@ -512,10 +471,9 @@ class EnemyFactory:
             enemy.max_health = int(enemy.max_health * health_multiplier)
             enemy.health = enemy.max_health
         
-        # Debug print for enemy health (for all waves)
-        # TODO: Add into log file.
-        print(f"Wave {wave_number}: {enemy_type} - Base Health: {ENEMY_TYPES[enemy_type]['health']}, "
-              f"Scaled Health: {enemy.health} (multiplier: {health_multiplier:.1f})")
+        # Enemy health for every wave, logged at DEBUG since this runs per spawn
+        logger.debug("Wave %d: %s - Base Health: %d, Scaled Health: %d (multiplier: %.1f)",
+                     wave_number, enemy_type, ENEMY_TYPES[enemy_type]['health'], enemy.health, health_multiplier)
         
         return enemy
     
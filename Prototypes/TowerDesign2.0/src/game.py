@@ -3,21 +3,34 @@ AI assisted code included in this file, you can see the comments below for detai
 """
 import sys
 import pygame
-import json
 import time
 import math  # Add math import
 import os
 from settings import *
-from menu import MainMenu, LevelSelector, show_level_creator_message
+from render_cache import get_font, render_text, get_gradient
+from menu import MainMenu, LevelSelector, show_level_creator_message, show_loading_screen
 from level_creator import run_level_creator
 from library import CharacterLibrary, ImageCache
 from grid import GRID_MAP, update_grid_map
 from map_component import MapComponent
 from level import Level
 from tower import TowerFactory
-from bullet import Bullet
+from bullet import Bullet, BulletFactory
+from effects import effect_system
+from renderer import DirtyRectRenderer, DrawList, RenderScaler, LAYER_BULLETS
+from hud import HudWidget, new_layer
+from camera import Camera
+from profiler import profiler
+from metrics import metrics
+from sprite_variants import SpriteVariants
 from audio_manager import audio_manager
 from resource_manager import get_library_path
+from assets import assets
+from game_logging import get_logger
+from level_format import load_level, level_hash
+from records import records
+
+logger = get_logger('game')
 
 class TowerImageCache:
     """Cache system for tower images"""
@@ -32,25 +45,17 @@ class TowerImageCache:
         if cache_key not in cls._tower_images:
             try:
                 library_image_path = get_library_path("tower", f"{tower_name}.png")
-                image = pygame.image.load(str(library_image_path))
+                image = assets.image(library_image_path)
                 
                 scaled_image = pygame.transform.scale(image, size)
                 
                 if grayscale:
-                    gray_image = pygame.Surface(size, pygame.SRCALPHA)
-                    for x in range(size[0]):
-                        for y in range(size[1]):
-                            color = scaled_image.get_at((x, y))
-                            if color[3] > 0:
-                                gray = int(0.299 * color.r + 0.587 * color.g + 0.114 * color.b)
-                                gray_color = (gray // 3, gray // 3, gray // 3, color.a)
-                                gray_image.set_at((x, y), gray_color)
-                    cls._tower_images[cache_key] = gray_image
+                    cls._tower_images[cache_key] = SpriteVariants.get(scaled_image, variant='disabled')
                 else:
                     cls._tower_images[cache_key] = scaled_image
                     
             except Exception as e:
-                print(f"Failed to load tower image {tower_name}: {e}")
+                logger.error("Failed to load tower image %s: %s", tower_name, e)
                 cls._tower_images[cache_key] = None
         
         return cls._tower_images[cache_key]
@@ -59,61 +64,50 @@ class Game:
     def __init__(self):
         self.state = "menu"  # menu, level_select, playing, creator, library
         self.current_level_file = None
+        self.show_debug_overlay = False
+        self.use_dirty_rects = DIRTY_RECT_RENDERING
+        self.render_scaler = RenderScaler()  # Kept across levels so the automatic scale sticks
+        self.camera = Camera()
+        self._missing_tower_images = set()  # Toolbar tower images that failed to load
+
+        # Retained HUD widgets and the toolbar layout they share
+        self._toolbar_layout = None
+        self._toolbar_layout_size = None
+        self.toolbar_widget = HudWidget(self.render_toolbar)
+        self.menu_button_widget = HudWidget(self.render_menu_button)
+        self.wave_panel_widget = HudWidget(self.render_wave_panel)
+
+        # F3 overlay - its text is refreshed a few times a second rather than every frame
+        self.debug_panel_widget = HudWidget(self.render_debug_panel)
+        self._debug_lines = None
+        self._debug_refresh_ticks = 0
+        self._frame_graph_bg = None
         
     def load_level_from_file(self, level_file):
         try:
-            with open(level_file, 'r', encoding='utf-8') as f:
-                level_data = json.load(f)
-        except UnicodeDecodeError:
-            try:
-                with open(level_file, 'r', encoding='utf-8-sig') as f:
-                    level_data = json.load(f)
-            except Exception as e:
-                print(f"Error loading level {level_file}: {e}")
-                return None
+            level_data = load_level(level_file)
         except Exception as e:
-            print(f"Error loading level {level_file}: {e}")
+            logger.error("Error loading level %s: %s", level_file, e)
             return None
                 
         # Check if level data is valid
         if 'grid' not in level_data:
-            print(f"Game: Warning - Level file {level_file} has no grid data")
+            logger.warning("Level file %s has no grid data", level_file)
             return None
             
         # Check if grid size is correct
         grid = level_data['grid']
         if len(grid) != GRID_H or any(len(row) != GRID_W for row in grid):
-            print(f"Game: Error - Level file {level_file} has incorrect grid size")
+            logger.error("Level file %s has incorrect grid size", level_file)
             return None
             
         # Update global grid map
         update_grid_map(grid)
-        print(f"Game: Loaded level '{level_data.get('name', level_file)}'")
-        print(f"Game: Grid size {len(grid[0])} x {len(grid)}")
+        logger.info("Loaded level '%s'", level_data.get('name', level_file))
+        logger.debug("Grid size %d x %d", len(grid[0]), len(grid))
                         
         return level_data
     
-    def save_best_time(self, level_file, new_time):
-        """Save a new best time to the level file"""
-        try:
-            with open(level_file, 'r', encoding='utf-8') as f:
-                level_data = json.load(f)
-
-            if 'settings' not in level_data:
-                level_data['settings'] = {}
-            
-            level_data['settings']['best_time'] = new_time
-            
-
-            with open(level_file, 'w', encoding='utf-8') as f:
-                json.dump(level_data, f, indent=2, ensure_ascii=False)
-            
-            print(f"New best time saved: {new_time:.2f}s")
-            return True
-        except Exception as e:
-            print(f"Error saving best time: {e}")
-            return False
-    
     def run_game_loop(self, level_data):
         level = Level()
         # Initialize Level with loaded level data BEFORE calling recalculate_path
@@ -124,6 +118,9 @@ class Game:
         
 
         level.load_settings(level_data)
+        # Best times live in the records store; a best time in an old level file still counts
+        level_key = level_hash(level_data)
+        level.best_time = records.best_time(level_key, level.best_time)
 
         level.recalculate_path()
 
@@ -132,7 +129,13 @@ class Game:
         game_map = MapComponent(grid=level.grid)
 
         game_map.set_spawn_and_home(level.start, level.end)
-        
+
+        # Pre-rotate bullet sprites so the first shots don't stall, and
+        # reclaim bullets and pending impacts left over from the previous level
+        BulletFactory.preload_sprites()
+        BulletFactory.reset()
+        effect_system.clear()
+
         towers = pygame.sprite.Group()
         bullets = pygame.sprite.Group()
         sel = None
@@ -140,7 +143,9 @@ class Game:
         game_won = False
         money = level.initial_money
         selected_tower = None
-        current_screen_size = screen.get_size()
+        self.camera.reset()
+        camera_version = self.camera.version
+        current_screen_size = self.render_scaler.update(screen.get_size())
         
         # Game timing - initially paused for level start message
         start_time = None  # Will be set after countdown
@@ -159,6 +164,11 @@ class Game:
 
         ui_update_timer = 0.0
         ui_update_interval = 0.1
+
+        # Dirty-rect mode only refreshes the HUD on the UI timer, on input, or when something overlaps it
+        renderer = DirtyRectRenderer()
+        draw_list = DrawList()
+        hud_input = True
         
         # Kill reward callback function
         def on_enemy_killed(enemy):
@@ -166,7 +176,7 @@ class Game:
 
             reward = getattr(enemy, 'reward', KILL_REWARD)
             money += reward
-            print(f"{getattr(enemy, 'enemy_type', 'Enemy')} killed! Reward: +${reward}")
+            logger.debug("%s killed! Reward: +$%d", getattr(enemy, 'enemy_type', 'Enemy'), reward)
 
         level.set_kill_callback(on_enemy_killed)
         
@@ -178,10 +188,21 @@ class Game:
         running = True
         clock = pygame.time.Clock()
         
+        profiler.declare(("events", "game_map.update", "level.update", "bullets.update", "effects.update",
+                          "towers.update", "game rules", "MapComponent.draw", "tower/bullet draw", "HUD panels",
+                          "enemy draw", "effects draw", "messages", "overlay", "display.flip"))
+        profiler.reset()
+        profiler.enabled = self.show_debug_overlay
+        metrics.enable(METRICS_ENABLED or self.show_debug_overlay)
+        metrics.reset()
         while running:
             dt = clock.tick(60)/1000.0
-            mouse_pos = pygame.mouse.get_pos()
-            current_screen_size = screen.get_size()
+            profiler.begin_frame()
+            if self.render_scaler.record_frame(clock.get_rawtime()):
+                renderer.request_full_redraw()
+            # Everything below works in render surface coordinates, which are the window's at full scale
+            current_screen_size = self.render_scaler.update(screen.get_size())
+            mouse_pos = self.render_scaler.to_render(pygame.mouse.get_pos())
 
             ui_update_timer += dt
             should_update_ui = ui_update_timer >= ui_update_interval
@@ -201,6 +222,11 @@ class Game:
                 current_game_time = time.time() - start_time
             
             for ev in pygame.event.get():
+                if ev.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+                    hud_input = True
+
+                if self.camera.handle_event(ev, mouse_pos, current_screen_size):
+                    continue
                 if ev.type == pygame.QUIT:
                     return "quit"
                 elif ev.type == pygame.VIDEORESIZE:
@@ -208,15 +234,28 @@ class Game:
                     new_width = max(ev.w, MIN_SCREEN_W)
                     new_height = max(ev.h, MIN_SCREEN_H)
                     pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE | pygame.DOUBLEBUF)
-                    current_screen_size = (new_width, new_height)
+                    current_screen_size = self.render_scaler.update((new_width, new_height))
                 elif ev.type == pygame.KEYDOWN:
                     if ev.key == pygame.K_ESCAPE:
                         return "menu"
                     elif ev.key == pygame.K_F11:
                         # Toggle fullscreen
                         pygame.display.toggle_fullscreen()
+                        renderer.request_full_redraw()
+                    elif ev.key == pygame.K_F3:
+                        self.show_debug_overlay = not self.show_debug_overlay
+                        profiler.enabled = self.show_debug_overlay
+                        profiler.reset()
+                        metrics.enable(METRICS_ENABLED or self.show_debug_overlay)
+                    elif ev.key == pygame.K_F4:
+                        self.use_dirty_rects = not self.use_dirty_rects
+                        renderer.request_full_redraw()
+                    elif ev.key == pygame.K_F5:
+                        self.render_scaler.cycle()
+                        current_screen_size = self.render_scaler.update(screen.get_size())
+                        renderer.request_full_redraw()
                 elif ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-                    mx, my = ev.pos
+                    mx, my = self.render_scaler.to_render(ev.pos)
                     screen_w, screen_h = current_screen_size
 
                     # Check menu button (bottom right corner)
@@ -272,6 +311,14 @@ class Game:
                                         towers.add(TowerFactory.create_tower(sel, gx, gy))
                                         sel = None
 
+            # Sprites follow the camera right away, even while the game is paused
+            self.camera.update(dt, current_screen_size)
+            if self.camera.version != camera_version:
+                camera_version = self.camera.version
+                level.refresh_positions()
+
+            profiler.lap("events")
+
             # Update game logic only if the game is not over and level start is complete
             if not game_over and not game_won and not show_level_start:
                 prev_wave_complete = level.wave_complete
@@ -279,10 +326,21 @@ class Game:
                 
                 # Update map component with enemy status and time
                 game_map.update(dt, level.enemies)
+                profiler.lap("game_map.update")
                 
                 level.update(dt)
+                profiler.lap("level.update")
+                # Bullets that leave the map are culled rather than flying forever
                 bullets.update(dt)
+                BulletFactory.update(dt)
+                profiler.lap("bullets.update")
+                effect_system.update(dt)
+                profiler.lap("effects.update")
                 towers.update(dt, level.enemies, bullets)
+                profiler.lap("towers.update")
+                metrics.gauge('enemies.alive', len(level.enemies))
+                metrics.gauge('bullets.active', len(bullets))
+                metrics.gauge('effects.active', effect_system.active_count)
                 
                 # Update audio manager with enemy count for music switching
                 enemy_count = len(level.enemies)
@@ -297,7 +355,8 @@ class Game:
                         if hasattr(e, 'cleanup_speed_modifiers'):
                             e.cleanup_speed_modifiers()
                         e.kill()
-                        print(f"Enemy reached HOME! Base HP: {level.base_hp}")
+                        metrics.count('enemies.reached_home')
+                        logger.debug("Enemy reached HOME! Base HP: %d", level.base_hp)
                     elif hasattr(e, 'reached_end') and e.reached_end:
                         game_map.on_home_hit()
                         level.base_hp -= getattr(e, 'damage_to_base', 1)
@@ -305,20 +364,24 @@ class Game:
                         if hasattr(e, 'cleanup_speed_modifiers'):
                             e.cleanup_speed_modifiers()
                         e.kill()
-                        print(f"Enemy reached HOME! Base HP: {level.base_hp}")
+                        metrics.count('enemies.reached_home')
+                        logger.debug("Enemy reached HOME! Base HP: %d", level.base_hp)
 
                 if level.wave_complete and not prev_wave_complete:
                     # Wave just completed, give reward immediately
                     money += WAVE_REWARD
                     wave_message = f"Wave {level.current_wave} Complete! Bonus: +${WAVE_REWARD}"
                     wave_message_timer = 0.0
-                    print(f"Wave {level.current_wave} completed! Bonus: +${WAVE_REWARD}")
+                    logger.info("Wave %d completed! Bonus: +$%d", level.current_wave, WAVE_REWARD)
                     # Play wave complete sound
                     audio_manager.play_wave_complete_sound()
+                    self.finish_metrics_wave(level)
                 
                 # Check game over condition
                 if level.base_hp <= 0:
                     game_over = True
+                    self.finish_metrics_wave(level)
+                    records.record_run(level_key, level.name, 'defeat', current_game_time, level.current_wave)
                     audio_manager.stop_all_audio()
                     audio_manager.play_game_over_sound()
                 
@@ -329,42 +392,91 @@ class Game:
                     audio_manager.play_victory_sound()
                     
                     # Check if this is a new best time
-                    if level.best_time is None or final_time < level.best_time:
-                        is_new_best_time = True
-                        if self.current_level_file:
-                            self.save_best_time(self.current_level_file, final_time)
-                    else:
-                        is_new_best_time = False
+                    is_new_best_time = level.best_time is None or final_time < level.best_time
+                    records.record_run(level_key, level.name, 'victory', final_time, level.current_wave)
             
             # Update wave message timer
             if wave_message:
                 wave_message_timer += dt
                 if wave_message_timer >= wave_message_duration:
                     wave_message = ""
+            profiler.lap("game rules")
 
             """
             This section is inspired and supported by ChatGPT-o4-mini-high.
             """
-            # Draw screen elements
-            current_screen = pygame.display.get_surface()
-            current_screen.fill(BG_COLOUR)
+            # Draw screen elements - dirty rects only pay off when drawing straight to the window
+            window = pygame.display.get_surface()
+            current_screen = self.render_scaler.begin_frame(window)
+            use_dirty_rects = self.use_dirty_rects and not self.render_scaler.active
+            # When zoomed in, the map is clipped to the play area and off-screen things are culled
+            view = get_viewport(*current_screen_size).visible_area if self.camera.active else None
+            draw_list.view = view
+            if use_dirty_rects:
+                # Full-screen messages cover everything, so those frames are redrawn in full
+                overlay_active = bool(wave_message) or show_level_start or game_over or game_won
+                full_frame = renderer.begin_frame(current_screen, game_map, full_redraw=overlay_active)
+
+                # The opaque toolbar hides whatever is drawn before it, so keep
+                # markers, towers and bullets below it instead of redrawing the toolbar
+                play_clip = pygame.Rect(0, UI_HEIGHT, current_screen_size[0], current_screen_size[1] - UI_HEIGHT)
+                under_hud_rects = [tower.rect.clip(play_clip) for tower in towers]
+                under_hud_rects += [bullet.rect.clip(play_clip) for bullet in bullets]
+
+                # Refresh the whole HUD on the UI timer or input, otherwise only where
+                # something moving overlapped it
+                hud_rects = self.get_hud_rects(current_screen_size)
+                if full_frame or should_update_ui or hud_input:
+                    hud_clip = None
+                    redraw_hud = True
+                else:
+                    hud_clip = renderer.damaged_region(hud_rects, under_hud_rects)
+                    redraw_hud = hud_clip is not None
+                if redraw_hud and not full_frame:
+                    renderer.restore(current_screen, hud_rects if hud_clip is None else [hud_clip])
+                current_screen.set_clip(play_clip)
+            else:
+                current_screen.fill(BG_COLOUR)
+                current_screen.set_clip(view)
+                game_map.draw_tiles(current_screen)
+                redraw_hud = True
+                hud_clip = None
             
             # Draw map
-            game_map.draw(current_screen)
+            marker_rects = game_map.draw_markers(current_screen)
+            profiler.lap("MapComponent.draw")
             
-            # Draw towers
+            # Draw towers and bullets in one batched blit
             for tower in towers:
-                tower.draw(current_screen)
-            
-            # Draw bullets
-            bullets.draw(current_screen)
+                tower.queue_draw(draw_list, current_screen_size)
+            for bullet in bullets:
+                if draw_list.visible(bullet.rect):
+                    draw_list.add(LAYER_BULLETS, bullet.image, bullet.rect)
+            draw_list.flush(current_screen)
+            current_screen.set_clip(None)
+            profiler.lap("tower/bullet draw")
 
-            self.draw_enhanced_toolbar(current_screen, current_screen_size, sel, selected_tower, money, level.base_hp, level.name, level)
-            
-            # Draw wave panel with updated format
-            self.draw_wave_panel_with_timing(current_screen, current_screen_size, level, current_game_time)
+            if redraw_hud:
+                current_screen.set_clip(hud_clip)
+                self.draw_enhanced_toolbar(current_screen, current_screen_size, sel, selected_tower, money, level.base_hp, level.name, level)
+                
+                # Draw wave panel with updated format
+                self.draw_wave_panel_with_timing(current_screen, current_screen_size, level, current_game_time)
+                current_screen.set_clip(None)
+                if hud_clip is None:
+                    hud_input = False
+            profiler.lap("HUD panels")
 
-            level.draw(current_screen)
+            # Enemies, their health bars and hit flashes, also in one batched blit
+            current_screen.set_clip(view)
+            level.queue_draw(draw_list)
+            draw_list.flush(current_screen)
+
+            # Floating combat text for every enemy in one batched blit
+            profiler.lap("enemy draw")
+            effect_rects = effect_system.draw(current_screen, view)
+            current_screen.set_clip(None)
+            profiler.lap("effects draw")
             
             # Draw wave completion message if active
             if wave_message:
@@ -379,13 +491,48 @@ class Game:
                 self.draw_game_over_screen(current_screen, current_screen_size, victory=False)
             elif game_won:
                 self.draw_victory_screen(current_screen, current_screen_size, current_game_time, level.best_time, is_new_best_time)
+
+            profiler.lap("messages")
+
+            debug_rect = None
+            if self.show_debug_overlay:
+                debug_rect = self.draw_debug_overlay(current_screen, clock, level, bullets, renderer if use_dirty_rects else None)
+                profiler.lap("overlay")
             
-            pygame.display.flip()
+            if use_dirty_rects:
+                renderer.mark(rect.clip(play_clip) for rect in marker_rects)
+                renderer.mark(tower.rect.clip(play_clip) for tower in towers)
+                renderer.mark(bullet.rect.clip(play_clip) for bullet in bullets)
+                # Enemy rects grown upwards to cover the health bar
+                renderer.mark(enemy.rect.inflate(0, 14) for enemy in level.enemies)
+                renderer.mark(effect_rects)
+                renderer.mark([debug_rect])
+                renderer.end_frame(current_screen)
+            else:
+                self.render_scaler.end_frame(window)
+            profiler.lap("display.flip")
+            profiler.end_frame()
         
         return "menu"
     
+    def finish_metrics_wave(self, level):
+        """Write this wave's metrics if METRICS_ENABLED and start counting the next wave from zero"""
+        if not metrics.enabled:
+            return
+        if METRICS_ENABLED:
+            metrics.dump_wave(level.name, level.current_wave)
+        else:
+            metrics.reset()
+
     def get_toolbar_layout(self, screen_w, screen_h):
-        """Get toolbar layout information for current screen size - enhanced layout"""
+        """Get toolbar layout information for current screen size, computed once per resize"""
+        if self._toolbar_layout_size != (screen_w, screen_h):
+            self._toolbar_layout = self._build_toolbar_layout(screen_w, screen_h)
+            self._toolbar_layout_size = (screen_w, screen_h)
+        return self._toolbar_layout
+
+    def _build_toolbar_layout(self, screen_w, screen_h):
+        """Toolbar layout for a screen size - enhanced layout"""
         toolbar_margin = 15
         card_width = 120
         card_height = 105
@@ -433,25 +580,55 @@ class Game:
         }
 
     def draw_enhanced_toolbar(self, screen, screen_size, selected_type, selected_tower, money, base_hp, level_name, level):
-        """Draw enhanced toolbar with jungle theme like library"""
-        """The design is made with ChatGPT-4o"""
+        """Draw enhanced toolbar with jungle theme like library
+
+        The toolbar and the menu button are retained widgets: they are only
+        re-rendered when money, base HP, the selection, the hovered card or
+        the window size change, otherwise their cached surfaces are blitted.
+        """
         screen_w, screen_h = screen_size
+        layout = self.get_toolbar_layout(screen_w, screen_h)
 
-        toolbar_rect = pygame.Rect(0, 0, screen_w, UI_HEIGHT)
-        pygame.draw.rect(screen, BROWN, toolbar_rect)
-        pygame.draw.rect(screen, DARK_GREEN, toolbar_rect, 4)
+        mx, my = self.render_scaler.to_render(pygame.mouse.get_pos())
+        hovered = None
+        if my < UI_HEIGHT:
+            for i, button_info in enumerate(layout['tower_buttons']):
+                if button_info['rect'].collidepoint(mx, my):
+                    hovered = i
+            if layout['demolish_button']['rect'].collidepoint(mx, my):
+                hovered = "demolish"
+
+        selected_name = selected_type['name'] if selected_type else None
+        toolbar_state = (screen_size, selected_name, selected_tower == "demolish_mode", hovered, money, base_hp, level_name)
+        self.toolbar_widget.draw(screen, (0, 0), toolbar_state)
+
+        menu_button_rect = pygame.Rect(screen_w - 100, screen_h - 60, 80, 40)
+        menu_hovered = menu_button_rect.collidepoint(mx, my)
+        self.menu_button_widget.draw(screen, menu_button_rect.topleft, (menu_hovered,))
+
+    def render_toolbar(self, state):
+        """Render the toolbar widget: tower cards, demolish card and info panel"""
+        """The design is made with ChatGPT-4o"""
+        screen_size, selected_name, is_demolish_active, hovered, money, base_hp, level_name = state
+        screen_w, screen_h = screen_size
         layout = self.get_toolbar_layout(screen_w, screen_h)
 
-        mx, my = pygame.mouse.get_pos()
+        # On narrow windows the demolish card wraps below the toolbar
+        layer_h = max(UI_HEIGHT, layout['demolish_button']['rect'].bottom)
+        surface = new_layer((screen_w, layer_h))
+
+        toolbar_rect = pygame.Rect(0, 0, screen_w, UI_HEIGHT)
+        pygame.draw.rect(surface, BROWN, toolbar_rect)
+        pygame.draw.rect(surface, DARK_GREEN, toolbar_rect, 4)
         
-        for button_info in layout['tower_buttons']:
+        for i, button_info in enumerate(layout['tower_buttons']):
             tower_type = button_info['type']
             rect = button_info['rect']
             
             # Check states
-            is_selected = selected_type == tower_type
+            is_selected = selected_name == tower_type['name']
             can_afford = money >= TOWER_COSTS[tower_type['name']]
-            is_hovered = rect.collidepoint(mx, my) and my < UI_HEIGHT
+            is_hovered = hovered == i
 
             if is_selected:
                 bg_color = FOREST_GREEN
@@ -470,87 +647,60 @@ class Game:
                 border_color = BROWN
                 text_color = DARK_GREEN
 
-            pygame.draw.rect(screen, bg_color, rect, border_radius=8)
-            pygame.draw.rect(screen, border_color, rect, 3, border_radius=8)
+            pygame.draw.rect(surface, bg_color, rect, border_radius=8)
+            pygame.draw.rect(surface, border_color, rect, 3, border_radius=8)
 
             image_area_height = 70
             image_area_width = rect.width - 12
 
-            cache_key = f"{tower_type['name']}_{image_area_width}_{image_area_height}_{can_afford}"
-            
-            if not hasattr(self, '_image_cache'):
-                self._image_cache = {}
-            
-            if cache_key in self._image_cache:
-                tower_image = self._image_cache[cache_key]
-                if tower_image:
-                    image_x = rect.x + (rect.width - tower_image.get_width()) // 2
-                    image_y = rect.y + 8
-                    screen.blit(tower_image, (image_x, image_y))
-            else:
-                original_image_path = get_library_path("tower", f"{tower_type['name']}.png")
+            tower_image = None
+            if tower_type['name'] not in self._missing_tower_images:
                 try:
-                    original_image = pygame.image.load(str(original_image_path))
-
-                    img_width = original_image.get_width()
-                    img_height = original_image.get_height()
-                    
-                    scale_x = image_area_width / img_width
-                    scale_y = image_area_height / img_height
-                    scale = min(scale_x, scale_y) * 0.9
-                    
-                    new_width = int(img_width * scale)
-                    new_height = int(img_height * scale)
-
-                    if can_afford:
-                        tower_image = pygame.transform.scale(original_image, (new_width, new_height))
-                    else:
-                        scaled_image = pygame.transform.scale(original_image, (new_width, new_height))
-                        tower_image = pygame.Surface((new_width, new_height), pygame.SRCALPHA)
-                        tower_image.fill((128, 128, 128, 180))  # Simple gray overlay
-                        tower_image.blit(scaled_image, (0, 0), special_flags=pygame.BLEND_MULT)
+                    original_image = assets.image(get_library_path("tower", f"{tower_type['name']}.png"))
+                except (pygame.error, FileNotFoundError) as e:
+                    # Remember the failure so redraws don't retry the load
+                    logger.error("Failed to load tower image %s: %s", tower_type['name'], e)
+                    self._missing_tower_images.add(tower_type['name'])
+                else:
+                    img_width, img_height = original_image.get_size()
+                    scale = min(image_area_width / img_width, image_area_height / img_height) * 0.9
+                    size = (int(img_width * scale), int(img_height * scale))
+                    # Unaffordable towers share the greyed-out variant with the rest of the game
+                    tower_image = SpriteVariants.get(original_image, size, None if can_afford else 'disabled')
 
-                    self._image_cache[cache_key] = tower_image
+            if tower_image is not None:
+                image_x = rect.x + (rect.width - tower_image.get_width()) // 2
+                image_y = rect.y + 8
+                surface.blit(tower_image, (image_x, image_y))
+            else:
+                center_x = rect.centerx
+                icon_y = rect.y + 35
+                icon_color = tower_type['color'] if can_afford else (120, 100, 80)
+                pygame.draw.circle(surface, icon_color, (center_x, icon_y), 22)
+                pygame.draw.circle(surface, border_color, (center_x, icon_y), 22, 3)
 
-                    image_x = rect.x + (rect.width - new_width) // 2
-                    image_y = rect.y + 8
-                    screen.blit(tower_image, (image_x, image_y))
-                    
-                except Exception as e:
-                    print(f"Failed to load tower image {tower_type['name']}: {e}")
-
-                    center_x = rect.centerx
-                    icon_y = rect.y + 35
-                    icon_color = tower_type['color'] if can_afford else (120, 100, 80)
-                    pygame.draw.circle(screen, icon_color, (center_x, icon_y), 22)
-                    pygame.draw.circle(screen, border_color, (center_x, icon_y), 22, 3)
-
-                    letter = tower_type['name'][0]
-                    letter_font = pygame.font.SysFont('Arial', 20, bold=True)
-                    letter_text = letter_font.render(letter, True, WHITE if can_afford else (80, 60, 40))
-                    letter_rect = letter_text.get_rect(center=(center_x, icon_y))
-                    screen.blit(letter_text, letter_rect)
-                    
-                    # Cache None to avoid repeated failed loads
-                    self._image_cache[cache_key] = None
+                letter = tower_type['name'][0]
+                letter_font = get_font('Arial', 20, bold=True)
+                letter_text = render_text(letter_font, letter, WHITE if can_afford else (80, 60, 40))
+                letter_rect = letter_text.get_rect(center=(center_x, icon_y))
+                surface.blit(letter_text, letter_rect)
             
             # Tower name
-            name_text = FONTS['button'].render(tower_type['name'], True, text_color)
+            name_text = render_text(FONTS['button'], tower_type['name'], text_color)
             name_x = rect.centerx - name_text.get_width()//2
             name_y = rect.y + rect.height - 38  # 调整位置
-            screen.blit(name_text, (name_x, name_y))
+            surface.blit(name_text, (name_x, name_y))
             
             # Price display
             cost_color = FOREST_GREEN if can_afford else (180, 80, 80)
-            cost_text = FONTS['small'].render(f"${TOWER_COSTS[tower_type['name']]}", True, cost_color)
+            cost_text = render_text(FONTS['small'], f"${TOWER_COSTS[tower_type['name']]}", cost_color)
             cost_x = rect.centerx - cost_text.get_width()//2
             cost_y = rect.y + rect.height - 18
-            screen.blit(cost_text, (cost_x, cost_y))
+            surface.blit(cost_text, (cost_x, cost_y))
         
         # Demolish button
         demolish_rect = layout['demolish_button']['rect']
-        is_demolish_active = selected_tower == "demolish_mode"
-        is_demolish_hovered = demolish_rect.collidepoint(mx, my) and my < UI_HEIGHT
+        is_demolish_hovered = hovered == "demolish"
         
         if is_demolish_active:
             bg_color = (200, 80, 80)
@@ -566,8 +716,8 @@ class Game:
             text_color = DARK_GREEN
         
         # Draw demolish card
-        pygame.draw.rect(screen, bg_color, demolish_rect, border_radius=8)
-        pygame.draw.rect(screen, border_color, demolish_rect, 3, border_radius=8)
+        pygame.draw.rect(surface, bg_color, demolish_rect, border_radius=8)
+        pygame.draw.rect(surface, border_color, demolish_rect, 3, border_radius=8)
         
         # Demolish icon - X symbol adjusted for larger size
         center_x, center_y = demolish_rect.center
@@ -577,23 +727,23 @@ class Game:
         line_color = text_color if not is_demolish_active else WHITE
         line_width = 4
         offset = 12
-        pygame.draw.line(screen, line_color, 
+        pygame.draw.line(surface, line_color, 
                         (center_x - offset, icon_y - offset), 
                         (center_x + offset, icon_y + offset), line_width)
-        pygame.draw.line(screen, line_color, 
+        pygame.draw.line(surface, line_color, 
                         (center_x + offset, icon_y - offset), 
                         (center_x - offset, icon_y + offset), line_width)
         
         # Demolish text
-        demolish_main = FONTS['small'].render("DEMOLISH", True, text_color)
+        demolish_main = render_text(FONTS['small'], "DEMOLISH", text_color)
         main_x = demolish_rect.centerx - demolish_main.get_width()//2
         main_y = demolish_rect.centery + 18
-        screen.blit(demolish_main, (main_x, main_y))
+        surface.blit(demolish_main, (main_x, main_y))
         
-        refund_text = FONTS['tiny'].render("50% Refund", True, text_color)
+        refund_text = render_text(FONTS['tiny'], "50% Refund", text_color)
         refund_x = demolish_rect.centerx - refund_text.get_width()//2
         refund_y = demolish_rect.y + demolish_rect.height - 16
-        screen.blit(refund_text, (refund_x, refund_y))
+        surface.blit(refund_text, (refund_x, refund_y))
         
         # Enhanced Info panel
         info_panel_x = screen_w - 280
@@ -602,23 +752,16 @@ class Game:
         info_panel_rect = pygame.Rect(info_panel_x, 10, info_panel_w, info_panel_h)
         
         # Beautiful info panel background with nature theme
-        # Gradient background - darker at top, lighter at bottom
-        for i in range(info_panel_h):
-            color_progress = i / info_panel_h
-            r = int(34 + (144 - 34) * color_progress)    # From dark green to light green
-            g = int(100 + (158 - 100) * color_progress)  # From dark green to light green
-            b = int(34 + (44 - 34) * color_progress)     # From dark green to light green
-            pygame.draw.line(screen, (r, g, b), 
-                           (info_panel_x, 10 + i), 
-                           (info_panel_x + info_panel_w, 10 + i))
+        # Gradient background - dark green at top, lighter at bottom
+        surface.blit(get_gradient((info_panel_w, info_panel_h), (34, 100, 34), (144, 158, 44)), (info_panel_x, 10))
         
         # Elegant border with rounded corners
-        pygame.draw.rect(screen, (245, 245, 220, 200), info_panel_rect, border_radius=15)
-        pygame.draw.rect(screen, (139, 115, 85), info_panel_rect, 3, border_radius=15)
+        pygame.draw.rect(surface, (245, 245, 220, 200), info_panel_rect, border_radius=15)
+        pygame.draw.rect(surface, (139, 115, 85), info_panel_rect, 3, border_radius=15)
         
         # Inner glow effect
         inner_rect = pygame.Rect(info_panel_x + 3, 13, info_panel_w - 6, info_panel_h - 6)
-        pygame.draw.rect(screen, (255, 255, 255, 60), inner_rect, 2, border_radius=12)
+        pygame.draw.rect(surface, (255, 255, 255, 60), inner_rect, 2, border_radius=12)
         
         # Status icons and text with better spacing
         def draw_status_item(icon_color, label, value, value_color, y_offset):
@@ -627,20 +770,20 @@ class Game:
             text_x = info_panel_x + 50
             
             # Draw icon background circle (no text inside)
-            pygame.draw.circle(screen, icon_color, (icon_x, icon_y), 12)
-            pygame.draw.circle(screen, (255, 255, 255, 100), (icon_x, icon_y), 12, 2)
+            pygame.draw.circle(surface, icon_color, (icon_x, icon_y), 12)
+            pygame.draw.circle(surface, (255, 255, 255, 100), (icon_x, icon_y), 12, 2)
             
             # Draw label and value with shadow
             shadow_offset = 1
             label_text = f"{label}: {value}"
             
             # Shadow
-            shadow_surface = FONTS['button'].render(label_text, True, (0, 0, 0, 120))
-            screen.blit(shadow_surface, (text_x + shadow_offset, icon_y - 8 + shadow_offset))
+            shadow_surface = render_text(FONTS['button'], label_text, (0, 0, 0, 120))
+            surface.blit(shadow_surface, (text_x + shadow_offset, icon_y - 8 + shadow_offset))
             
             # Main text
-            text_surface = FONTS['button'].render(label_text, True, value_color)
-            screen.blit(text_surface, (text_x, icon_y - 8))
+            text_surface = render_text(FONTS['button'], label_text, value_color)
+            surface.blit(text_surface, (text_x, icon_y - 8))
         
         # Money status
         money_color = (34, 139, 34) if money >= 50 else (184, 134, 11)
@@ -652,19 +795,24 @@ class Game:
         
         # Level name status
         draw_status_item((70, 130, 180), "Level", level_name, (25, 25, 112), 60)
-        
-        # Menu button - moved to bottom right corner
-        menu_button_rect = pygame.Rect(screen_w - 100, screen_h - 60, 80, 40)
-        menu_hovered = menu_button_rect.collidepoint(mx, my)
+
+        return surface
+
+    def render_menu_button(self, state):
+        """Render the menu button widget (bottom right corner)"""
+        menu_hovered, = state
+        surface = new_layer((80, 40))
+        menu_button_rect = surface.get_rect()
         menu_color = (200, 100, 100) if menu_hovered else BROWN
         
-        pygame.draw.rect(screen, menu_color, menu_button_rect, border_radius=8)
-        pygame.draw.rect(screen, DARK_GREEN, menu_button_rect, 2, border_radius=8)
+        pygame.draw.rect(surface, menu_color, menu_button_rect, border_radius=8)
+        pygame.draw.rect(surface, DARK_GREEN, menu_button_rect, 2, border_radius=8)
         
-        menu_text = FONTS['small'].render("MENU", True, WHITE)
+        menu_text = render_text(FONTS['small'], "MENU", WHITE)
         menu_x = menu_button_rect.centerx - menu_text.get_width()//2
         menu_y = menu_button_rect.centery - menu_text.get_height()//2
-        screen.blit(menu_text, (menu_x, menu_y))
+        surface.blit(menu_text, (menu_x, menu_y))
+        return surface
 
     def draw_wave_panel(self, screen, screen_size, level):
         """Draw wave information panel on top of everything"""
@@ -679,21 +827,21 @@ class Game:
         pygame.draw.rect(screen, UI_ACCENT, wave_panel_rect, 2, border_radius=8)
         
         # Wave title
-        wave_title = FONTS['button'].render(f"Wave {level.current_wave}", True, UI_ACCENT)
+        wave_title = render_text(FONTS['button'], f"Wave {level.current_wave}", UI_ACCENT)
         screen.blit(wave_title, (wave_panel_x + 10, wave_panel_y + 5))
         
         # Wave progress
         if level.in_preparation and not level.first_wave_started:
             time_left = level.preparation_time - level.preparation_timer
-            countdown_text = FONTS['small'].render(f"First wave in: {time_left:.1f}s", True, (255, 100, 100))
+            countdown_text = render_text(FONTS['small'], f"First wave in: {time_left:.1f}s", (255, 100, 100))
             screen.blit(countdown_text, (wave_panel_x + 10, wave_panel_y + 30))
         elif level.in_wave_break:
             time_left = level.wave_break_duration - level.wave_break_timer
-            countdown_text = FONTS['small'].render(f"Next wave in: {time_left:.1f}s", True, UI_WARNING)
+            countdown_text = render_text(FONTS['small'], f"Next wave in: {time_left:.1f}s", UI_WARNING)
             screen.blit(countdown_text, (wave_panel_x + 10, wave_panel_y + 30))
         else:
             living_enemies = len([e for e in level.enemies if hasattr(e, 'health') and e.health > 0])
-            progress_text = FONTS['small'].render(f"Enemies: {level.enemies_spawned_this_wave}/{level.enemies_in_wave} (Alive: {living_enemies})", True, WHITE)
+            progress_text = render_text(FONTS['small'], f"Enemies: {level.enemies_spawned_this_wave}/{level.enemies_in_wave} (Alive: {living_enemies})", WHITE)
             screen.blit(progress_text, (wave_panel_x + 10, wave_panel_y + 30))
 
     def draw_wave_message(self, screen, screen_size, message):
@@ -701,7 +849,7 @@ class Game:
         """Optimized with ChatGPT-4o"""
         screen_w, screen_h = screen_size
 
-        main_text = FONTS['title'].render(message, True, WHITE)
+        main_text = render_text(FONTS['title'], message, WHITE)
         text_w, text_h = main_text.get_size()
 
         panel_w = text_w + 100
@@ -719,12 +867,103 @@ class Game:
         text_x = panel_x + (panel_w - text_w) // 2
         text_y = panel_y + (panel_h - text_h) // 2
 
-        shadow_text = FONTS['title'].render(message, True, (0, 0, 0))
+        shadow_text = render_text(FONTS['title'], message, (0, 0, 0))
         screen.blit(shadow_text, (text_x + 2, text_y + 2))
 
-        main_text_render = FONTS['title'].render(message, True, (255, 250, 240))
+        main_text_render = render_text(FONTS['title'], message, (255, 250, 240))
         screen.blit(main_text_render, (text_x, text_y))
 
+    def get_hud_rects(self, screen_size):
+        """Screen regions covered by the toolbar, the wave panel and the menu button"""
+        screen_w, screen_h = screen_size
+        demolish_rect = self.get_toolbar_layout(screen_w, screen_h)['demolish_button']['rect']
+        return [
+            pygame.Rect(0, 0, screen_w, UI_HEIGHT).union(demolish_rect),
+            pygame.Rect(25, screen_h - 125, 380, 100),
+            pygame.Rect(screen_w - 100, screen_h - 60, 80, 40),
+        ]
+
+    def draw_debug_overlay(self, screen, clock, level, bullets, renderer=None):
+        """Draw live runtime counters, frame profile and frame-time graph in the top-left corner of the map (toggle with F3)"""
+        now = pygame.time.get_ticks()
+        if self._debug_lines is None or now - self._debug_refresh_ticks >= PROFILER_REFRESH * 1000:
+            self._debug_lines = self.get_debug_lines(screen, clock, level, bullets, renderer)
+            self._debug_refresh_ticks = now
+
+        panel_rect = self.debug_panel_widget.draw(screen, (10, UI_HEIGHT + 10), self._debug_lines)
+        graph_rect = self.draw_frame_graph(screen, (10, panel_rect.bottom + 4))
+        return panel_rect.union(graph_rect)
+
+    def get_debug_lines(self, screen, clock, level, bullets, renderer=None):
+        """Text lines of the debug overlay"""
+        pool_stats = BulletFactory.get_pool_stats()
+        effect_stats = effect_system.get_stats()
+        (frame_avg, frame_worst), section_stats = profiler.summary()
+        lines = [
+            f"FPS: {clock.get_fps():.0f}",
+            f"Frame: {frame_avg:.1f} ms avg, {frame_worst:.1f} ms worst (budget {1000 / FPS:.1f} ms)",
+        ]
+        for name, (section_avg, section_worst) in section_stats.items():
+            lines.append(f"    {name}: {section_avg:.2f} ms (max {section_worst:.1f})")
+        lines += [
+            f"Enemies: {len(level.enemies)}",
+            f"Bullets: {len(bullets)} active",
+            f"Bullet pool: {pool_stats['in_use']} in use / {pool_stats['free']} free (peak {pool_stats['high_water']})",
+            f"Projectiles: {BulletFactory.projectile_mode}, {len(BulletFactory.scheduler)} impacts pending",
+            f"Effects: {effect_stats['active']} / {effect_stats['cap']} (dropped {effect_stats['dropped']})",
+        ]
+        if self.use_dirty_rects and renderer is not None:
+            screen_w, screen_h = screen.get_size()
+            dirty_share = renderer.last_dirty_area * 100 // max(1, screen_w * screen_h)
+            lines.append(f"Dirty rects: {dirty_share}% of window redrawn (F4 toggles)")
+        if self.camera.active:
+            lines.append(f"Camera: {self.camera.zoom:.2f}x zoom (wheel zooms, right-drag/arrows pan, Home resets)")
+        render_w, render_h = screen.get_size()
+        auto = " auto" if self.render_scaler.auto else ""
+        lines.append(f"Render scale: {self.render_scaler.scale:.0%} ({render_w}x{render_h}{auto}, F5 cycles)")
+        if metrics.enabled:
+            lines.append("Metrics this wave:")
+            for name, value in sorted(metrics.counters.items()):
+                lines.append(f"    {name}: {value}")
+            for name, (calls, total_ms, worst_ms) in sorted(metrics.timers.items()):
+                lines.append(f"    {name}: {calls} calls, {total_ms / calls:.2f} ms avg (max {worst_ms:.1f})")
+        return tuple(lines)
+
+    def render_debug_panel(self, lines):
+        """Render the debug overlay text panel"""
+        font = FONTS['tiny']
+        line_h = font.get_linesize()
+        panel_w = max(font.size(line)[0] for line in lines) + 16
+        panel_h = line_h * len(lines) + 12
+
+        panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+        for i, line in enumerate(lines):
+            # Not through the text cache - these numbers change constantly and would evict everything else
+            panel.blit(font.render(line, True, WHITE), (8, 6 + i * line_h))
+        return panel
+
+    def draw_frame_graph(self, screen, pos):
+        """Draw the recent frame times as a line graph with the frame budget marked; returns its rect"""
+        graph_w, graph_h = profiler.history * 2, 60
+        if self._frame_graph_bg is None:
+            self._frame_graph_bg = pygame.Surface((graph_w, graph_h), pygame.SRCALPHA)
+            self._frame_graph_bg.fill((0, 0, 0, 160))
+        graph_rect = screen.blit(self._frame_graph_bg, pos)
+
+        # The graph's height is two frame budgets; slower frames are drawn at the top
+        budget_ms = 1000 / FPS
+        x, y = pos
+        budget_y = y + graph_h // 2
+        pygame.draw.line(screen, UI_WARNING, (x, budget_y), (x + graph_w - 1, budget_y))
+
+        frame_times = profiler.recent_frame_times()
+        if len(frame_times) > 1:
+            points = [(x + i * 2, y + graph_h - 1 - min(graph_h - 1, int(ms / (2 * budget_ms) * graph_h)))
+                      for i, ms in enumerate(frame_times)]
+            pygame.draw.lines(screen, UI_SUCCESS, False, points)
+        return graph_rect
+
     def draw_game_over_screen(self, screen, screen_size, victory=False):
         """Draw game over screen with clear text and dynamic background"""
         """Enhanced with ChatGPT-4o"""
@@ -763,6 +1002,9 @@ class Game:
         panel_w = max_width + 120
         panel_h = 250
         
+        # Background panel with strong contrast - built once at the resting size
+        panel_surface = get_gradient((panel_w, panel_h), (*bg_color, 220), (*bg_color, 190))
+        
         # Breathing effect for panel
         breath = 1.0 + 0.05 * math.sin(time_factor * 3)
         panel_w = int(panel_w * breath)
@@ -771,15 +1013,8 @@ class Game:
         panel_x = (screen_w - panel_w) // 2
         panel_y = (screen_h - panel_h) // 2
         
-        # Multi-layer background panel
-        
-        # Background panel with strong contrast
-        panel_surface = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        for i in range(panel_h):
-            alpha = 220 - (i / panel_h) * 30
-            color = (*bg_color, int(alpha))
-            pygame.draw.line(panel_surface, color, (0, i), (panel_w, i))
-        
+        if panel_surface.get_size() != (panel_w, panel_h):
+            panel_surface = pygame.transform.scale(panel_surface, (panel_w, panel_h))
         screen.blit(panel_surface, (panel_x, panel_y))
         
         # Animated border
@@ -794,25 +1029,25 @@ class Game:
         title_y = panel_y + 50
         
         # Shadow
-        shadow_text = FONTS['title'].render(title_text, True, (0, 0, 0))
+        shadow_text = render_text(FONTS['title'], title_text, (0, 0, 0))
         screen.blit(shadow_text, (screen_w // 2 - title_size[0] // 2 + 3, title_y + 3))
         
         # Outline
         for dx in [-2, -1, 0, 1, 2]:
             for dy in [-2, -1, 0, 1, 2]:
                 if dx != 0 or dy != 0:
-                    outline_text = FONTS['title'].render(title_text, True, (0, 0, 0))
+                    outline_text = render_text(FONTS['title'], title_text, (0, 0, 0))
                     screen.blit(outline_text, (screen_w // 2 - title_size[0] // 2 + dx, title_y + dy))
         
         # Main title
-        title = FONTS['title'].render(title_text, True, title_color)
+        title = render_text(FONTS['title'], title_text, title_color)
         screen.blit(title, (screen_w // 2 - title_size[0] // 2, title_y))
         
         # Subtitle
         subtitle_y = title_y + 60
-        subtitle_surface = FONTS['hud'].render(subtitle, True, (0, 0, 0))
+        subtitle_surface = render_text(FONTS['hud'], subtitle, (0, 0, 0))
         screen.blit(subtitle_surface, (screen_w // 2 - subtitle_size[0] // 2 + 2, subtitle_y + 2))
-        subtitle_surface = FONTS['hud'].render(subtitle, True, (220, 220, 220))
+        subtitle_surface = render_text(FONTS['hud'], subtitle, (220, 220, 220))
         screen.blit(subtitle_surface, (screen_w // 2 - subtitle_size[0] // 2, subtitle_y))
         
         # Instructions
@@ -821,16 +1056,19 @@ class Game:
         instruction_text = "Press ESC to return to menu"
         
         # Shadow
-        instruction_shadow = FONTS['button'].render(instruction_text, True, (0, 0, 0))
+        instruction_shadow = render_text(FONTS['button'], instruction_text, (0, 0, 0))
         screen.blit(instruction_shadow, (screen_w // 2 - instruction_size[0] // 2 + 2, instruction_y + 2))
         
         # Main text
-        instruction = FONTS['button'].render(instruction_text, True, (255, 255, 255))
+        instruction = render_text(FONTS['button'], instruction_text, (255, 255, 255))
         screen.blit(instruction, (screen_w // 2 - instruction_size[0] // 2, instruction_y))
 
     def draw_wave_panel_with_timing(self, screen, screen_size, level, current_game_time):
-        """Draw beautiful wave panel with forest theme"""
-        """Enhanced with ChatGPT-4o, but lots of changes made by myself"""
+        """Draw beautiful wave panel with forest theme
+
+        The panel is a retained widget re-rendered only when its text changes
+        (the timers are shown to 0.1 s); just the status indicator is drawn live.
+        """
         screen_w, screen_h = screen_size
         
         # Calculate content
@@ -857,46 +1095,64 @@ class Game:
             status_text = "All waves completed!"
             status_color = (50, 205, 50)  # Lime green for completion
 
+        panel_x = 25
+        panel_y = screen_h - 100 - 25
+        self.wave_panel_widget.draw(screen, (panel_x, panel_y), (wave_text, status_text, status_color, time_text))
+
+        # Status indicator circle
+        indicator_x = panel_x + 20
+        indicator_y = panel_y + 45 + 8
+        
+        # Draw status indicator based on current state
+        if level.in_preparation and not level.first_wave_started:
+            # Preparation indicator - pulsing orange circle
+            pulse = int(128 + 127 * abs(math.sin(pygame.time.get_ticks() / 300)))
+            pygame.draw.circle(screen, (255, pulse, 0), (indicator_x, indicator_y), 6)
+        elif level.in_wave_break:
+            # Break indicator - steady yellow circle
+            pygame.draw.circle(screen, (255, 215, 0), (indicator_x, indicator_y), 6)
+        elif not level.all_waves_complete:
+            # Combat indicator - pulsing red circle
+            pulse = int(128 + 127 * abs(math.sin(pygame.time.get_ticks() / 200)))
+            pygame.draw.circle(screen, (pulse, 64, 64), (indicator_x, indicator_y), 6)
+        else:
+            # Complete indicator - steady green circle
+            pygame.draw.circle(screen, (50, 205, 50), (indicator_x, indicator_y), 6)
+        
+        # White border for indicator
+        pygame.draw.circle(screen, (255, 255, 255), (indicator_x, indicator_y), 6, 2)
+
+    def render_wave_panel(self, state):
+        """Render the wave panel widget: background, wave title, status and time text"""
+        """Enhanced with ChatGPT-4o, but lots of changes made by myself"""
+        wave_text, status_text, status_color, time_text = state
         
         # Optimized panel sizing
         panel_w = 380
         panel_h = 100
-        panel_x = 25
-        panel_y = screen_h - panel_h - 25
+        panel_x = 0
+        panel_y = 0
         
         # Beautiful gradient background
-        panel_surface = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        
-        # Multi-layer gradient for depth
-        for i in range(panel_h):
-            progress = i / panel_h
-            r = int(25 + (45 - 25) * progress)
-            g = int(60 + (80 - 60) * progress) 
-            b = int(25 + (35 - 25) * progress)
-            alpha = int(240 - 20 * progress)
-            
-            color = (r, g, b, alpha)
-            pygame.draw.line(panel_surface, color, (0, i), (panel_w, i))
-        
-        screen.blit(panel_surface, (panel_x, panel_y))
+        surface = get_gradient((panel_w, panel_h), (25, 60, 25, 240), (45, 80, 35, 220)).copy()
         
         # Elegant frame and inner highlight
         frame_color = (139, 115, 85)  # Woodland brown
-        pygame.draw.rect(screen, frame_color, (panel_x, panel_y, panel_w, panel_h), 4, border_radius=15)
+        pygame.draw.rect(surface, frame_color, (panel_x, panel_y, panel_w, panel_h), 4, border_radius=15)
         
-        # Inner glow
+        # Inner glow - opaque, as it always was on the display surface
         inner_glow_rect = (panel_x + 3, panel_y + 3, panel_w - 6, panel_h - 6)
-        pygame.draw.rect(screen, (255, 255, 255, 80), inner_glow_rect, 2, border_radius=12)
+        pygame.draw.rect(surface, WHITE, inner_glow_rect, 2, border_radius=12)
         
         # Enhanced text rendering with shadows and better positioning
         def draw_enhanced_text(text, font, color, x, y, shadow_color=(0, 0, 0), shadow_offset=2):
             # Enhanced shadow
-            shadow_surface = font.render(text, True, shadow_color)
-            screen.blit(shadow_surface, (x + shadow_offset, y + shadow_offset))
+            shadow_surface = render_text(font, text, shadow_color)
+            surface.blit(shadow_surface, (x + shadow_offset, y + shadow_offset))
             
             # Main text
-            text_surface = font.render(text, True, color)
-            screen.blit(text_surface, (x, y))
+            text_surface = render_text(font, text, color)
+            surface.blit(text_surface, (x, y))
             return text_surface
         
         # Wave title with large font
@@ -904,33 +1160,10 @@ class Game:
         wave_title_y = panel_y + 15
         draw_enhanced_text(wave_text, FONTS['button'], (255, 255, 240), wave_title_x, wave_title_y)
         
-        # Status section with indicator circles (no emoji)
+        # Status section
         status_x = panel_x + 20
         status_y = panel_y + 45
         
-        # Status indicator circle
-        indicator_x = status_x
-        indicator_y = status_y + 8
-        
-        # Draw status indicator based on current state
-        if level.in_preparation and not level.first_wave_started:
-            # Preparation indicator - pulsing orange circle
-            pulse = int(128 + 127 * abs(math.sin(pygame.time.get_ticks() / 300)))
-            pygame.draw.circle(screen, (255, pulse, 0), (indicator_x, indicator_y), 6)
-        elif level.in_wave_break:
-            # Break indicator - steady yellow circle
-            pygame.draw.circle(screen, (255, 215, 0), (indicator_x, indicator_y), 6)
-        elif not level.all_waves_complete:
-            # Combat indicator - pulsing red circle
-            pulse = int(128 + 127 * abs(math.sin(pygame.time.get_ticks() / 200)))
-            pygame.draw.circle(screen, (pulse, 64, 64), (indicator_x, indicator_y), 6)
-        else:
-            # Complete indicator - steady green circle
-            pygame.draw.circle(screen, (50, 205, 50), (indicator_x, indicator_y), 6)
-        
-        # White border for indicator
-        pygame.draw.circle(screen, (255, 255, 255), (indicator_x, indicator_y), 6, 2)
-        
         # Status text
         status_text_x = status_x + 20
         draw_enhanced_text(status_text, FONTS['small'], status_color, status_text_x, status_y)
@@ -941,13 +1174,15 @@ class Game:
         
         # Time indicator circle
         time_indicator_color = (100, 149, 237)  # Cornflower blue
-        pygame.draw.circle(screen, time_indicator_color, (time_x, time_y + 8), 6)
-        pygame.draw.circle(screen, (255, 255, 255), (time_x, time_y + 8), 6, 2)
+        pygame.draw.circle(surface, time_indicator_color, (time_x, time_y + 8), 6)
+        pygame.draw.circle(surface, (255, 255, 255), (time_x, time_y + 8), 6, 2)
         
         # Time text
         time_text_x = time_x + 20
         draw_enhanced_text(time_text, FONTS['small'], (173, 216, 230), time_text_x, time_y)
 
+        return surface
+
     def draw_victory_screen(self, screen, screen_size, current_game_time, best_time, is_new_best_time):
         """Draw elegant victory screen with sophisticated golden effects"""
         screen_w, screen_h = screen_size
@@ -1024,6 +1259,13 @@ class Game:
         panel_w = max_width + 160
         panel_h = 420 if celebration_text else 380
         
+        # Sophisticated background panel with rich gradient, built once at the resting size
+        # Create luxurious gradient, warmer towards the bottom
+        base_r, base_g, base_b = panel_base_color
+        panel_surface = get_gradient((panel_w, panel_h),
+                                     (base_r + 30, base_g + 25, base_b + 10, 245),
+                                     (base_r + 50, base_g + 40, base_b + 15, 220))
+        
         # Elegant pulsing effect for celebration
         if is_new_best_time:
             pulse = 1.0 + 0.06 * math.sin(time_factor * 4)
@@ -1033,19 +1275,8 @@ class Game:
         panel_x = (screen_w - panel_w) // 2
         panel_y = (screen_h - panel_h) // 2
         
-        # Sophisticated background panel with rich gradient
-        panel_surface = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        
-        # Create luxurious gradient
-        for i in range(panel_h):
-            progress = i / panel_h
-            alpha = 245 - (progress * 25)
-            gold_r = panel_base_color[0] + int(30 + progress * 20)
-            gold_g = panel_base_color[1] + int(25 + progress * 15)
-            gold_b = panel_base_color[2] + int(10 + progress * 5)
-            bg_color = (gold_r, gold_g, gold_b, int(alpha))
-            pygame.draw.line(panel_surface, bg_color, (0, i), (panel_w, i))
-        
+        if panel_surface.get_size() != (panel_w, panel_h):
+            panel_surface = pygame.transform.scale(panel_surface, (panel_w, panel_h))
         screen.blit(panel_surface, (panel_x, panel_y))
         
         # Spectacular multi-layer glow system
@@ -1082,7 +1313,7 @@ class Game:
         # Enhanced text rendering function
         def draw_luxury_text(text, font, color, x, y, center=True):
             # Calculate position
-            text_surface = font.render(text, True, color)
+            text_surface = render_text(font, text, color)
             if center:
                 text_x = x - text_surface.get_width() // 2
             else:
@@ -1091,14 +1322,14 @@ class Game:
             # Multiple shadow layers for depth
             for offset in range(4, 0, -1):
                 shadow_alpha = 150 - offset * 30
-                shadow_text = font.render(text, True, (0, 0, 0, shadow_alpha))
+                shadow_text = render_text(font, text, (0, 0, 0, shadow_alpha))
                 screen.blit(shadow_text, (text_x + offset, y + offset))
             
             # Elegant outline for definition
             for dx in [-1, 0, 1]:
                 for dy in [-1, 0, 1]:
                     if dx != 0 or dy != 0:
-                        outline_text = font.render(text, True, (20, 15, 5))
+                        outline_text = render_text(font, text, (20, 15, 5))
                         screen.blit(outline_text, (text_x + dx, y + dy))
             
             # Main text with luxury appearance
@@ -1182,16 +1413,7 @@ class Game:
         screen.blit(overlay, (0, 0))
         
         # Panel background with forest theme gradient
-        panel_surface = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        for i in range(panel_h):
-            progress = i / panel_h
-            r = int(40 + (70 - 40) * progress)
-            g = int(80 + (120 - 80) * progress)
-            b = int(40 + (50 - 40) * progress)
-            alpha = int(240 - 20 * progress)
-            color = (r, g, b, alpha)
-            pygame.draw.line(panel_surface, color, (0, i), (panel_w, i))
-        
+        panel_surface = get_gradient((panel_w, panel_h), (40, 80, 40, 240), (70, 120, 50, 220))
         screen.blit(panel_surface, (panel_x, panel_y))
         
         # Panel border
@@ -1201,12 +1423,12 @@ class Game:
         # Enhanced text drawing function
         def draw_message_text(text, font, color, y_pos, center_x=panel_x + panel_w // 2):
             # Shadow
-            shadow_text = font.render(text, True, (0, 0, 0))
+            shadow_text = render_text(font, text, (0, 0, 0))
             shadow_rect = shadow_text.get_rect(center=(center_x + 2, y_pos + 2))
             screen.blit(shadow_text, shadow_rect)
             
             # Main text
-            text_surface = font.render(text, True, color)
+            text_surface = render_text(font, text, color)
             text_rect = text_surface.get_rect(center=(center_x, y_pos))
             screen.blit(text_surface, text_rect)
         
@@ -1217,6 +1439,7 @@ class Game:
         draw_message_text(timer_text, FONTS['button'], (144, 238, 144), panel_y + 170)
 
     def run(self):
+        show_loading_screen('startup')
         while True:
             if self.state == "menu":
                 main_menu = MainMenu()
@@ -1234,6 +1457,7 @@ class Game:
                     self.state = "menu"
                     
             elif self.state == "library":
+                show_loading_screen('library')
                 character_library = CharacterLibrary()
                 result = character_library.run()
                 
@@ -1253,7 +1477,10 @@ class Game:
                     self.current_level_file = selected_level  # Store level file path
                     level_data = self.load_level_from_file(selected_level)
                     if level_data:
+                        show_loading_screen('game')
                         result = self.run_game_loop(level_data)
+                        self.render_scaler.release()
+                        self.camera.reset()
                         if result == "quit":
                             pygame.quit()
                             sys.exit()
@@ -0,0 +1,83 @@
+"""Levelled logging per subsystem, written to the console and a rotating file off the game thread"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+from settings import *
+from resource_manager import ResourceManager
+
+
+ROOT_LOGGER = "forest_guard"
+
+_listener = None
+_queue_handler = None
+
+
+def setup_logging():
+    """Send every subsystem's records through a queue to a background writer thread
+
+    The game thread only formats a record and puts it on the queue; console
+    and file writes (slow on Windows consoles and in packaged builds) happen
+    on the listener thread. Safe to call more than once.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(LOG_LEVEL)
+    root.propagate = False
+    for subsystem, level in LOG_LEVELS.items():
+        logging.getLogger(f"{ROOT_LOGGER}.{subsystem}").setLevel(level)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(LOG_CONSOLE_LEVEL)
+    console_handler.setFormatter(logging.Formatter("[%(subsystem)s] %(message)s"))
+    handlers = [console_handler]
+
+    log_path = ResourceManager.get_writable_path() / LOG_DIR / LOG_FILE
+    file_error = None
+    try:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8', delay=True)
+        file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(subsystem)s: %(message)s"))
+        handlers.append(file_handler)
+    except OSError as e:
+        file_error = e
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _queue_handler.addFilter(_add_subsystem)
+    root.addHandler(_queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+    if file_error is not None:
+        root.warning("Could not open log file %s: %s", log_path, file_error)
+
+
+def stop_logging():
+    """Write out any queued records and stop the writer thread"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    logging.getLogger(ROOT_LOGGER).removeHandler(_queue_handler)
+    _listener.stop()
+    _listener = _queue_handler = None
+
+
+def get_logger(subsystem):
+    """Logger for a subsystem, e.g. get_logger('audio')"""
+    setup_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}")
+
+
+def _add_subsystem(record):
+    """Short subsystem name for the formatters, 'forest_guard.audio' -> 'audio'"""
+    record.subsystem = record.name.rpartition('.')[2]
+    return True
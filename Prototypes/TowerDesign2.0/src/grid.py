@@ -1,19 +1,10 @@
-import json, os
 from settings import GRID_W, GRID_H
 from resource_manager import ResourceManager
+from level_format import load_level
 
 def load_grid(filename: str) -> list[list[int]]:
     """Load 0/1 grid from levels/filename (must be 20×15)."""
-    try:
-        level_path = ResourceManager.get_level_path(filename)
-        with open(level_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data['grid']
-    except UnicodeDecodeError:
-        level_path = ResourceManager.get_level_path(filename)
-        with open(level_path, 'r', encoding='utf-8-sig') as f:
-            data = json.load(f)
-        return data['grid']
+    return load_level(ResourceManager.get_level_path(filename))['grid']
 
 # Create a default empty grid (all grass)
 GRID_MAP: list[list[int]] = [[1 for _ in range(GRID_W)] for _ in range(GRID_H)]
@@ -0,0 +1,53 @@
+"""Retained-mode HUD widgets that keep their rendered surface until their state changes"""
+
+import pygame
+
+
+# Pixels left in this colour are see-through when a layer is blitted
+HUD_COLORKEY = (255, 0, 255)
+
+
+def new_layer(size):
+    """Opaque surface that is transparent wherever nothing is drawn on it
+
+    Drawing on an opaque surface gives exactly the same pixels as drawing
+    straight onto the screen, unlike a per-pixel alpha surface.
+    """
+    layer = pygame.Surface(size)
+    if pygame.display.get_surface():
+        layer = layer.convert()
+    layer.fill(HUD_COLORKEY)
+    layer.set_colorkey(HUD_COLORKEY)
+    return layer
+
+
+class HudWidget:
+    """A piece of HUD drawn from a cached surface
+
+    `render` builds the surface from a state tuple holding everything the
+    widget shows (money, HP, selection, formatted timer text, ...). The
+    surface is kept and blitted every frame until the state differs from
+    the one it was rendered with.
+    """
+
+    def __init__(self, render):
+        self.render = render
+        self.surface = None
+        self.state = None
+        self.renders = 0  # How many times the surface was rebuilt, for profiling
+
+    def invalidate(self):
+        """Force a rebuild on the next draw, e.g. after assets change"""
+        self.surface = None
+        self.state = None
+
+    def get_surface(self, state):
+        if self.surface is None or state != self.state:
+            self.surface = self.render(state)
+            self.state = state
+            self.renders += 1
+        return self.surface
+
+    def draw(self, screen, pos, state):
+        """Blit the widget at pos, re-rendering it first if state changed; returns the drawn rect"""
+        return screen.blit(self.get_surface(state), pos)
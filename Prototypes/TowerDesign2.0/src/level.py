@@ -2,8 +2,13 @@ import pygame
 import random
 from settings import *
 from enemy import EnemyFactory, EnemyWithGrid
+from sprite_variants import SpriteVariants, TINTS
 from pathfinding import a_star
+from metrics import metrics
 from grid import GRID_MAP
+from game_logging import get_logger
+
+logger = get_logger('level')
 
 class Level:
     def __init__(self):
@@ -54,7 +59,8 @@ class Level:
             self.enemy_speed = settings.get('enemy_speed', 50)
             self.base_hp = settings.get('base_hp', 10)
             self.best_time = settings.get('best_time', None)
-            print(f"Level settings: Money=${self.initial_money}, Waves={self.total_waves}, Speed={self.enemy_speed}, Base HP={self.base_hp}")
+            logger.info("Level settings: Money=$%d, Waves=%d, Speed=%s, Base HP=%d",
+                        self.initial_money, self.total_waves, self.enemy_speed, self.base_hp)
         else:
 
             self.initial_money = STARTING_MONEY
@@ -72,16 +78,16 @@ class Level:
         self.start = self.find_start_point(grid_to_use)
         self.end = self.find_end_point(grid_to_use)
         
-        print(f"Level: Start point {self.start}, End point {self.end}")  # Debug info
+        logger.debug("Start point %s, End point %s", self.start, self.end)
         
         # Calculate path
         self.path = a_star(self.start, self.end, grid_to_use)
         if not self.path:
             # If pathfinding fails, create a simple straight path
             self.path = [self.start, self.end]
-            print(f"Level: Pathfinding failed, using simple path")
+            logger.warning("Pathfinding failed, using simple path")
         else:
-            print(f"Level: Pathfinding successful, path length {len(self.path)}")
+            logger.debug("Pathfinding successful, path length %d", len(self.path))
     
     def find_start_point(self, grid):
         """Find start point (path tile) from the first row"""
@@ -133,7 +139,7 @@ class Level:
         random.shuffle(self.current_enemy_queue)
         self.enemy_spawn_index = 0
         
-        print(f"Wave {self.current_wave} composition: {self.wave_composition}")
+        logger.info("Wave %d composition: %s", self.current_wave, self.wave_composition)
 
     def update(self, dt):
         # Update enemies
@@ -145,7 +151,7 @@ class Level:
             if self.preparation_timer >= self.preparation_time:
                 self.in_preparation = False
                 self.first_wave_started = True
-                print(f"Preparation time complete! Wave {self.current_wave} starting!")
+                logger.info("Preparation time complete! Wave %d starting!", self.current_wave)
         
         # Count living enemies (not dead or reached end)
         living_enemies = [e for e in self.enemies if hasattr(e, 'health') and e.health > 0]
@@ -157,7 +163,7 @@ class Level:
             self.wave_complete = True
             self.in_wave_break = True
             self.wave_break_timer = 0.0
-            print(f"Wave {self.current_wave} completed! All {self.enemies_in_wave} enemies defeated!")
+            logger.info("Wave %d completed! All %d enemies defeated!", self.current_wave, self.enemies_in_wave)
         
         # Check if all waves are complete
         if self.wave_complete and self.current_wave >= self.total_waves:
@@ -180,7 +186,7 @@ class Level:
                 # Prepare new wave composition
                 self.prepare_wave_composition()
                 
-                print(f"Wave {self.current_wave} starting! {self.enemies_in_wave} enemies, {self.delay:.2f}s delay")
+                logger.info("Wave %d starting! %d enemies, %.2fs delay", self.current_wave, self.enemies_in_wave, self.delay)
         
         # Spawn enemies if not in wave break, not in preparation, and haven't spawned all enemies for this wave
         if (not self.in_wave_break and not self.in_preparation and 
@@ -203,7 +209,7 @@ class Level:
                             if path:
                                 enemy = EnemyFactory.create_enemy(enemy_type, path, None, self.current_wave)
                             else:
-                                print(f"Failed to create path for {enemy_type}, skipping")
+                                logger.warning("Failed to create path for %s, skipping", enemy_type)
                                 return
                         else:
                             # Use global grid
@@ -221,7 +227,8 @@ class Level:
                         
                         self.enemies.add(enemy)
                         self.enemies_spawned_this_wave += 1
-                        print(f"Spawned {enemy_type} {self.enemies_spawned_this_wave}/{self.enemies_in_wave}")
+                        metrics.count('enemies.spawned')
+                        logger.debug("Spawned %s %d/%d", enemy_type, self.enemies_spawned_this_wave, self.enemies_in_wave)
 
 
     def start_first_wave(self):
@@ -255,14 +262,19 @@ class Level:
                     pygame.draw.rect(surf, GREEN, front)
                 
                 # Flash effect
-                if hasattr(e, 'hit_flash') and e.hit_flash > 0:
-                    overlay = pygame.Surface((e.rect.w, e.rect.h), pygame.SRCALPHA)
-                    overlay.fill((255, 255, 255, 120))
-                    surf.blit(overlay, e.rect.topleft)
-                elif hasattr(e, 'flash_time') and e.flash_time > 0:
-                    overlay = pygame.Surface((e.rect.w, e.rect.h), pygame.SRCALPHA)
-                    overlay.fill((255, 255, 255, 120))
-                    surf.blit(overlay, e.rect.topleft)
+                if getattr(e, 'hit_flash', 0) > 0 or getattr(e, 'flash_time', 0) > 0:
+                    surf.blit(SpriteVariants.get_overlay(e.rect.size, TINTS['flash']), e.rect.topleft)
+
+    def queue_draw(self, draw_list):
+        """Queue every enemy on a DrawList instead of drawing them one by one"""
+        for e in self.enemies:
+            e.queue_draw(draw_list)
+
+    def refresh_positions(self):
+        """Move every enemy's rect to its world position, e.g. after the camera moved while paused"""
+        for e in self.enemies:
+            if hasattr(e, '_update_position_and_size'):
+                e._update_position_and_size()
 
     def set_kill_callback(self, callback):
         """Set the kill reward callback function"""
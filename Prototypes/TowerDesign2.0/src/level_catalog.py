@@ -0,0 +1,145 @@
+"""Index of the level files in a folder, cached on disk and refreshed incrementally for the level browser"""
+
+import os
+import json
+import math
+import hashlib
+import tempfile
+from pathlib import Path
+
+from settings import *
+from resource_manager import ResourceManager
+from level_format import load_level, level_hash, grid_hash
+from records import records
+from game_logging import get_logger
+
+logger = get_logger('level')
+
+
+CATALOG_VERSION = 2
+
+
+def estimate_difficulty(level_data):
+    """Rough difficulty from 1 (easy) to 5 (hard)
+
+    More waves, faster enemies, less money, less base HP and fewer path
+    tiles for towers to cover all make a level harder; a level with the
+    default settings and a 40-tile path rates 2.
+    """
+    settings = level_data.get('settings', {})
+    waves = settings.get('wave_count', 5)
+    speed = settings.get('enemy_speed', 50)
+    money = settings.get('initial_money', STARTING_MONEY)
+    base_hp = settings.get('base_hp', 10)
+    path_tiles = sum(row.count(0) for row in level_data['grid'])
+
+    score = ((waves / 5) * (speed / 50) * (STARTING_MONEY / max(money, 25))
+             * (10 / max(base_hp, 1)) * (40 / max(path_tiles, 10)))
+    return max(1, min(5, round(2 + math.log2(max(score, 1e-6)))))
+
+
+def _describe(path, stat):
+    """Catalog entry for one level file; reads the whole file"""
+    level_data = load_level(path)
+    grid = level_data['grid']
+    settings = level_data.get('settings', {})
+    return {
+        'file': path.name,
+        'mtime': stat.st_mtime_ns,
+        'bytes': stat.st_size,
+        'hash': level_hash(level_data),
+        'grid_hash': grid_hash(grid),
+        'name': level_data.get('name') or path.stem,
+        'width': len(grid[0]) if grid else 0,
+        'height': len(grid),
+        'waves': settings.get('wave_count', 5),
+        'difficulty': estimate_difficulty(level_data),
+        'legacy_best_time': settings.get('best_time'),
+    }
+
+
+class LevelCatalog:
+    """Name, grid size, waves, difficulty and best time of every level in a folder
+
+    The index is kept in the user data folder. refresh() only stats the
+    files and re-reads the ones whose modification time or size changed,
+    so opening a folder of thousands of levels costs one directory scan.
+    Best times come from the records store each refresh, as they change
+    without the level files changing.
+    """
+
+    def __init__(self, levels_dir=None, cache_path=None):
+        self.levels_dir = Path(levels_dir or ResourceManager.get_base_path() / "levels")
+        if cache_path is None:
+            folder_key = hashlib.sha1(str(self.levels_dir.resolve()).encode('utf-8')).hexdigest()[:12]
+            cache_path = ResourceManager.get_user_data_path() / f"level_catalog_{folder_key}.json"
+        self.cache_path = Path(cache_path)
+        self.entries = []  # Sorted by file name
+        self._cached = None  # file name -> entry, from the cache file
+
+    def refresh(self):
+        """Bring the index up to date with the folder; returns how many files were (re)read"""
+        if self._cached is None:
+            self._cached = self._load_cache()
+
+        try:
+            files = sorted((item for item in os.scandir(self.levels_dir)
+                            if item.name.endswith(".json") and item.is_file()), key=lambda item: item.name)
+        except OSError as e:
+            logger.warning("Levels directory not found: %s (%s)", self.levels_dir, e)
+            files = []
+
+        entries = []
+        read = 0
+        for item in files:
+            stat = item.stat()
+            entry = self._cached.get(item.name)
+            if entry is None or entry['mtime'] != stat.st_mtime_ns or entry['bytes'] != stat.st_size:
+                try:
+                    entry = _describe(Path(item.path), stat)
+                except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+                    logger.warning("Skipping level %s: %s", item.name, e)
+                    continue
+                read += 1
+            entries.append(entry)
+
+        changed = read > 0 or len(entries) != len(self._cached)
+        self._cached = {entry['file']: entry for entry in entries}
+        if changed:
+            self._save_cache(entries)
+
+        for entry in entries:
+            entry['best_time'] = records.best_time(entry['hash'], entry['legacy_best_time'])
+        self.entries = entries
+        return read
+
+    def search(self, text):
+        """Entries whose level name or file name contains text, ignoring case"""
+        text = text.strip().lower()
+        if not text:
+            return self.entries
+        return [entry for entry in self.entries if text in entry['name'].lower() or text in entry['file'].lower()]
+
+    def path_of(self, entry):
+        return self.levels_dir / entry['file']
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CATALOG_VERSION:
+                return {entry['file']: entry for entry in data['entries']}
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return {}
+
+    def _save_cache(self, entries):
+        stored = [{key: value for key, value in entry.items() if key != 'best_time'} for entry in entries]
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': CATALOG_VERSION, 'entries': stored}, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("Could not save level catalog %s: %s", self.cache_path, e)
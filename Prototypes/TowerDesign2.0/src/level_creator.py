@@ -2,7 +2,6 @@
 AI assisted code included in this file, you can see the comments below for details.
 """
 import pygame
-import json
 import os
 import time
 import random
@@ -11,10 +10,17 @@ from collections import deque
 from typing import List, Tuple, Set
 from pathlib import Path
 from settings import *
+from render_cache import render_text, get_gradient
+from sprite_variants import SpriteVariants
 from pathfinding import a_star
 from audio_manager import audio_manager
 from abc import ABC, abstractmethod
 from resource_manager import get_tiles_path
+from assets import assets
+from game_logging import get_logger
+from level_format import save_level
+
+logger = get_logger('editor')
 
 class PathGenerationStrategy(ABC):
     """Abstract base class for path generation strategies"""
@@ -278,10 +284,10 @@ class LevelCreator:
         """Load tile images for rendering"""
         """Load tile images with error handling"""
         try:
-            self.path_img = pygame.image.load(str(get_tiles_path('path.png')))
-            self.grass_img = pygame.image.load(str(get_tiles_path('grass.png')))
+            self.path_img = assets.image(get_tiles_path('path.png'))
+            self.grass_img = assets.image(get_tiles_path('grass.png'))
         except Exception as e:
-            print(f"Failed to load tile images: {e}")
+            logger.error("Failed to load tile images: %s", e)
             # Create fallback images
             self.path_img = pygame.Surface((32, 32))
             self.path_img.fill((139, 69, 19))  # Brown for path
@@ -710,8 +716,7 @@ class LevelCreator:
                 "initial_money": initial_money,
                 "wave_count": wave_count,
                 "enemy_speed": enemy_speed,
-                "base_hp": base_hp,
-                "best_time": None
+                "base_hp": base_hp
             },
             "grid": self.grid
         }
@@ -724,8 +729,7 @@ class LevelCreator:
         filepath = os.path.join(levels_dir, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(level_data, f, indent=2, ensure_ascii=False)
+            save_level(filepath, level_data)
             self.show_message(f"Level saved as {filename}!", UI_SUCCESS)
             self.save_dialog_active = False
             return True
@@ -739,12 +743,7 @@ class LevelCreator:
         screen_w, screen_h = current_screen.get_size()
         
         # Forest Guard theme gradient background (same as menu)
-        for y in range(screen_h):
-            color_ratio = y / screen_h
-            r = int(135 + (173 - 135) * color_ratio)
-            g = int(206 + (216 - 206) * color_ratio)
-            b = int(235 + (230 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (screen_w, y))
+        screen.blit(get_gradient((screen_w, screen_h), (135, 206, 235), (173, 216, 230)), (0, 0))
         
         # Draw main UI
         self.draw_toolbar(screen, screen_w)
@@ -780,8 +779,8 @@ class LevelCreator:
         pygame.draw.rect(screen, BROWN, dialog_rect, 4, border_radius=15)
         
         # Title with Forest Guard style
-        title_text = FONTS['title'].render("Save Level", True, FOREST_GREEN)
-        title_shadow = FONTS['title'].render("Save Level", True, BLACK)
+        title_text = render_text(FONTS['title'], "Save Level", FOREST_GREEN)
+        title_shadow = render_text(FONTS['title'], "Save Level", BLACK)
         title_x = dialog_x + (dialog_w - title_text.get_width()) // 2
         # Draw shadow first
         screen.blit(title_shadow, (title_x + 2, dialog_y + 22))
@@ -798,7 +797,7 @@ class LevelCreator:
         
         for label_text, field_name, y_pos in field_configs:
             # Label
-            label = FONTS['hud'].render(label_text, True, DARK_GREEN)
+            label = render_text(FONTS['hud'], label_text, DARK_GREEN)
             screen.blit(label, (dialog_x + 30, y_pos))
             
             # Input field with Forest Guard theme
@@ -811,7 +810,7 @@ class LevelCreator:
             
             # Input text
             display_text = self.settings_inputs[field_name]
-            input_text = FONTS['hud'].render(display_text, True, BLACK)
+            input_text = render_text(FONTS['hud'], display_text, BLACK)
             screen.blit(input_text, (field_rect.x + 10, field_rect.y + 5))
             
             # Cursor for active field
@@ -831,7 +830,7 @@ class LevelCreator:
         
         for i, help_text in enumerate(help_texts):
             color = FOREST_GREEN if i == 0 else DARK_GREEN
-            text = FONTS['small'].render(help_text, True, color)
+            text = render_text(FONTS['small'], help_text, color)
             screen.blit(text, (dialog_x + 30, dialog_y + 360 + i * 20))  # moved down 50px
         
         # Buttons
@@ -847,7 +846,7 @@ class LevelCreator:
         # Save button with Forest Guard style
         pygame.draw.rect(screen, save_color, save_rect, border_radius=5)
         pygame.draw.rect(screen, DARK_GREEN, save_rect, 3, border_radius=5)
-        save_text = FONTS['button'].render("Save", True, WHITE)
+        save_text = render_text(FONTS['button'], "Save", WHITE)
         save_text_x = save_x + (80 - save_text.get_width()) // 2
         save_text_y = save_y + (40 - save_text.get_height()) // 2
         screen.blit(save_text, (save_text_x, save_text_y))
@@ -863,13 +862,13 @@ class LevelCreator:
         # Cancel button with Forest Guard style
         pygame.draw.rect(screen, cancel_color, cancel_rect, border_radius=5)
         pygame.draw.rect(screen, DARK_GREEN, cancel_rect, 3, border_radius=5)
-        cancel_text = FONTS['button'].render("Cancel", True, WHITE)
+        cancel_text = render_text(FONTS['button'], "Cancel", WHITE)
         cancel_text_x = cancel_x + (80 - cancel_text.get_width()) // 2
         cancel_text_y = cancel_y + (40 - cancel_text.get_height()) // 2
         screen.blit(cancel_text, (cancel_text_x, cancel_text_y))
         
         # Instructions
-        instr_text = FONTS['small'].render("Click fields to edit, then press Save", True, BROWN)
+        instr_text = render_text(FONTS['small'], "Click fields to edit, then press Save", BROWN)
         instr_x = dialog_x + (dialog_w - instr_text.get_width()) // 2
         screen.blit(instr_text, (instr_x, dialog_y + dialog_h - 25))
 
@@ -922,8 +921,8 @@ class LevelCreator:
             pygame.draw.rect(screen, border_color, (x, y, button_width, button_height), 3, border_radius=8)
             
             # Icon and text
-            icon_text = FONTS['button'].render(tool['icon'], True, WHITE)
-            name_text = FONTS['small'].render(tool['name'], True, WHITE)
+            icon_text = render_text(FONTS['button'], tool['icon'], WHITE)
+            name_text = render_text(FONTS['small'], tool['name'], WHITE)
             
             icon_x = x + (button_width - icon_text.get_width()) // 2
             name_x = x + (button_width - name_text.get_width()) // 2
@@ -932,30 +931,34 @@ class LevelCreator:
             screen.blit(name_text, (name_x, y + 28))
         
         # Title with Forest Guard style
-        title_text = FONTS['subtitle'].render("Level Creator", True, CREAM)
-        title_shadow = FONTS['subtitle'].render("Level Creator", True, BLACK)
+        title_text = render_text(FONTS['subtitle'], "Level Creator", CREAM)
+        title_shadow = render_text(FONTS['subtitle'], "Level Creator", BLACK)
         # Draw shadow first
         screen.blit(title_shadow, (screen_w - title_text.get_width() - 18, 22))
         screen.blit(title_text, (screen_w - title_text.get_width() - 20, 20))
         
         # Instructions
-        instr_text = FONTS['small'].render("ESC: Return to Menu", True, CREAM)
+        instr_text = render_text(FONTS['small'], "ESC: Return to Menu", CREAM)
         screen.blit(instr_text, (screen_w - instr_text.get_width() - 20, 50))
     
     def draw_grid(self, screen, screen_w, screen_h):
         """Draw the game grid"""
+        viewport = get_viewport(screen_w, screen_h)
+        scaled_size = viewport.tile_size
+        column_xs, row_ys = viewport.grid_to_px_many(range(GRID_W), range(GRID_H))
+        if self.path_img and self.grass_img:
+            path_img = SpriteVariants.get(self.path_img, (scaled_size, scaled_size))
+            grass_img = SpriteVariants.get(self.grass_img, (scaled_size, scaled_size))
+
         for y in range(GRID_H):
+            py = int(row_ys[y])
             for x in range(GRID_W):
-                px, py = grid_to_px(x, y, screen_w, screen_h)
-                scaled_size = get_scaled_grid_size(screen_w, screen_h)
+                px = int(column_xs[x])
                 
                 # Draw tile
                 if self.path_img and self.grass_img:
                     # Use images
-                    if self.grid[y][x] == 0:  # Path
-                        img = pygame.transform.scale(self.path_img, (scaled_size, scaled_size))
-                    else:  # Grass
-                        img = pygame.transform.scale(self.grass_img, (scaled_size, scaled_size))
+                    img = path_img if self.grid[y][x] == 0 else grass_img  # Path or grass
                     screen.blit(img, (px, py))
                 else:
                     # Fallback to colors
@@ -968,17 +971,17 @@ class LevelCreator:
                 # Highlight spawn and home
                 if (x, y) == self.spawn:
                     pygame.draw.rect(screen, GREEN, (px+2, py+2, scaled_size-4, scaled_size-4), 3)
-                    text = FONTS['small'].render("START", True, WHITE)
+                    text = render_text(FONTS['small'], "START", WHITE)
                     screen.blit(text, (px + 4, py + 4))
                 elif (x, y) == self.home:
                     pygame.draw.rect(screen, RED, (px+2, py+2, scaled_size-4, scaled_size-4), 3)
-                    text = FONTS['small'].render("HOME", True, WHITE)
+                    text = render_text(FONTS['small'], "HOME", WHITE)
                     screen.blit(text, (px + 4, py + 4))
     
     def draw_message(self, screen, screen_w, screen_h):
         """Draw temporary messages"""
         if self.message:
-            text = FONTS['hud'].render(self.message, True, self.message_color)
+            text = render_text(FONTS['hud'], self.message, self.message_color)
             bg_rect = pygame.Rect(0, 0, text.get_width() + 20, text.get_height() + 10)
             bg_rect.centerx = screen_w // 2
             bg_rect.y = screen_h - 80
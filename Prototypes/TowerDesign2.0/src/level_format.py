@@ -0,0 +1,262 @@
+"""Reading and writing level files, with the grid stored as run-length encoded rows
+
+A level file is JSON. Version 2 files put the small header first and the
+grid last, one run-length encoded string per row:
+
+    {
+      "format": 2,
+      "name": "Level 1",
+      "settings": {"initial_money": 100, "wave_count": 5, ...},
+      "size": [20, 15],
+      "grid_rle": [
+        "0x6 1x14",
+        ...
+      ]
+    }
+
+so read_level_header() can stop before the grid. Older files with a plain
+"grid" list of lists still load; convert them with
+
+    python src/level_format.py [levels directory]
+"""
+
+import json
+import os
+import hashlib
+import sys
+import tempfile
+from pathlib import Path
+
+from game_logging import get_logger
+
+logger = get_logger('level')
+
+
+FORMAT_VERSION = 2
+HEADER_CHUNK = 4096  # Characters read at a time when looking for the header
+
+_decoder = json.JSONDecoder()
+
+
+def encode_row(row):
+    """Run-length encode one grid row, e.g. [0, 0, 1] -> '0x2 1x1'"""
+    if not row:
+        return ""
+    runs = []
+    run_value, run_length = row[0], 0
+    for value in row:
+        if value == run_value:
+            run_length += 1
+        else:
+            runs.append(f"{run_value}x{run_length}")
+            run_value, run_length = value, 1
+    runs.append(f"{run_value}x{run_length}")
+    return " ".join(runs)
+
+
+def decode_row(text):
+    row = []
+    for run in text.split():
+        value, _, length = run.partition("x")
+        row.extend([int(value)] * int(length))
+    return row
+
+
+def encode_grid(grid):
+    return [encode_row(row) for row in grid]
+
+
+def decode_grid(rows):
+    return [decode_row(text) for text in rows]
+
+
+def level_hash(level_data):
+    """Identity of a level's content - grid and gameplay settings, not its name or file
+
+    Best times are stored against this, so they follow a level that is
+    renamed or converted and reset when its map or settings change.
+    """
+    settings = {key: value for key, value in level_data.get('settings', {}).items() if key != 'best_time'}
+    text = json.dumps({'grid': level_data['grid'], 'settings': settings}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def grid_hash(grid):
+    """Identity of a grid alone, for things that depend only on the map, such as thumbnails"""
+    return hashlib.sha1("\n".join(encode_grid(grid)).encode('utf-8')).hexdigest()
+
+
+def _read_json(path):
+    """Parse a whole JSON file, accepting a UTF-8 byte order mark"""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return json.load(f)
+
+
+def load_level(path):
+    """Load a level file of any version; the result always has the grid as 'grid', a list of rows"""
+    level_data = _read_json(path)
+    if 'grid_rle' in level_data:
+        level_data['grid'] = decode_grid(level_data.pop('grid_rle'))
+    return level_data
+
+
+class _TruncatedHeader(Exception):
+    """The header continues past the text read so far"""
+
+
+def _parse_header(text):
+    """Top-level keys of a level file up to its grid; None if the file does not put its header first"""
+    header = {}
+    end = len(text)
+    index = text.index("{") + 1
+    while True:
+        while index < end and text[index] in " \t\r\n,":
+            index += 1
+        if index >= end:
+            raise _TruncatedHeader()
+        if text[index] == "}":
+            return header
+        try:
+            key, index = _decoder.raw_decode(text, index)
+            while index < end and text[index] in " \t\r\n:":
+                index += 1
+            if key in ('grid', 'grid_rle'):
+                # Only version 2 files promise that nothing follows the grid
+                return header if header.get('format', 1) >= FORMAT_VERSION else None
+            value, index = _decoder.raw_decode(text, index)
+        except json.JSONDecodeError:
+            raise _TruncatedHeader()
+        if index >= end:
+            # A number cut off by the end of the chunk would still parse
+            raise _TruncatedHeader()
+        header[key] = value
+
+
+def read_level_header(path):
+    """Name, settings and size of a level without decoding its grid
+
+    Version 2 files are read only as far as the grid; older files are
+    parsed whole.
+    """
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        text = f.read(HEADER_CHUNK)
+        while True:
+            try:
+                header = _parse_header(text)
+                break
+            except _TruncatedHeader:
+                more = f.read(HEADER_CHUNK)
+                if not more:
+                    header = None
+                    break
+                text += more
+            except ValueError:  # No opening brace
+                header = None
+                break
+
+    if header is None:
+        level_data = load_level(path)
+        grid = level_data.pop('grid', None)
+        header = level_data
+        if grid:
+            header.setdefault('size', [len(grid[0]), len(grid)])
+    return header
+
+
+def _has_empty_best_time(level_data):
+    settings = level_data.get('settings')
+    return isinstance(settings, dict) and 'best_time' in settings and settings['best_time'] is None
+
+
+def to_file_data(level_data):
+    """Version 2 layout of level_data: header keys first, the grid last and run-length encoded
+
+    An empty best_time is left out - best times live in the records store.
+    A real one from an older file is kept, as it still counts as a best.
+    """
+    grid = level_data['grid']
+    file_data = {'format': FORMAT_VERSION}
+    for key, value in level_data.items():
+        if key not in ('format', 'grid', 'grid_rle', 'size'):
+            file_data[key] = value
+    if _has_empty_best_time(file_data):
+        file_data['settings'] = {key: value for key, value in file_data['settings'].items() if key != 'best_time'}
+    file_data['size'] = [len(grid[0]) if grid else 0, len(grid)]
+    file_data['grid_rle'] = encode_grid(grid)
+    return file_data
+
+
+def dumps_level(level_data):
+    """Version 2 file text: nested settings indented, lists on one line and one grid row per line"""
+    lines = []
+    for key, value in to_file_data(level_data).items():
+        if key == 'grid_rle':
+            rows = ",\n".join("    " + json.dumps(row) for row in value)
+            lines.append(f'  "grid_rle": [\n{rows}\n  ]')
+        else:
+            text = json.dumps(value, indent=2 if isinstance(value, dict) else None, ensure_ascii=False)
+            lines.append(f"  {json.dumps(key)}: " + text.replace("\n", "\n  "))
+    return "{\n" + ",\n".join(lines) + "\n}\n"
+
+
+def save_level(path, level_data):
+    """Write level_data (with a 'grid' list of rows) as a version 2 file
+
+    The file is written to a temporary name and renamed over the old one,
+    so a crash never leaves half a level behind.
+    """
+    path = Path(path)
+    text = dumps_level(level_data)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=path.stem, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # mkstemp creates the file readable by its owner only
+        os.chmod(temp_path, path.stat().st_mode if path.exists() else 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def convert_file(path):
+    """Rewrite an older level file as version 2; returns True if it was converted
+
+    Current files are rewritten too if they still carry an empty best_time.
+    """
+    level_data = _read_json(path)
+    if level_data.get('format', 1) >= FORMAT_VERSION:
+        if not _has_empty_best_time(level_data):
+            return False
+        if 'grid_rle' not in level_data:
+            raise ValueError("no grid")
+        level_data['grid'] = decode_grid(level_data.pop('grid_rle'))
+    elif 'grid' not in level_data:
+        raise ValueError("no grid")
+    save_level(path, level_data)
+    return True
+
+
+def convert_directory(levels_dir):
+    """Convert every level file in levels_dir; returns (converted, already current, failed)"""
+    converted = current = failed = 0
+    for path in sorted(Path(levels_dir).glob("*.json")):
+        try:
+            before = path.stat().st_size
+            if convert_file(path):
+                converted += 1
+                logger.info("Converted %s (%d -> %d bytes)", path.name, before, path.stat().st_size)
+            else:
+                current += 1
+        except (OSError, ValueError) as e:
+            failed += 1
+            logger.error("Could not convert %s: %s", path.name, e)
+    return converted, current, failed
+
+
+if __name__ == "__main__":
+    from resource_manager import ResourceManager
+
+    levels_dir = sys.argv[1] if len(sys.argv) > 1 else ResourceManager.get_base_path() / "levels"
+    converted, current, failed = convert_directory(levels_dir)
+    print(f"{converted} converted, {current} already in format {FORMAT_VERSION}, {failed} failed")
@@ -5,9 +5,14 @@ import pygame
 import os
 import math
 from settings import *
+from render_cache import get_font, render_text, get_gradient
 from library_data import LIBRARY_DATA, TOWERS, ENEMIES
 from audio_manager import audio_manager
 from resource_manager import ResourceManager
+from assets import assets
+from game_logging import get_logger
+
+logger = get_logger('library')
 
 class ImageCache:
     """Image cache system to avoid repeated loading"""
@@ -22,16 +27,16 @@ class ImageCache:
                 if not path.startswith('/') and not path.startswith('C:'):
                     # This is a relative path, use ResourceManager
                     image_path = ResourceManager.get_asset_path(path)
-                    image = pygame.image.load(str(image_path))
+                    image = assets.image(image_path)
                 else:
                     # This is an absolute path, use as-is
-                    image = pygame.image.load(path)
+                    image = assets.image(path)
                 
                 if size:
                     image = pygame.transform.scale(image, size)
                 cls._cache[cache_key] = image
             except Exception as e:
-                print(f"Failed to load image {path}: {e}")
+                logger.error("Failed to load image %s: %s", path, e)
                 cls._cache[cache_key] = None
         return cls._cache[cache_key]
 
@@ -121,9 +126,9 @@ class LibraryCard:
             screen.blit(self.portrait_image, (image_x, image_y))
         
         # Display name - use optimized English font
-        font = pygame.font.SysFont('Arial', 16, bold=True)
+        font = get_font('Arial', 16, bold=True)
         display_name = LIBRARY_DATA.get(self.character_name, {}).get('name', self.character_name)
-        text = font.render(display_name, True, text_color)
+        text = render_text(font, display_name, text_color)
         text_rect = text.get_rect(centerx=self.rect.centerx, y=self.rect.bottom - 25)
         screen.blit(text, text_rect)
     
@@ -154,9 +159,9 @@ class SpriteAnimator:
             # Handle relative paths using ResourceManager
             if not sprite_path.startswith('/') and not sprite_path.startswith('C:'):
                 image_path = ResourceManager.get_asset_path(sprite_path)
-                sprite_sheet = pygame.image.load(str(image_path))
+                sprite_sheet = assets.image(image_path)
             else:
-                sprite_sheet = pygame.image.load(sprite_path)
+                sprite_sheet = assets.image(sprite_path)
                 
             sheet_width = sprite_sheet.get_width()
             sheet_height = sprite_sheet.get_height()
@@ -173,7 +178,7 @@ class SpriteAnimator:
                     self.frames.append(frame)
                     
         except Exception as e:
-            print(f"Error loading sprite sheet {sprite_path}: {e}")
+            logger.error("Error loading sprite sheet %s: %s", sprite_path, e)
             self.frames = []
     
     def update(self, dt):
@@ -213,11 +218,11 @@ class CharacterLibrary:
         self.animator = None
         
         # optimize font sizes - increase for better readability, use English-friendly fonts
-        self.title_font = pygame.font.SysFont('Arial', 36, bold=True)  # larger title font
-        self.story_font = pygame.font.SysFont('Arial', 18)  # increased story font
-        self.stats_font = pygame.font.SysFont('Arial', 20, bold=True)  # increased stats font
-        self.label_font = pygame.font.SysFont('Arial', 24, bold=True)  # increased label font
-        self.card_name_font = pygame.font.SysFont('Arial', 16, bold=True)  # card name font
+        self.title_font = get_font('Arial', 36, bold=True)  # larger title font
+        self.story_font = get_font('Arial', 18)  # increased story font
+        self.stats_font = get_font('Arial', 20, bold=True)  # increased stats font
+        self.label_font = get_font('Arial', 24, bold=True)  # increased label font
+        self.card_name_font = get_font('Arial', 16, bold=True)  # card name font
         
         # play menu music
         audio_manager.play_menu_music()
@@ -349,14 +354,8 @@ class CharacterLibrary:
         """Draw entire library interface - jungle theme"""
         screen_w, screen_h = screen.get_size()
         
-        # jungle theme gradient background
-        for y in range(screen_h):
-            ratio = y / screen_h
-            # gradient from light green to dark green
-            r = int(144 + (34 - 144) * ratio)
-            g = int(238 + (139 - 238) * ratio)  
-            b = int(144 + (34 - 144) * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (screen_w, y))
+        # jungle theme gradient background - light green to dark green
+        screen.blit(get_gradient((screen_w, screen_h), (144, 238, 144), (34, 139, 34)), (0, 0))
         
         # top toolbar area - wood background
         toolbar_height = 170
@@ -392,8 +391,8 @@ class CharacterLibrary:
         pygame.draw.rect(screen, FOREST_GREEN, back_button_rect, border_radius=10)
         pygame.draw.rect(screen, DARK_GREEN, back_button_rect, 3, border_radius=10)
         
-        button_font = pygame.font.SysFont('Arial', 20, bold=True)
-        text = button_font.render("← BACK", True, WHITE)
+        button_font = get_font('Arial', 20, bold=True)
+        text = render_text(button_font, "← BACK", WHITE)
         text_rect = text.get_rect(center=back_button_rect.center)
         screen.blit(text, text_rect)
     
@@ -403,7 +402,7 @@ class CharacterLibrary:
         y_offset = left_panel.y + 30
         
         # character name - use larger font
-        title = self.title_font.render(data['name'], True, FOREST_GREEN)
+        title = render_text(self.title_font, data['name'], FOREST_GREEN)
         title_rect = title.get_rect(centerx=left_panel.centerx, y=y_offset)
         screen.blit(title, title_rect)
         y_offset += 70
@@ -414,7 +413,7 @@ class CharacterLibrary:
         pygame.draw.rect(screen, BROWN, story_rect, 3, border_radius=10)
         
         # description title - larger font, English
-        story_label = self.label_font.render("BACKGROUND", True, FOREST_GREEN)
+        story_label = render_text(self.label_font, "BACKGROUND", FOREST_GREEN)
         screen.blit(story_label, (story_rect.x + 20, story_rect.y + 15))
         
         # description text - increase line spacing
@@ -427,18 +426,18 @@ class CharacterLibrary:
                 current_line = ""
                 for word in words:
                     test_line = current_line + word + " "
-                    test_surface = self.story_font.render(test_line, True, BLACK)
+                    test_surface = render_text(self.story_font, test_line, BLACK)
                     if test_surface.get_width() <= story_rect.width - 40:
                         current_line = test_line
                     else:
                         if current_line:
-                            text_surface = self.story_font.render(current_line.strip(), True, BLACK)
+                            text_surface = render_text(self.story_font, current_line.strip(), BLACK)
                             screen.blit(text_surface, (story_rect.x + 20, story_y))
                             story_y += 26  # increase line spacing
                         current_line = word + " "
                 
                 if current_line:
-                    text_surface = self.story_font.render(current_line.strip(), True, BLACK)
+                    text_surface = render_text(self.story_font, current_line.strip(), BLACK)
                     screen.blit(text_surface, (story_rect.x + 20, story_y))
                     story_y += 26
             elif not line.strip():
@@ -451,7 +450,7 @@ class CharacterLibrary:
         pygame.draw.rect(screen, FOREST_GREEN, stats_rect, 3, border_radius=10)
         
         # attributes title - larger font, English
-        stats_label = self.label_font.render("ATTRIBUTES", True, FOREST_GREEN)
+        stats_label = render_text(self.label_font, "ATTRIBUTES", FOREST_GREEN)
         screen.blit(stats_label, (stats_rect.x + 20, stats_rect.y + 15))
         
         # attributes list - increase font and spacing
@@ -460,7 +459,7 @@ class CharacterLibrary:
         for key, value in stats.items():
             if stats_y_pos < stats_rect.bottom - 30:
                 stat_text = f"• {key}: {value}"
-                text_surface = self.stats_font.render(stat_text, True, DARK_GREEN)
+                text_surface = render_text(self.stats_font, stat_text, DARK_GREEN)
                 screen.blit(text_surface, (stats_rect.x + 20, stats_y_pos))
                 stats_y_pos += 35  # increase attribute spacing
         
@@ -470,7 +469,7 @@ class CharacterLibrary:
                                    right_panel.width - 50, right_panel.height // 2 - 30)
         
         # portrait title - larger font, English
-        portrait_label = self.label_font.render("PORTRAIT", True, FOREST_GREEN)
+        portrait_label = render_text(self.label_font, "PORTRAIT", FOREST_GREEN)
         screen.blit(portrait_label, (portrait_rect.x, portrait_rect.y))
         
         portrait_display_rect = pygame.Rect(portrait_rect.x, portrait_rect.y + 40,
@@ -499,7 +498,7 @@ class CharacterLibrary:
         pygame.draw.rect(screen, FOREST_GREEN, anim_rect, 3, border_radius=10)
         
         # animation title - larger font, English
-        anim_label = self.label_font.render("SPRITE ANIMATION", True, FOREST_GREEN)
+        anim_label = render_text(self.label_font, "SPRITE ANIMATION", FOREST_GREEN)
         screen.blit(anim_label, (anim_rect.x + 20, anim_rect.y + 15))
         
         # animation display area - increase padding
@@ -510,7 +509,7 @@ class CharacterLibrary:
             self.animator.draw(screen, anim_display_rect)
         else:
             # no animation prompt - English
-            no_anim_text = self.story_font.render("No animation available", True, (120, 120, 120))
+            no_anim_text = render_text(self.story_font, "No animation available", (120, 120, 120))
             text_rect = no_anim_text.get_rect(center=anim_display_rect.center)
             screen.blit(no_anim_text, text_rect)
     
@@ -3,10 +3,16 @@ AI assisted code included in this file, you can see the comments below for detai
 """
 import pygame
 import random
+from collections import OrderedDict
 from pathlib import Path
 from settings import *
 from grid import GRID_MAP
 from resource_manager import get_sprite_path, get_tiles_path, ResourceManager
+from assets import assets
+from sprite_variants import SpriteVariants, TINTS
+from game_logging import get_logger
+
+logger = get_logger('map')
 
 class StartSprite:
     """START sprite sheet animation class, supports 4 random state switches"""
@@ -23,13 +29,13 @@ class StartSprite:
         # randomly select initial state
         self.current_state = random.randint(0, 3)
         
-        print(f"START sprite initialized with state {self.current_state}")
+        logger.debug("START sprite initialized with state %s", self.current_state)
     
     def load_sprite_sheet(self):
         """Load START sprite sheet and cut into frames"""
         try:
             sheet_path = ResourceManager.get_asset_path("sprite/START.png")
-            sheet = pygame.image.load(str(sheet_path)).convert_alpha()
+            sheet = assets.image(sheet_path)
             
             # assume sprite sheet is 2x2 format, each frame same size
             sheet_w, sheet_h = sheet.get_size()
@@ -46,10 +52,10 @@ class StartSprite:
                     frame = sheet.subsurface(frame_rect).copy()
                     self.sprite_frames.append(frame)
             
-            print(f"START sprite loaded: {len(self.sprite_frames)} frames, {frame_w}x{frame_h} each")
+            logger.debug("START sprite loaded: %d frames, %dx%d each", len(self.sprite_frames), frame_w, frame_h)
             
         except Exception as e:
-            print(f"Failed to load START sprite: {e}")
+            logger.error("Failed to load START sprite: %s", e)
             # Fallback: create simple colored frame
             fallback_frame = pygame.Surface((40, 40))
             fallback_frame.fill((0, 255, 0))  # Green fallback
@@ -64,15 +70,11 @@ class StartSprite:
             available_states = [s for s in self.states if s != self.current_state]
             self.current_state = random.choice(available_states)
             self.state_timer = 0.0
-            print(f"START state switched to: {self.current_state}")
+            logger.debug("START state switched to: %s", self.current_state)
     
     def get_current_sprite(self, size):
         """Get current frame sprite, scaled to specified size"""
-        sprite = self.sprite_frames[self.current_state]
-        
-        if size != sprite.get_size():
-            return pygame.transform.scale(sprite, size)
-        return sprite
+        return SpriteVariants.get(self.sprite_frames[self.current_state], size)
 
 class HomeSprite:
     """HOME sprite sheet animation class, supports multiple states and mask effects"""
@@ -106,7 +108,7 @@ class HomeSprite:
         """Load HOME sprite sheet and cut into frames"""
         try:
             sheet_path = ResourceManager.get_asset_path("sprite/HOME.png")
-            sheet = pygame.image.load(str(sheet_path)).convert_alpha()
+            sheet = assets.image(sheet_path)
             
             # assume sprite sheet is 2x2 format, each frame same size
             sheet_w, sheet_h = sheet.get_size()
@@ -123,10 +125,10 @@ class HomeSprite:
                     frame = sheet.subsurface(frame_rect).copy()
                     self.sprite_frames.append(frame)
             
-            print(f"HOME sprite loaded: {len(self.sprite_frames)} frames, {frame_w}x{frame_h} each")
+            logger.debug("HOME sprite loaded: %d frames, %dx%d each", len(self.sprite_frames), frame_w, frame_h)
             
         except Exception as e:
-            print(f"Failed to load HOME sprite: {e}")
+            logger.error("Failed to load HOME sprite: %s", e)
             # Fallback: create simple colored frame
             fallback_frame = pygame.Surface((40, 40))
             fallback_frame.fill((255, 0, 0))  # Red fallback
@@ -191,27 +193,10 @@ class HomeSprite:
         """Get current frame sprite, scaled to specified size"""
         current_frames = self.frames[self.state]
         frame_index = current_frames[self.current_frame]
-        sprite = self.sprite_frames[frame_index]
-        
-        if size != sprite.get_size():
-            sprite = pygame.transform.scale(sprite, size)
-        
-        # if need to show mask, apply color mask
-        if self.show_mask:
-            mask_surface = pygame.Surface(size, pygame.SRCALPHA)
-            if self.state == "active":
-                # yellow mask (enemies approaching)
-                mask_surface.fill((255, 255, 0, 80))  # semi-transparent yellow
-            elif self.state == "hit":
-                # red mask (being attacked)
-                mask_surface.fill((255, 0, 0, 120))  # semi-transparent red
-            
-            # create composite image with mask
-            combined = sprite.copy()
-            combined.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
-            return combined
-        
-        return sprite
+        # Only states with a tint get a mask - "checking" keeps the plain sprite
+        # yellow mask while enemies approach ("active"), red while being attacked ("hit")
+        mask_state = self.state if self.show_mask and self.state in TINTS else None
+        return SpriteVariants.get(self.sprite_frames[frame_index], size, mask_state)
 
 class MapComponent:
     def __init__(self, grid=None, spawn=(0,0), home=(GRID_W-2, GRID_H-2)):
@@ -219,6 +204,12 @@ class MapComponent:
         self.spawn = spawn
         self.home  = home
         self._load_imgs()
+
+        # Pre-rendered chunks of tiles, rebuilt only when the grid or the tile size changes
+        self.grid_version = 0
+        self._chunks = OrderedDict()  # (chunk x, chunk y) -> surface, least recently drawn first
+        self._chunks_key = None
+        self._scaled_imgs = {}
         
         # create START and HOME animation sprites
         self.start_sprite = StartSprite()
@@ -230,8 +221,8 @@ class MapComponent:
     def _load_imgs(self):
         """Load tile images"""
         self.imgs = {
-            0: pygame.image.load(str(get_tiles_path('path.png'))),
-            1: pygame.image.load(str(get_tiles_path('grass.png'))),
+            0: assets.image(get_tiles_path('path.png')),
+            1: assets.image(get_tiles_path('grass.png')),
         }
 
     def set_spawn_and_home(self, spawn, home):
@@ -269,21 +260,21 @@ class MapComponent:
             if enemies_near:
                 self.home_sprite.set_state("active")
                 self.enemies_near_home = True
-                print(f"HOME status: post-hit check, enemies found, switching to active state")
+                logger.debug("HOME status: post-hit check, enemies found, switching to active state")
             else:
                 self.home_sprite.set_state("idle")
                 self.enemies_near_home = False
-                print(f"HOME status: post-hit check, no enemies, switching to idle state")
+                logger.debug("HOME status: post-hit check, no enemies, switching to idle state")
         # normal state check logic
         elif current_state != "hit":  # hit state won't be interrupted
             if enemies_near and not self.enemies_near_home:
                 self.home_sprite.on_enemy_near()
                 self.enemies_near_home = True
-                print(f"HOME status: enemies approaching, switching to active state")
+                logger.debug("HOME status: enemies approaching, switching to active state")
             elif not enemies_near and self.enemies_near_home:
                 self.home_sprite.on_no_enemies()
                 self.enemies_near_home = False
-                print(f"HOME status: enemies moving away, switching to idle state")
+                logger.debug("HOME status: enemies moving away, switching to idle state")
     
     def on_home_hit(self):
         """Called when HOME is being attacked"""
@@ -298,64 +289,121 @@ class MapComponent:
         self.start_sprite.update(dt)
         self.home_sprite.update(dt)
 
-    def _draw(self, screen_w, screen_h):
-        # Calculate scaling
-        scaled_grid_size = get_scaled_grid_size(screen_w, screen_h)
-        
-        # Create scaled images
-        scaled_imgs = {}
-        for key, img in self.imgs.items():
-            scaled_imgs[key] = pygame.transform.scale(img, (scaled_grid_size, scaled_grid_size))
-        
-        # Calculate the position and size of the game area
-        game_area_height = screen_h - UI_HEIGHT
-        scale_x = screen_w / (GRID_W * GRID_SIZE)
-        scale_y = game_area_height / (GRID_H * GRID_SIZE)
-        scale = min(scale_x, scale_y)
-        
-        scaled_width = GRID_W * GRID_SIZE * scale
-        scaled_height = GRID_H * GRID_SIZE * scale
-        offset_x = (screen_w - scaled_width) // 2
-        offset_y = UI_HEIGHT + (game_area_height - scaled_height) // 2
-        
-        # Create game area surface with background color fill
-        game_surface = pygame.Surface((int(scaled_width), int(scaled_height)))
-        game_surface.fill((173, 216, 230))  # Fill with light blue background to avoid black borders
-        
-        # Draw tiles
-        for y, row in enumerate(self.grid):
-            for x, t in enumerate(row):
-                pos_x = x * scaled_grid_size
-                pos_y = y * scaled_grid_size
-                game_surface.blit(scaled_imgs[t], (pos_x, pos_y))
-        
+    def invalidate(self):
+        """Force the tile layer to be rebuilt, e.g. after editing the grid in place"""
+        self.grid_version += 1
+
+    def _chunk_tiles(self, tile_size):
+        """Tiles along each side of a chunk - fewer when zoomed in, to keep chunks small"""
+        return max(1, min(CAMERA_CHUNK_TILES, CAMERA_CHUNK_MAX_PX // max(1, tile_size)))
+
+    def _build_chunk(self, cx, cy, tile_size, chunk_tiles):
+        """Render the tiles of one chunk into a surface"""
+        first_x, first_y = cx * chunk_tiles, cy * chunk_tiles
+        columns = min(chunk_tiles, GRID_W - first_x)
+        rows = min(chunk_tiles, GRID_H - first_y)
+
+        chunk = pygame.Surface((columns * tile_size, rows * tile_size))
+        for y in range(first_y, first_y + rows):
+            row = self.grid[y]
+            for x in range(first_x, first_x + columns):
+                chunk.blit(self._scaled_imgs[row[x]], ((x - first_x) * tile_size, (y - first_y) * tile_size))
+
+        if pygame.display.get_surface():
+            chunk = chunk.convert()
+        return chunk
+
+    def _get_chunk(self, cx, cy, tile_size, chunk_tiles):
+        """Return a cached chunk, rebuilding the cache if the grid or tile size changed"""
+        cache_key = (self.grid_version, tile_size)
+        if self._chunks_key != cache_key:
+            self._chunks.clear()
+            self._scaled_imgs = {key: pygame.transform.scale(img, (tile_size, tile_size)) for key, img in self.imgs.items()}
+            self._chunks_key = cache_key
+
+        chunk = self._chunks.get((cx, cy))
+        if chunk is None:
+            chunk = self._chunks[(cx, cy)] = self._build_chunk(cx, cy, tile_size, chunk_tiles)
+            if len(self._chunks) > CAMERA_CHUNK_CACHE:
+                self._chunks.popitem(last=False)
+        else:
+            self._chunks.move_to_end((cx, cy))
+        return chunk
+
+    def _draw_markers(self, target, offset, screen_w, screen_h):
+        """Draw the animated START and HOME markers on top of the tile layer"""
+        scaled_grid_size = get_viewport(screen_w, screen_h).tile_size
+        offset_x, offset_y = offset
+
         # Draw markers with 1.25x scaling and centering
         sx, sy = self.spawn
         hx, hy = self.home
         
         # Calculate 1.25x scaled size
         marker_size = int(scaled_grid_size * 1.25)
+        marker_offset = (scaled_grid_size - marker_size) // 2
         
         # START marker - use sprite animation, 1.25x scaled and centered
         start_sprite = self.start_sprite.get_current_sprite((marker_size, marker_size))
-        start_offset_x = (scaled_grid_size - marker_size) // 2
-        start_offset_y = (scaled_grid_size - marker_size) // 2
-        start_pos = (sx * scaled_grid_size + start_offset_x, sy * scaled_grid_size + start_offset_y)
-        game_surface.blit(start_sprite, start_pos)
+        start_pos = (offset_x + sx * scaled_grid_size + marker_offset, offset_y + sy * scaled_grid_size + marker_offset)
+        start_rect = target.blit(start_sprite, start_pos)
         
         # HOME marker - use sprite animation, 1.25x scaled and centered
         home_sprite = self.home_sprite.get_current_sprite((marker_size, marker_size))
-        home_offset_x = (scaled_grid_size - marker_size) // 2
-        home_offset_y = (scaled_grid_size - marker_size) // 2
-        home_pos = (hx * scaled_grid_size + home_offset_x, hy * scaled_grid_size + home_offset_y)
-        game_surface.blit(home_sprite, home_pos)
-        
-        return game_surface, (int(offset_x), int(offset_y))
+        home_pos = (offset_x + hx * scaled_grid_size + marker_offset, offset_y + hy * scaled_grid_size + marker_offset)
+        home_rect = target.blit(home_sprite, home_pos)
+
+        return [start_rect, home_rect]
 
     def set_grid(self, new_grid):
         self.grid = new_grid
+        self.invalidate()
 
-    def draw(self, target):
+    def draw_tiles(self, target):
+        """Blit the tile chunks that are on screen and return the rect they cover"""
+        viewport = get_viewport(*target.get_size())
+        tile_size = viewport.tile_size
+        offset_x, offset_y = int(viewport.offset_x), int(viewport.offset_y)
+        view = viewport.visible_area
+        if not view.w or not view.h:
+            return pygame.Rect(offset_x, offset_y, 0, 0)
+
+        # Range of chunks overlapping the visible part of the map
+        chunk_tiles = self._chunk_tiles(tile_size)
+        chunk_px = chunk_tiles * tile_size
+        first_cx = max(0, (view.left - offset_x) // chunk_px)
+        first_cy = max(0, (view.top - offset_y) // chunk_px)
+        last_cx = min((GRID_W - 1) // chunk_tiles, (view.right - 1 - offset_x) // chunk_px)
+        last_cy = min((GRID_H - 1) // chunk_tiles, (view.bottom - 1 - offset_y) // chunk_px)
+
+        batch = []
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                chunk = self._get_chunk(cx, cy, tile_size, chunk_tiles)
+                batch.append((chunk, (offset_x + cx * chunk_px, offset_y + cy * chunk_px)))
+
+        # Zoomed in, chunks can stick out of the play area - keep them off the toolbar
+        previous_clip = target.get_clip()
+        target.set_clip(view.clip(previous_clip))
+        rects = target.blits(batch)
+        target.set_clip(previous_clip)
+        return rects[0].unionall(rects[1:])
+
+    def draw_markers(self, target):
+        """Draw the START and HOME markers over the tiles and return the rects they cover"""
         screen_w, screen_h = target.get_size()
-        game_surface, offset = self._draw(screen_w, screen_h)
-        target.blit(game_surface, offset)
+        viewport = get_viewport(screen_w, screen_h)
+        offset = (int(viewport.offset_x), int(viewport.offset_y))
+        map_rect = pygame.Rect(offset, (int(GRID_W * GRID_SIZE * viewport.scale), int(GRID_H * GRID_SIZE * viewport.scale)))
+
+        # Markers used to be clipped by the map surface, keep them inside it
+        previous_clip = target.get_clip()
+        target.set_clip(map_rect.clip(previous_clip))
+        marker_rects = self._draw_markers(target, offset, screen_w, screen_h)
+        target.set_clip(previous_clip)
+
+        return marker_rects
+
+    def draw(self, target):
+        self.draw_tiles(target)
+        self.draw_markers(target)
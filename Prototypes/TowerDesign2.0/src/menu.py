@@ -8,7 +8,14 @@ import json
 import math
 import random
 from settings import *
+from render_cache import get_font, render_text, get_gradient
 from audio_manager import audio_manager
+from level_catalog import LevelCatalog
+from thumbnails import thumbnails
+from assets import assets
+from game_logging import get_logger
+
+logger = get_logger('menu')
 
 class Button:
     def __init__(self, x, y, width, height, text, color=FOREST_GREEN, hover_color=LIGHT_GREEN, text_color=WHITE):
@@ -18,7 +25,7 @@ class Button:
         self.hover_color = hover_color
         self.text_color = text_color
         self.is_hovered = False
-        self.font = pygame.font.SysFont('Arial', 24, bold=True)
+        self.font = get_font('Arial', 24, bold=True)
         
         # Add animation effects
         self.hover_scale = 1.0
@@ -55,7 +62,7 @@ class Button:
             pygame.draw.rect(screen, (255, 255, 255, 50), highlight_rect, 2, border_radius=6)
         
         # Draw text
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=scaled_rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -70,8 +77,8 @@ class Button:
 class MainMenu:
     def __init__(self):
         # Title font
-        self.title_font = pygame.font.SysFont('Arial', 72, bold=True)
-        self.subtitle_font = pygame.font.SysFont('Arial', 24)
+        self.title_font = get_font('Arial', 72, bold=True)
+        self.subtitle_font = get_font('Arial', 24)
         
         # Add natural element animation
         self.title_wave = 0.0
@@ -288,14 +295,8 @@ class MainMenu:
     def draw_background(self, screen):
         screen_w, screen_h = screen.get_size()
         
-        # Enhanced gradient background (sky to horizon)
-        for y in range(screen_h):
-            color_ratio = y / screen_h
-            # From sky blue gradient to warmer horizon color
-            r = int(135 + (200 - 135) * color_ratio)
-            g = int(206 + (220 - 206) * color_ratio)
-            b = int(235 + (200 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (screen_w, y))
+        # Enhanced gradient background (sky blue to warmer horizon color)
+        screen.blit(get_gradient((screen_w, screen_h), (135, 206, 235), (200, 220, 200)), (0, 0))
         
         # Draw natural effects
         self.draw_pixel_clouds(screen, screen_w, screen_h)
@@ -351,17 +352,17 @@ class MainMenu:
             title_y = screen_h // 4 + int(wave_offset)
             
             # Main title only (no shadow effects)
-            title = self.title_font.render("Forest Guard", True, DARK_GREEN)
+            title = render_text(self.title_font, "Forest Guard", DARK_GREEN)
             title_rect = title.get_rect(center=(screen_w // 2, title_y))
             current_screen.blit(title, title_rect)
             
             # Enhanced subtitle
             subtitle_y = title_y + 80
-            subtitle = self.subtitle_font.render("Defend the Forest from Invaders!", True, FOREST_GREEN)
+            subtitle = render_text(self.subtitle_font, "Defend the Forest from Invaders!", FOREST_GREEN)
             subtitle_rect = subtitle.get_rect(center=(screen_w // 2, subtitle_y))
             
             # Subtitle shadow (minimal)
-            subtitle_shadow = self.subtitle_font.render("Defend the Forest from Invaders!", True, (0, 50, 0))
+            subtitle_shadow = render_text(self.subtitle_font, "Defend the Forest from Invaders!", (0, 50, 0))
             shadow_rect = subtitle_shadow.get_rect(center=(screen_w // 2 + 1, subtitle_y + 1))
             current_screen.blit(subtitle_shadow, shadow_rect)
             current_screen.blit(subtitle, subtitle_rect)
@@ -373,60 +374,83 @@ class MainMenu:
             self.quit_button.draw(current_screen)
             
             # Add version info
-            version_font = pygame.font.SysFont('Arial', 16)
-            version_text = version_font.render("Forest Guard v2.0", True, (100, 100, 100))
+            version_font = get_font('Arial', 16)
+            version_text = render_text(version_font, "Forest Guard v2.0", (100, 100, 100))
             version_rect = version_text.get_rect(bottomright=(screen_w - 10, screen_h - 10))
             current_screen.blit(version_text, version_rect)
             
             pygame.display.flip()
             clock.tick(FPS)
 
+class LevelRow(Button):
+    """One row of the level browser; rows are pooled and rebound to whichever levels are scrolled into view"""
+
+    def __init__(self):
+        super().__init__(0, 0, 0, 0, "")
+        self.shadow_offset = 1
+        self.entry = None
+
+    def bind(self, entry, rect):
+        self.entry = entry
+        self.rect = rect
+
+    def draw(self, screen):
+        super().draw(screen)
+        entry = self.entry
+
+        # Minimap, once a worker has made it
+        thumb_w, thumb_h = THUMBNAIL_SIZE
+        thumb_rect = pygame.Rect(self.rect.x + 12, self.rect.centery - thumb_h // 2, thumb_w, thumb_h)
+        thumbnail = thumbnails.get(entry)
+        if thumbnail is not None:
+            screen.blit(thumbnail, thumbnail.get_rect(center=thumb_rect.center))
+        else:
+            pygame.draw.rect(screen, DARK_GREEN, thumb_rect, border_radius=4)
+
+        text_x = thumb_rect.right + 12
+        name = render_text(FONTS['button'], entry['name'], self.text_color)
+        screen.blit(name, name.get_rect(midleft=(text_x, self.rect.centery - 10)))
+        file_text = render_text(FONTS['tiny'], entry['file'], CREAM)
+        screen.blit(file_text, file_text.get_rect(midleft=(text_x, self.rect.centery + 13)))
+
+        best_time = entry.get('best_time')
+        best = f"Best {best_time:.1f}s" if best_time is not None else "No best time"
+        details = (f"{entry['width']}x{entry['height']}   {entry['waves']} waves   "
+                   f"Difficulty {entry['difficulty']}/5   {best}")
+        details_text = render_text(FONTS['small'], details, self.text_color)
+        screen.blit(details_text, details_text.get_rect(midright=(self.rect.right - 16, self.rect.centery)))
+
+
 class LevelSelector:
+    ROW_HEIGHT = 56
+    ROW_GAP = 8
+    LIST_TOP = 200
+
     def __init__(self):
-        self.buttons = []
+        self.rows = []  # Row widgets for the visible part of the list only
         self.back_button = Button(30, 30, 120, 50, "← Back", color=BROWN, hover_color=RED)
-        self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
-        
+        self.title_font = get_font('Arial', 48, bold=True)
+        self.catalog = LevelCatalog()
+
+        # Search and scrolling
+        self.search_text = ""
+        self.matches = []
+        self.first_row = 0
+        self.list_rect = pygame.Rect(0, 0, 0, 0)
+
         # Delete functionality
         self.delete_mode = False
         self.delete_button = None
         self.confirm_delete_dialog = False
         self.level_to_delete = None
-        
+
         self.load_levels()
-        
+
     def load_levels(self):
-        # Get the levels directory path
-        levels_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "levels")
-        
-        if not os.path.exists(levels_dir):
-            print(f"Levels directory not found: {levels_dir}")
-            return
-            
-        # Load all JSON level files
-        level_files = [f for f in os.listdir(levels_dir) if f.endswith(".json")]
-        level_files.sort()  # Sort for consistent ordering
-        
-        # Create buttons in a grid layout
-        cols = 3
-        button_width, button_height = 200, 80
-        start_x = DEFAULT_SCREEN_W // 2 - (cols * button_width + (cols - 1) * 20) // 2
-        start_y = 150
-        
-        self.buttons.clear()
-        
-        for i, level_file in enumerate(level_files):
-            col = i % cols
-            row = i // cols
-            x = start_x + col * (button_width + 20)
-            y = start_y + row * (button_height + 20)
-            
-            # Use filename as button text, do not preload level data
-            level_name = level_file.replace('.json', '')
-            button = Button(x, y, button_width, button_height, level_name)
-            button.level_file = level_file  # Store the filename
-            self.buttons.append(button)
-        
+        read = self.catalog.refresh()
+        logger.debug("Level catalog: %d levels, %d read from disk", len(self.catalog.entries), read)
+        self.update_matches()
+
         # Create delete button (bottom-right corner)
         screen = pygame.display.get_surface()
         if screen:
@@ -434,16 +458,80 @@ class LevelSelector:
             delete_x = screen_w - 140
             delete_y = screen_h - 80
             self.delete_button = Button(delete_x, delete_y, 120, 50, "Delete Level", color=UI_DANGER, hover_color=RED)
-    
+
+    def update_matches(self):
+        self.matches = self.catalog.search(self.search_text)
+        self.scroll_to(self.first_row)
+
+    def visible_count(self):
+        return max(1, (self.list_rect.height + self.ROW_GAP) // (self.ROW_HEIGHT + self.ROW_GAP))
+
+    def scroll_to(self, first_row):
+        self.first_row = max(0, min(first_row, len(self.matches) - self.visible_count()))
+
+    def layout_rows(self, screen_w, screen_h):
+        """Bind the row pool to the levels currently in view"""
+        list_w = min(900, screen_w - 80)
+        self.list_rect = pygame.Rect((screen_w - list_w) // 2, self.LIST_TOP, list_w,
+                                     max(self.ROW_HEIGHT, screen_h - self.LIST_TOP - 150))
+        self.scroll_to(self.first_row)
+
+        visible = self.matches[self.first_row:self.first_row + self.visible_count()]
+        while len(self.rows) < len(visible):
+            self.rows.append(LevelRow())
+        del self.rows[len(visible):]
+
+        for i, (row, entry) in enumerate(zip(self.rows, visible)):
+            y = self.list_rect.y + i * (self.ROW_HEIGHT + self.ROW_GAP)
+            row.bind(entry, pygame.Rect(self.list_rect.x, y, self.list_rect.width - 16, self.ROW_HEIGHT))
+        thumbnails.request(visible, self.catalog.levels_dir)
+
+    def handle_scroll_key(self, key):
+        """Up/Down, Page Up/Down, Home and End move through the list; returns True if the key was one of them"""
+        page = self.visible_count()
+        steps = {pygame.K_UP: -1, pygame.K_DOWN: 1, pygame.K_PAGEUP: -page, pygame.K_PAGEDOWN: page}
+        if key in steps:
+            self.scroll_to(self.first_row + steps[key])
+        elif key == pygame.K_HOME:
+            self.scroll_to(0)
+        elif key == pygame.K_END:
+            self.scroll_to(len(self.matches))
+        else:
+            return False
+        return True
+
     def draw_background(self, screen):
         screen_w, screen_h = screen.get_size()
         # Same gradient background as main menu
-        for y in range(screen_h):
-            color_ratio = y / screen_h
-            r = int(135 + (173 - 135) * color_ratio)
-            g = int(206 + (216 - 206) * color_ratio)
-            b = int(235 + (230 - 235) * color_ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (screen_w, y))
+        screen.blit(get_gradient((screen_w, screen_h), (135, 206, 235), (173, 216, 230)), (0, 0))
+
+    def draw_search_box(self, screen):
+        search_rect = pygame.Rect(self.list_rect.x, self.LIST_TOP - 70, self.list_rect.width, 40)
+        pygame.draw.rect(screen, WHITE, search_rect, border_radius=8)
+        pygame.draw.rect(screen, DARK_GREEN, search_rect, 2, border_radius=8)
+        if self.search_text:
+            text = render_text(FONTS['hud'], self.search_text + "|", BLACK)
+        else:
+            text = render_text(FONTS['hud'], "Type to search levels...", GREY)
+        screen.blit(text, text.get_rect(midleft=(search_rect.x + 12, search_rect.centery)))
+
+        if self.matches:
+            last = min(self.first_row + self.visible_count(), len(self.matches))
+            count = f"Showing {self.first_row + 1}-{last} of {len(self.matches)} levels"
+        else:
+            count = "No levels match" if self.catalog.entries else "No levels found"
+        count_text = render_text(FONTS['small'], count, DARK_GREEN)
+        screen.blit(count_text, count_text.get_rect(bottomleft=(self.list_rect.x, self.LIST_TOP - 6)))
+
+    def draw_scrollbar(self, screen):
+        visible = self.visible_count()
+        if len(self.matches) <= visible:
+            return
+        track = pygame.Rect(self.list_rect.right - 8, self.list_rect.y, 8, self.list_rect.height)
+        pygame.draw.rect(screen, UI_MID_BG, track, border_radius=4)
+        thumb_h = max(24, track.height * visible // len(self.matches))
+        thumb_y = track.y + (track.height - thumb_h) * self.first_row // (len(self.matches) - visible)
+        pygame.draw.rect(screen, DARK_GREEN, (track.x, thumb_y, track.width, thumb_h), border_radius=4)
 
     def draw_confirm_delete_dialog(self, screen, screen_w, screen_h):
         """Draw the delete confirmation dialog"""
@@ -465,17 +553,17 @@ class LevelSelector:
         pygame.draw.rect(screen, UI_DANGER, dialog_rect, 3, border_radius=15)
         
         # Title
-        title_text = FONTS['title'].render("Confirm Delete", True, UI_DANGER)
+        title_text = render_text(FONTS['title'], "Confirm Delete", UI_DANGER)
         title_rect = title_text.get_rect(center=(screen_w // 2, dialog_y + 50))
         screen.blit(title_text, title_rect)
         
         # Warning message
         level_name = self.level_to_delete.replace('.json', '')
-        warning_text = FONTS['hud'].render(f"Delete level '{level_name}'?", True, WHITE)
+        warning_text = render_text(FONTS['hud'], f"Delete level '{level_name}'?", WHITE)
         warning_rect = warning_text.get_rect(center=(screen_w // 2, dialog_y + 90))
         screen.blit(warning_text, warning_rect)
         
-        warning2_text = FONTS['small'].render("This action cannot be undone!", True, UI_WARNING)
+        warning2_text = render_text(FONTS['small'], "This action cannot be undone!", UI_WARNING)
         warning2_rect = warning2_text.get_rect(center=(screen_w // 2, dialog_y + 115))
         screen.blit(warning2_text, warning2_rect)
         
@@ -490,7 +578,7 @@ class LevelSelector:
         confirm_color = RED if confirm_hover else UI_DANGER
         
         pygame.draw.rect(screen, confirm_color, confirm_rect, border_radius=5)
-        confirm_text = FONTS['button'].render("Delete", True, WHITE)
+        confirm_text = render_text(FONTS['button'], "Delete", WHITE)
         confirm_text_rect = confirm_text.get_rect(center=confirm_rect.center)
         screen.blit(confirm_text, confirm_text_rect)
         
@@ -503,7 +591,7 @@ class LevelSelector:
         cancel_color = UI_LIGHT_BG if cancel_hover else UI_MID_BG
         
         pygame.draw.rect(screen, cancel_color, cancel_rect, border_radius=5)
-        cancel_text = FONTS['button'].render("Cancel", True, WHITE)
+        cancel_text = render_text(FONTS['button'], "Cancel", WHITE)
         cancel_text_rect = cancel_text.get_rect(center=cancel_rect.center)
         screen.blit(cancel_text, cancel_text_rect)
         
@@ -512,17 +600,16 @@ class LevelSelector:
     def delete_level_file(self, level_file):
         """Delete a level file"""
         try:
-            levels_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "levels")
-            filepath = os.path.join(levels_dir, level_file)
+            filepath = self.catalog.levels_dir / level_file
             if os.path.exists(filepath):
                 os.remove(filepath)
-                print(f"Deleted level: {level_file}")
+                logger.info("Deleted level: %s", level_file)
                 return True
             else:
-                print(f"Level file not found: {level_file}")
+                logger.warning("Level file not found: %s", level_file)
                 return False
         except Exception as e:
-            print(f"Error deleting level: {e}")
+            logger.error("Error deleting level: %s", e)
             return False
     
     def run(self):
@@ -551,8 +638,27 @@ class LevelSelector:
                             self.level_to_delete = None
                         elif self.delete_mode:
                             self.delete_mode = False
+                        elif self.search_text:
+                            self.search_text = ""
+                            self.update_matches()
                         else:
+                            thumbnails.cancel_pending()
                             return None
+                    elif self.confirm_delete_dialog:
+                        pass
+                    elif self.handle_scroll_key(event.key):
+                        pass
+                    elif event.key == pygame.K_BACKSPACE:
+                        if self.search_text:
+                            self.search_text = self.search_text[:-1]
+                            self.first_row = 0
+                            self.update_matches()
+                    elif event.unicode and event.unicode.isprintable():
+                        self.search_text += event.unicode
+                        self.first_row = 0
+                        self.update_matches()
+                elif event.type == pygame.MOUSEWHEEL and not self.confirm_delete_dialog:
+                    self.scroll_to(self.first_row - event.y * 3)
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     mx, my = event.pos
                     current_screen = pygame.display.get_surface()
@@ -576,67 +682,64 @@ class LevelSelector:
                     else:
                         # Normal button handling
                         if self.back_button.handle_event(event):
+                            thumbnails.cancel_pending()
                             return None
                         
                         if self.delete_button and self.delete_button.handle_event(event):
                             self.delete_mode = not self.delete_mode
                         
-                        for button in self.buttons:
-                            if button.handle_event(event):
+                        for row in self.rows:
+                            if row.handle_event(event):
                                 if self.delete_mode:
                                     # Show delete confirmation
-                                    self.level_to_delete = button.level_file
+                                    self.level_to_delete = row.entry['file']
                                     self.confirm_delete_dialog = True
                                 else:
                                     # Normal level selection
-                                    levels_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "levels")
-                                    return os.path.join(levels_dir, button.level_file)
+                                    thumbnails.cancel_pending()
+                                    return str(self.catalog.path_of(row.entry))
                 
                 # Handle button hover states
                 if not self.confirm_delete_dialog:
                     self.back_button.handle_event(event)
                     if self.delete_button:
                         self.delete_button.handle_event(event)
-                    for button in self.buttons:
-                        button.handle_event(event)
+                    for row in self.rows:
+                        row.handle_event(event)
+                
+                # Rebind the rows straight away so clicks after a scroll hit the right level
+                current_screen = pygame.display.get_surface()
+                self.layout_rows(*current_screen.get_size())
             
             current_screen = pygame.display.get_surface()
             screen_w, screen_h = current_screen.get_size()
-            
-            # Dynamically adjust button positions
-            cols = 3
-            button_width, button_height = 200, 80
-            start_x = screen_w // 2 - (cols * button_width + (cols - 1) * 20) // 2
-            start_y = 150
-            
-            for i, button in enumerate(self.buttons):
-                col = i % cols
-                row = i // cols
-                x = start_x + col * (button_width + 20)
-                y = start_y + row * (button_height + 20)
-                button.rect = pygame.Rect(x, y, button_width, button_height)
+            self.layout_rows(screen_w, screen_h)
+            thumbnails.poll()
             
             self.draw_background(current_screen)
             
             # Draw title
-            title = self.title_font.render("Select Level", True, DARK_GREEN)
+            title = render_text(self.title_font, "Select Level", DARK_GREEN)
             title_rect = title.get_rect(center=(screen_w // 2, 80))
             # Title shadow
-            title_shadow = self.title_font.render("Select Level", True, BLACK)
+            title_shadow = render_text(self.title_font, "Select Level", BLACK)
             shadow_rect = title_shadow.get_rect(center=(screen_w // 2 + 2, 82))
             current_screen.blit(title_shadow, shadow_rect)
             current_screen.blit(title, title_rect)
             
-            # Draw level buttons
-            for button in self.buttons:
-                # Highlight buttons in delete mode
+            self.draw_search_box(current_screen)
+            
+            # Draw the rows in view
+            for row in self.rows:
+                # Highlight rows in delete mode
                 if self.delete_mode:
-                    button.color = UI_DANGER
-                    button.hover_color = RED
+                    row.color = UI_DANGER
+                    row.hover_color = RED
                 else:
-                    button.color = FOREST_GREEN
-                    button.hover_color = LIGHT_GREEN
-                button.draw(current_screen)
+                    row.color = FOREST_GREEN
+                    row.hover_color = LIGHT_GREEN
+                row.draw(current_screen)
+            self.draw_scrollbar(current_screen)
             
             # Draw back button
             self.back_button.draw(current_screen)
@@ -654,7 +757,7 @@ class LevelSelector:
             
             # Draw mode indicator
             if self.delete_mode:
-                mode_text = FONTS['hud'].render("DELETE MODE: Click a level to delete it", True, RED)
+                mode_text = render_text(FONTS['hud'], "DELETE MODE: Click a level to delete it", RED)
                 mode_rect = mode_text.get_rect(center=(screen_w // 2, screen_h - 120))
                 current_screen.blit(mode_text, mode_rect)
             
@@ -667,8 +770,8 @@ class LevelSelector:
 
 def show_level_creator_message():
     """Show level creator placeholder message"""
-    font = pygame.font.SysFont('Arial', 48, bold=True)
-    message_font = pygame.font.SysFont('Arial', 24)
+    font = get_font('Arial', 48, bold=True)
+    message_font = get_font('Arial', 24)
     
     while True:
         for event in pygame.event.get():
@@ -693,27 +796,73 @@ def show_level_creator_message():
         screen_w, screen_h = current_screen.get_size()
         
         # Gradient background
-        for y in range(screen_h):
-            color_ratio = y / screen_h
-            r = int(135 + (173 - 135) * color_ratio)
-            g = int(206 + (216 - 206) * color_ratio)
-            b = int(235 + (230 - 235) * color_ratio)
-            pygame.draw.line(current_screen, (r, g, b), (0, y), (screen_w, y))
+        current_screen.blit(get_gradient((screen_w, screen_h), (135, 206, 235), (173, 216, 230)), (0, 0))
         
         # Title
-        title = font.render("Level Creator", True, DARK_GREEN)
+        title = render_text(font, "Level Creator", DARK_GREEN)
         title_rect = title.get_rect(center=(screen_w // 2, screen_h // 3))
         current_screen.blit(title, title_rect)
         
         # Message
-        message = message_font.render("Coming Soon!", True, FOREST_GREEN)
+        message = render_text(message_font, "Coming Soon!", FOREST_GREEN)
         message_rect = message.get_rect(center=(screen_w // 2, screen_h // 2))
         current_screen.blit(message, message_rect)
         
         # Instructions
-        instruction = message_font.render("Press any key or click to return to main menu", True, BROWN)
+        instruction = render_text(message_font, "Press any key or click to return to main menu", BROWN)
         instruction_rect = instruction.get_rect(center=(screen_w // 2, screen_h // 2 + 50))
         current_screen.blit(instruction, instruction_rect)
         
         pygame.display.flip()
-        clock.tick(FPS) 
\ No newline at end of file
+        clock.tick(FPS)
+
+
+def show_loading_screen(scene):
+    """Preload a scene's assets behind a progress bar; returns straight away if they are already loaded"""
+    preload = assets.preload(scene)
+    if preload.done:
+        return
+    
+    font = get_font('Arial', 48, bold=True)
+    
+    while not preload.done:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            elif event.type == pygame.VIDEORESIZE:
+                # Handle window resizing
+                new_width = max(event.w, MIN_SCREEN_W)
+                new_height = max(event.h, MIN_SCREEN_H)
+                pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE | pygame.DOUBLEBUF)
+        
+        # Workers decode in the background; converting for the display has to happen here
+        preload.update()
+        
+        current_screen = pygame.display.get_surface()
+        screen_w, screen_h = current_screen.get_size()
+        
+        # Gradient background
+        current_screen.blit(get_gradient((screen_w, screen_h), (135, 206, 235), (173, 216, 230)), (0, 0))
+        
+        # Title
+        title = render_text(font, "Loading...", DARK_GREEN)
+        title_rect = title.get_rect(center=(screen_w // 2, screen_h // 2 - 60))
+        current_screen.blit(title, title_rect)
+        
+        # Progress bar
+        bar_rect = pygame.Rect(0, 0, min(500, screen_w - 80), 28)
+        bar_rect.center = (screen_w // 2, screen_h // 2)
+        pygame.draw.rect(current_screen, UI_MID_BG, bar_rect, border_radius=8)
+        fill_rect = bar_rect.inflate(-6, -6)
+        fill_rect.width = int(fill_rect.width * preload.progress)
+        if fill_rect.width > 0:
+            pygame.draw.rect(current_screen, FOREST_GREEN, fill_rect, border_radius=6)
+        pygame.draw.rect(current_screen, DARK_GREEN, bar_rect, 3, border_radius=8)
+        
+        count = render_text(FONTS['small'], f"{preload.loaded + preload.failed} / {preload.total} assets", DARK_GREEN)
+        count_rect = count.get_rect(center=(screen_w // 2, bar_rect.bottom + 24))
+        current_screen.blit(count, count_rect)
+        
+        pygame.display.flip()
+        clock.tick(FPS)
@@ -0,0 +1,189 @@
+"""Counters, gauges and timers for hot paths, shown in the F3 overlay and dumped per wave"""
+
+import json
+import time
+import functools
+from datetime import datetime
+
+import pygame
+from settings import *
+from resource_manager import ResourceManager
+from game_logging import get_logger
+
+logger = get_logger('metrics')
+
+
+# pygame calls counted while metrics are on: metric name -> (module, attribute)
+PYGAME_CALLS = {
+    'image.load': (pygame.image, 'load'),
+    'transform.scale': (pygame.transform, 'scale'),
+    'transform.smoothscale': (pygame.transform, 'smoothscale'),
+    'transform.rotate': (pygame.transform, 'rotate'),
+    'transform.rotozoom': (pygame.transform, 'rotozoom'),
+    'font.SysFont': (pygame.font, 'SysFont'),
+    'font.Font': (pygame.font, 'Font'),
+}
+
+
+class _NullTimer:
+    """Timer used while metrics are off - does nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.add_time(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class Metrics:
+    """Named counters, gauges and timers
+
+    Call sites record unconditionally; while disabled every call returns
+    straight away. Enabling also wraps the pygame functions in PYGAME_CALLS
+    and pygame.Surface so asset loads, rescales, font creations and
+    surface allocations are counted without touching their callers -
+    e.g. a bullet that reloads its PNG shows up as image.load going up.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.counters = {}
+        self.gauges = {}
+        self.timers = {}  # name -> [calls, total ms, worst ms]
+        self._originals = {}
+
+    def enable(self, enabled=True):
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            self._install_pygame_hooks()
+        else:
+            self._remove_pygame_hooks()
+
+    def count(self, name, amount=1):
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def gauge(self, name, value):
+        """Record the current value of something, e.g. enemies alive"""
+        if not self.enabled:
+            return
+        self.gauges[name] = value
+
+    def add_time(self, name, ms):
+        if not self.enabled:
+            return
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = [0, 0.0, 0.0]
+        timer[0] += 1
+        timer[1] += ms
+        timer[2] = max(timer[2], ms)
+
+    def timer(self, name):
+        """Context manager timing its block under name"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name):
+        """Decorator counting and timing every call of a function under name"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.add_time(name, (time.perf_counter() - start) * 1000)
+            return wrapper
+        return decorator
+
+    def reset(self):
+        """Start counting from zero, e.g. at the start of a wave"""
+        self.counters = {}
+        self.gauges = {}
+        self.timers = {}
+
+    def snapshot(self):
+        """Everything recorded so far as plain data"""
+        return {
+            'counters': dict(sorted(self.counters.items())),
+            'gauges': dict(sorted(self.gauges.items())),
+            'timers': {name: {'calls': calls, 'total_ms': round(total, 3), 'worst_ms': round(worst, 3)}
+                       for name, (calls, total, worst) in sorted(self.timers.items())},
+        }
+
+    def dump_wave(self, level_name, wave):
+        """Write the snapshot for a finished wave to METRICS_DIR as JSON, then reset; returns the path"""
+        metrics_dir = ResourceManager.get_writable_path() / METRICS_DIR
+        data = {'level': level_name, 'wave': wave, 'time': datetime.now().isoformat(timespec='seconds')}
+        data.update(self.snapshot())
+
+        safe_name = "".join(c if c.isalnum() else "_" for c in level_name)
+        path = metrics_dir / f"{safe_name}_wave{wave}_{datetime.now():%Y%m%d_%H%M%S}.json"
+        try:
+            metrics_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            logger.info("Wave %d written to %s", wave, path)
+        except OSError as e:
+            logger.warning("Could not write %s: %s", path, e)
+            path = None
+
+        self.reset()
+        return path
+
+    def _install_pygame_hooks(self):
+        for name, (module, attribute) in PYGAME_CALLS.items():
+            original = getattr(module, attribute)
+            self._originals[name] = (module, attribute, original)
+            setattr(module, attribute, self._counting(name, original))
+
+        metrics = self
+
+        class CountedSurface(pygame.Surface):
+            """pygame.Surface that counts its allocations"""
+
+            def __init__(self, *args, **kwargs):
+                metrics.count('surface.alloc')
+                super().__init__(*args, **kwargs)
+
+        self._originals['surface.alloc'] = (pygame, 'Surface', pygame.Surface)
+        pygame.Surface = CountedSurface
+
+    def _remove_pygame_hooks(self):
+        for module, attribute, original in self._originals.values():
+            setattr(module, attribute, original)
+        self._originals = {}
+
+    def _counting(self, name, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.count(name)
+            return func(*args, **kwargs)
+        return wrapper
+
+
+metrics = Metrics()
@@ -2,6 +2,7 @@ import heapq
 import random
 from settings import GRID_W, GRID_H
 from grid import walkable
+from metrics import metrics
 
 class Node:
     __slots__ = ("x","y","g","h","f","parent")
@@ -21,6 +22,7 @@ def heuristic(a, b):
 def walkable(x, y, grid):
     return 0 <= x < GRID_W and 0 <= y < GRID_H and grid[y][x] == 0
 
+@metrics.timed('a_star')
 def a_star(start_xy, end_xy, grid=None):
     if grid is None:
         from grid import GRID_MAP
@@ -39,11 +41,14 @@ def a_star(start_xy, end_xy, grid=None):
     open_heap = []
     heapq.heappush(open_heap, start)
     closed = set()
+    expanded = 0
 
     while open_heap:
         current = heapq.heappop(open_heap)
+        expanded += 1
         # reached goal
         if (current.x, current.y) == end_xy:
+            metrics.count('a_star.nodes_expanded', expanded)
             path = []
             while current:
                 path.append((current.x, current.y))
@@ -72,4 +77,6 @@ def a_star(start_xy, end_xy, grid=None):
                 heapq.heappush(open_heap, neighbor)
 
     # no path found
+    metrics.count('a_star.nodes_expanded', expanded)
+    metrics.count('a_star.no_path')
     return []
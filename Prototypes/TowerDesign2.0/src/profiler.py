@@ -0,0 +1,87 @@
+"""Rolling per-subsystem timings of the game loop, for the debug overlay"""
+
+import time
+from array import array
+from settings import *
+
+
+class FrameProfiler:
+    """Times the pieces of each frame over the last `history` frames
+
+    The loop calls begin_frame() after clock.tick(), lap(name) after each
+    piece of work - the time since the previous lap is charged to name -
+    and end_frame() once the frame is presented. Timings go into fixed
+    ring buffers, so recording allocates nothing once every section has
+    been seen. While disabled every call returns straight away.
+    """
+
+    def __init__(self, history=PROFILER_HISTORY):
+        self.enabled = False
+        self.history = history
+        self.frame_times = array('f', [0.0]) * history  # Work per frame in ms, excluding the tick delay
+        self.sections = {}  # name -> ring of ms per frame, in the order first seen
+        self.index = 0  # Ring slot of the frame being recorded
+        self.frames = 0  # Frames recorded, up to history
+        self._frame_start = 0.0
+        self._last = 0.0
+
+    def declare(self, names):
+        """Add sections up front so they are listed in this order, whichever runs first"""
+        for name in names:
+            if name not in self.sections:
+                self.sections[name] = array('f', [0.0]) * self.history
+
+    def reset(self):
+        """Forget all recorded frames, e.g. when the overlay is switched on"""
+        self.frame_times = array('f', [0.0]) * self.history
+        for name in self.sections:
+            self.sections[name] = array('f', [0.0]) * self.history
+        self.index = 0
+        self.frames = 0
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_start = self._last = time.perf_counter()
+        index = self.index
+        for times in self.sections.values():
+            times[index] = 0.0
+
+    def lap(self, name):
+        """Charge the time since the previous lap (or the frame start) to section name"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        times = self.sections.get(name)
+        if times is None:
+            times = self.sections[name] = array('f', [0.0]) * self.history
+        times[self.index] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.frame_times[self.index] = (time.perf_counter() - self._frame_start) * 1000
+        self.index = (self.index + 1) % self.history
+        self.frames = min(self.frames + 1, self.history)
+
+    def recent_frame_times(self):
+        """Frame times in ms, oldest first"""
+        if self.frames < self.history:
+            return list(self.frame_times[:self.frames])
+        return list(self.frame_times[self.index:]) + list(self.frame_times[:self.index])
+
+    def summary(self):
+        """(average ms, worst ms) of whole frames and {section: (average ms, worst ms)} over the history"""
+        count = max(1, self.frames)
+        recorded = self.recent_frame_times() or [0.0]
+        frame_stats = (sum(recorded) / count, max(recorded))
+
+        section_stats = {}
+        for name, times in self.sections.items():
+            recorded = times if self.frames == self.history else times[:self.frames]
+            section_stats[name] = (sum(recorded) / count, max(recorded, default=0.0))
+        return frame_stats, section_stats
+
+
+profiler = FrameProfiler()
@@ -0,0 +1,155 @@
+"""Best times and run history, kept in SQLite in the user data folder instead of in the level files"""
+
+import atexit
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+
+from settings import *
+from resource_manager import ResourceManager
+from game_logging import get_logger
+
+logger = get_logger('records')
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS best_times (
+    level_hash TEXT PRIMARY KEY,
+    level_name TEXT NOT NULL,
+    best_time REAL NOT NULL,
+    achieved_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    level_hash TEXT NOT NULL,
+    level_name TEXT NOT NULL,
+    result TEXT NOT NULL,
+    time REAL NOT NULL,
+    wave INTEGER NOT NULL,
+    finished_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_level ON runs (level_hash, id);
+"""
+
+
+class RecordsStore:
+    """Best time per level and every finished run, keyed by level_format.level_hash()
+
+    Best times are read once and then answered from memory. Recording a run
+    updates memory straight away and queues the write for a background
+    thread, which commits each run in its own transaction - the victory
+    screen never waits on the disk and a crash never leaves half a record.
+    Level files are only ever read.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or ResourceManager.get_user_data_path() / RECORDS_FILE
+        self._best_times = None  # level hash -> best time, loaded on first use
+        self._queue = queue.Queue()
+        self._writer = None
+
+    def best_time(self, level_hash, legacy_best=None):
+        """Best time for a level, or legacy_best (from an old level file) if that is better"""
+        self._load()
+        best = self._best_times.get(level_hash)
+        if legacy_best is not None and (best is None or legacy_best < best):
+            return legacy_best
+        return best
+
+    def record_run(self, level_hash, level_name, result, time, wave):
+        """Add a finished run ('victory' or 'defeat'); victories faster than the stored best replace it"""
+        self._load()
+        finished_at = datetime.now().isoformat(timespec='seconds')
+        best = self._best_times.get(level_hash)
+        new_best = result == 'victory' and (best is None or time < best)
+        if new_best:
+            self._best_times[level_hash] = time
+        self._submit((level_hash, level_name, result, time, wave, finished_at, new_best))
+
+    def recent_runs(self, level_hash, limit=10):
+        """Latest runs of a level as (result, time, wave, finished_at), newest first"""
+        self.flush()
+        try:
+            connection = self._connect()
+            try:
+                return connection.execute(
+                    "SELECT result, time, wave, finished_at FROM runs WHERE level_hash = ? ORDER BY id DESC LIMIT ?",
+                    (level_hash, limit)).fetchall()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not read runs from %s: %s", self.path, e)
+            return []
+
+    def flush(self):
+        """Wait until every queued run has been written"""
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self):
+        """Write out queued runs and stop the writer thread"""
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def _load(self):
+        if self._best_times is not None:
+            return
+        self._best_times = {}
+        try:
+            connection = self._connect()
+            try:
+                self._best_times.update(connection.execute("SELECT level_hash, best_time FROM best_times"))
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Could not read records from %s: %s", self.path, e)
+
+    def _submit(self, run):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_runs, name="records-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.close)
+        self._queue.put(run)
+
+    def _write_runs(self):
+        """Writer thread: commit queued runs until close() sends None"""
+        connection = None
+        while True:
+            run = self._queue.get()
+            try:
+                if run is None:
+                    return
+                if connection is None:
+                    connection = self._connect()
+                level_hash, level_name, result, time, wave, finished_at, new_best = run
+                with connection:
+                    connection.execute(
+                        "INSERT INTO runs (level_hash, level_name, result, time, wave, finished_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (level_hash, level_name, result, time, wave, finished_at))
+                    if new_best:
+                        connection.execute(
+                            "INSERT OR REPLACE INTO best_times (level_hash, level_name, best_time, achieved_at) "
+                            "VALUES (?, ?, ?, ?)",
+                            (level_hash, level_name, time, finished_at))
+                if new_best:
+                    logger.info("New best time saved: %.2fs", time)
+            except (sqlite3.Error, OSError) as e:
+                logger.error("Could not save run to %s: %s", self.path, e)
+            finally:
+                self._queue.task_done()
+                if run is None and connection is not None:
+                    connection.close()
+
+
+records = RecordsStore()
@@ -0,0 +1,157 @@
+"""Caches for fonts and rendered text so draw code doesn't redo the same work every frame"""
+
+import pygame
+from collections import OrderedDict
+
+
+class FontCache:
+    """Registry of font objects keyed by (face, size, bold, italic)"""
+
+    _fonts = {}
+
+    @classmethod
+    def get_font(cls, face='Arial', size=20, bold=False, italic=False):
+        """Get a system font, looking it up only the first time it is requested"""
+        cache_key = (face, size, bold, italic)
+
+        if cache_key not in cls._fonts:
+            cls._fonts[cache_key] = pygame.font.SysFont(face, size, bold=bold, italic=italic)
+
+        return cls._fonts[cache_key]
+
+    @classmethod
+    def clear(cls):
+        cls._fonts.clear()
+
+
+class TextCache:
+    """Least-recently-used cache of rendered text surfaces
+
+    Returned surfaces are shared - copy one before changing its alpha or
+    drawing onto it.
+    """
+
+    max_entries = 512
+    _surfaces = OrderedDict()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def render(cls, font, text, color, antialias=True):
+        """Same as font.render(text, antialias, color), but reuses earlier results"""
+        cache_key = (font, text, tuple(color), antialias)
+
+        surface = cls._surfaces.get(cache_key)
+        if surface is not None:
+            cls._surfaces.move_to_end(cache_key)
+            cls.hits += 1
+            return surface
+
+        cls.misses += 1
+        surface = font.render(text, antialias, color)
+        cls._surfaces[cache_key] = surface
+        if len(cls._surfaces) > cls.max_entries:
+            cls._surfaces.popitem(last=False)
+
+        return surface
+
+    @classmethod
+    def clear(cls):
+        cls._surfaces.clear()
+
+    @classmethod
+    def get_stats(cls):
+        """Cache statistics for profiling"""
+        return {
+            'entries': len(cls._surfaces),
+            'hits': cls.hits,
+            'misses': cls.misses,
+        }
+
+
+class GradientCache:
+    """Least-recently-used cache of vertical gradient backgrounds and panels
+
+    Keyed by (size, top colour, bottom colour, border radius), so a screen
+    background or panel is drawn row by row once and then reused with a
+    single blit until the window or panel size changes. Colours may be RGB
+    or RGBA; RGBA gradients and rounded panels get per-pixel alpha. The
+    cache is bounded by the pixel memory it holds, as full-window entries
+    are tens of megabytes at 4K. Animated panels should get their gradient
+    at a fixed size and scale it rather than ask for every size.
+    """
+
+    max_bytes = 128 * 1024 * 1024
+    _surfaces = OrderedDict()
+    _bytes = 0
+
+    @classmethod
+    def get(cls, size, top_color, bottom_color, border_radius=0):
+        """Get a gradient surface from top_color to bottom_color, building it on first use"""
+        size = (int(size[0]), int(size[1]))
+        cache_key = (size, tuple(top_color), tuple(bottom_color), border_radius)
+
+        surface = cls._surfaces.get(cache_key)
+        if surface is not None:
+            cls._surfaces.move_to_end(cache_key)
+            return surface
+
+        surface = cls._build(size, tuple(top_color), tuple(bottom_color), border_radius)
+        cls._surfaces[cache_key] = surface
+        cls._bytes += cls._size_of(surface)
+        # Drop the least recently used, but always keep the one just built
+        while cls._bytes > cls.max_bytes and len(cls._surfaces) > 1:
+            _, dropped = cls._surfaces.popitem(last=False)
+            cls._bytes -= cls._size_of(dropped)
+
+        return surface
+
+    @staticmethod
+    def _size_of(surface):
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    @staticmethod
+    def _build(size, top_color, bottom_color, border_radius):
+        width, height = size
+        has_alpha = len(top_color) == 4 or len(bottom_color) == 4 or border_radius > 0
+        if has_alpha:
+            top_color = (top_color + (255,))[:4]
+            bottom_color = (bottom_color + (255,))[:4]
+
+        surface = pygame.Surface(size, pygame.SRCALPHA if has_alpha else 0)
+        for y in range(height):
+            ratio = y / height
+            color = tuple(int(a + (b - a) * ratio) for a, b in zip(top_color, bottom_color))
+            pygame.draw.line(surface, color, (0, y), (width, y))
+
+        if border_radius > 0:
+            # Cut the corners off by keeping only what lies inside a rounded rect
+            mask = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(), border_radius=border_radius)
+            surface.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+
+        if pygame.display.get_surface():
+            surface = surface.convert_alpha() if has_alpha else surface.convert()
+
+        return surface
+
+    @classmethod
+    def clear(cls):
+        cls._surfaces.clear()
+        cls._bytes = 0
+
+
+def get_font(face='Arial', size=20, bold=False, italic=False):
+    """Shortcut for FontCache.get_font"""
+    return FontCache.get_font(face, size, bold, italic)
+
+
+def render_text(font, text, color, antialias=True):
+    """Shortcut for TextCache.render"""
+    return TextCache.render(font, text, color, antialias)
+
+
+def get_gradient(size, top_color, bottom_color, border_radius=0):
+    """Shortcut for GradientCache.get"""
+    return GradientCache.get(size, top_color, bottom_color, border_radius)
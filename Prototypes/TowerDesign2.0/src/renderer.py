@@ -0,0 +1,316 @@
+"""Dirty-rectangle rendering, batched entity drawing and render scaling for the play screen"""
+
+import pygame
+from settings import *
+from game_logging import get_logger
+
+logger = get_logger('render')
+
+
+# Draw layers of a DrawList, bottom to top
+LAYER_TOWERS = 0
+LAYER_BULLETS = 1
+LAYER_ENEMIES = 2
+LAYER_HEALTH_BARS = 3
+LAYER_OVERLAYS = 4
+LAYER_COUNT = 5
+
+HEALTH_BAR_HEIGHT = 4
+
+
+class HealthBarAtlas:
+    """Pre-rendered health bar strips, one per bar width
+
+    Each strip holds the red background row above the green foreground row,
+    so a bar is two blits of areas of the same surface instead of two
+    pygame.draw.rect calls.
+    """
+
+    _strips = {}
+
+    @classmethod
+    def get_strip(cls, width):
+        if width not in cls._strips:
+            strip = pygame.Surface((width, HEALTH_BAR_HEIGHT * 2))
+            strip.fill(RED, (0, 0, width, HEALTH_BAR_HEIGHT))
+            strip.fill(GREEN, (0, HEALTH_BAR_HEIGHT, width, HEALTH_BAR_HEIGHT))
+            if pygame.display.get_surface():
+                strip = strip.convert()
+            cls._strips[width] = strip
+        return cls._strips[width]
+
+    @classmethod
+    def clear(cls):
+        cls._strips.clear()
+
+
+class DrawList:
+    """One frame's entity blits, submitted layer by layer in a single Surface.blits call
+
+    Entities queue their sprite, health bar and overlays instead of drawing
+    straight away; flush() then draws every queued blit in layer order and
+    empties the list so it can be reused next frame.
+    """
+
+    def __init__(self):
+        self._layers = [[] for _ in range(LAYER_COUNT)]
+        self.last_blit_count = 0
+        self.view = None  # Screen rect that entities outside are culled against, None draws everything
+
+    def visible(self, rect):
+        """True if something covering rect would be seen - entities check this before queueing"""
+        return self.view is None or self.view.colliderect(rect)
+
+    def add(self, layer, surface, dest, area=None):
+        """Queue a blit of surface (or the area of it) at dest"""
+        if area is None:
+            self._layers[layer].append((surface, dest))
+        else:
+            self._layers[layer].append((surface, dest, area))
+
+    def add_health_bar(self, x, y, width, fill_width):
+        """Queue a health bar of the given width, filled green up to fill_width"""
+        strip = HealthBarAtlas.get_strip(width)
+        bars = self._layers[LAYER_HEALTH_BARS]
+        bars.append((strip, (x, y), (0, 0, width, HEALTH_BAR_HEIGHT)))
+        if fill_width > 0:
+            bars.append((strip, (x, y), (0, HEALTH_BAR_HEIGHT, fill_width, HEALTH_BAR_HEIGHT)))
+
+    def flush(self, screen):
+        """Draw everything queued so far, lowest layer first, and empty the list"""
+        batch = []
+        for items in self._layers:
+            batch.extend(items)
+            items.clear()
+
+        self.last_blit_count = len(batch)
+        if batch:
+            screen.blits(batch, doreturn=False)
+
+
+class DirtyRectRenderer:
+    """Redraws and presents only the parts of the play screen that changed
+
+    The static background (window fill + map tiles) is kept in one buffer per
+    window size and redrawn into it when the grid or the camera view changes,
+    so panning repaints the visible chunks without allocating. Every frame the regions drawn in the previous frame
+    are restored from it, the moving things are drawn again on top, and only
+    the old and new regions are passed to pygame.display.update(). Frames
+    showing a full-screen overlay fall back to a full redraw and flip.
+    """
+
+    def __init__(self):
+        self.background = None
+        self._background_key = None
+
+        self._previous_rects = []  # Moving things drawn last frame - erased this frame
+        self._frame_rects = []  # Moving things drawn this frame - erased next frame
+        self._retained_rects = []  # Redrawn regions that stay on screen until redrawn again (HUD)
+        self._full_frame = True
+        self._force_full_redraw = True
+
+        # Statistics for the debug overlay and benchmarks
+        self.frames = 0
+        self.full_redraws = 0
+        self.last_dirty_area = 0
+
+    def request_full_redraw(self):
+        """Redraw the whole window next frame, e.g. after toggling the renderer"""
+        self._force_full_redraw = True
+
+    def _ensure_background(self, screen, game_map):
+        if self.background is None or self.background.get_size() != screen.get_size():
+            self.background = pygame.Surface(screen.get_size())
+            if pygame.display.get_surface():
+                self.background = self.background.convert()
+            self._background_key = None
+
+        # The tile chunks are cached by the map, so a pan only re-blits them into the same buffer
+        cache_key = (game_map.grid_version, get_camera_view())
+        if cache_key == self._background_key:
+            return
+
+        self.background.fill(BG_COLOUR)
+        game_map.draw_tiles(self.background)
+        self._background_key = cache_key
+        self._force_full_redraw = True
+
+    def begin_frame(self, screen, game_map, full_redraw=False):
+        """Restore the background under last frame's regions
+
+        Returns True when this frame is a full redraw, in which case the
+        caller should draw everything, including the HUD.
+        """
+        self._ensure_background(screen, game_map)
+
+        self._full_frame = full_redraw or self._force_full_redraw
+        # An overlay that just disappeared still needs one more full frame to clear it
+        self._force_full_redraw = full_redraw
+        self._frame_rects = []
+        self._retained_rects = []
+
+        if self._full_frame:
+            screen.blit(self.background, (0, 0))
+        else:
+            for rect in self._previous_rects:
+                screen.blit(self.background, rect, rect)
+
+        return self._full_frame
+
+    def damaged_region(self, rects, candidates=()):
+        """Bounding box of the parts of rects touched by last frame's regions or the candidates
+
+        Returns None when nothing overlaps, i.e. the retained content of rects
+        is still intact on screen.
+        """
+        others = self._previous_rects + list(candidates)
+        hits = []
+        for rect in rects:
+            hits.extend(rect.clip(others[i]) for i in rect.collidelistall(others))
+
+        if not hits:
+            return None
+        return hits[0].unionall(hits[1:])
+
+    def restore(self, screen, rects):
+        """Put the background back under retained regions (like the HUD) before redrawing them"""
+        for rect in rects:
+            screen.blit(self.background, rect, rect)
+            self._retained_rects.append(pygame.Rect(rect))
+
+    def mark(self, rects):
+        """Record regions drawn this frame so they are presented now and erased next frame"""
+        for rect in rects:
+            if rect:
+                self._frame_rects.append(pygame.Rect(rect))
+
+    def end_frame(self, screen):
+        """Present the frame - the changed regions only, or the whole window"""
+        screen_rect = screen.get_rect()
+        self.frames += 1
+
+        if self._full_frame:
+            pygame.display.flip()
+            self.full_redraws += 1
+            self.last_dirty_area = screen_rect.w * screen_rect.h
+        else:
+            dirty_rects = self._previous_rects + self._frame_rects + self._retained_rects
+            dirty_rects = [rect.clip(screen_rect) for rect in dirty_rects]
+            dirty_rects = [rect for rect in dirty_rects if rect.w and rect.h]
+            pygame.display.update(dirty_rects)
+            self.last_dirty_area = sum(rect.w * rect.h for rect in dirty_rects)
+
+        self._previous_rects = self._frame_rects
+
+
+class RenderScaler:
+    """Draws the play screen at a fraction of the window size and stretches it over the window
+
+    On very large displays most of the frame goes into filling and blitting
+    millions of pixels. Below scale 1.0 the scene is drawn on an offscreen
+    surface that much smaller and scaled up once when presented; mouse
+    positions are mapped onto it with to_render(). With auto on, the scale
+    steps down through RENDER_SCALE_STEPS while frames miss the FPS budget
+    and back up when the larger size is expected to fit. Stretching costs
+    about one full-window blit, so a smaller scale is not always faster;
+    the median frame time of each step is remembered and a step that
+    measured slower is not picked again until the window size changes.
+    """
+
+    def __init__(self, scale=RENDER_SCALE, auto=AUTO_RENDER_SCALE):
+        self.scale = scale
+        self.auto = auto
+        self.window_size = None
+        self.size = None  # Size of the surface the scene is drawn on
+        self.surface = None
+        self._frame_times = []
+        self._medians = {}  # scale -> median frame ms measured at the current window size
+
+    @property
+    def active(self):
+        """True when drawing offscreen at a reduced size"""
+        return self.scale < 1.0
+
+    def update(self, window_size):
+        """Work out the render size for the window and point current_viewport() at it; returns the size"""
+        if tuple(window_size) != self.window_size:
+            self._medians.clear()
+        self.window_size = tuple(window_size)
+        if self.active:
+            self.size = (max(1, int(window_size[0] * self.scale)), max(1, int(window_size[1] * self.scale)))
+            set_render_size(self.size)
+        else:
+            self.size = self.window_size
+            set_render_size(None)
+        return self.size
+
+    def release(self):
+        """Point current_viewport() back at the window and drop the offscreen surface"""
+        set_render_size(None)
+        self.surface = None
+
+    def to_render(self, pos):
+        """Map a window position, e.g. the mouse, onto the render surface"""
+        if not self.active or not self.window_size:
+            return pos
+        return (pos[0] * self.size[0] // self.window_size[0], pos[1] * self.size[1] // self.window_size[1])
+
+    def begin_frame(self, window):
+        """Surface to draw this frame on - the window itself at full scale"""
+        if not self.active:
+            return window
+        if self.surface is None or self.surface.get_size() != self.size:
+            self.surface = pygame.Surface(self.size).convert(window)
+        return self.surface
+
+    def end_frame(self, window):
+        """Stretch the offscreen frame over the window and present it"""
+        if self.active:
+            if RENDER_SCALE_SMOOTH:
+                pygame.transform.smoothscale(self.surface, window.get_size(), window)
+            else:
+                pygame.transform.scale(self.surface, window.get_size(), window)
+        pygame.display.flip()
+
+    def _step_index(self):
+        return min(range(len(RENDER_SCALE_STEPS)), key=lambda i: abs(RENDER_SCALE_STEPS[i] - self.scale))
+
+    def cycle(self):
+        """Switch to the next of RENDER_SCALE_STEPS, wrapping around; turns auto selection off"""
+        self.scale = RENDER_SCALE_STEPS[(self._step_index() + 1) % len(RENDER_SCALE_STEPS)]
+        self.auto = False
+        self._frame_times.clear()
+
+    def record_frame(self, frame_ms):
+        """Feed the time a frame took to update and draw; returns True when auto selection changed the scale"""
+        if not self.auto:
+            return False
+        self._frame_times.append(frame_ms)
+        if len(self._frame_times) < RENDER_SCALE_SAMPLE_FRAMES:
+            return False
+
+        self._frame_times.sort()
+        median_ms = self._frame_times[len(self._frame_times) // 2]
+        self._frame_times.clear()
+
+        self._medians[self.scale] = median_ms
+        fastest = min(self._medians, key=self._medians.get)
+
+        budget_ms = 1000 / FPS
+        index = self._step_index()
+        lower = RENDER_SCALE_STEPS[index - 1] if index > 0 else None
+        higher = RENDER_SCALE_STEPS[index + 1] if index + 1 < len(RENDER_SCALE_STEPS) else None
+        if self._medians[fastest] < median_ms * 0.9:
+            # Another step already measured clearly faster - go back to it
+            new_scale = fastest
+        elif median_ms > budget_ms and lower is not None and lower not in self._medians:
+            new_scale = lower
+        elif higher is not None and median_ms * (higher / self.scale) ** 2 <= budget_ms * 0.75:
+            # Pixel work grows with the area; only step up when that still leaves some headroom
+            new_scale = higher
+        else:
+            return False
+
+        logger.info("%.1f ms/frame, render scale %.0f%% -> %.0f%%", median_ms, self.scale * 100, new_scale * 100)
+        self.scale = new_scale
+        return True
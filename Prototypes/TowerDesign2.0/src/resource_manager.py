@@ -9,6 +9,7 @@ class ResourceManager:
     """Manages resource paths for both development and packaged environments"""
     
     _base_path = None
+    USER_DATA_DIR = "ForestGuard"
     
     @classmethod
     def get_base_path(cls):
@@ -22,6 +23,25 @@ class ResourceManager:
                 cls._base_path = Path(__file__).parent.parent
         return cls._base_path
     
+    @classmethod
+    def get_writable_path(cls):
+        """Get the folder for files the game writes (logs, metrics) - next to the executable when packaged"""
+        if getattr(sys, 'frozen', False):
+            # _MEIPASS is a temporary folder removed when the game exits
+            return Path(sys.executable).parent
+        return cls.get_base_path()
+    
+    @classmethod
+    def get_user_data_path(cls):
+        """Get the per-user folder for saved progress such as best times (not created here)"""
+        if sys.platform == 'win32':
+            base = os.environ.get('APPDATA') or Path.home() / "AppData" / "Roaming"
+        elif sys.platform == 'darwin':
+            base = Path.home() / "Library" / "Application Support"
+        else:
+            base = os.environ.get('XDG_DATA_HOME') or Path.home() / ".local" / "share"
+        return Path(base) / cls.USER_DATA_DIR
+    
     @classmethod
     def get_asset_path(cls, relative_path):
         """Get full path to an asset file"""
@@ -1,4 +1,10 @@
 import pygame
+from render_cache import get_font
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional - Viewport batch conversions fall back to lists
+    numpy = None
 
 
 GRID_SIZE      = 32
@@ -70,6 +76,87 @@ TOWER_COSTS = {
 WAVE_REWARD = 50
 KILL_REWARD = 0
 
+# Bullets - each bullet image is pre-rotated into BULLET_ROTATION_STEPS angle buckets
+BULLET_SIZE = 40
+BULLET_ROTATION_STEPS = 36
+BULLET_MAX_LIFETIME = 4.0    # seconds before a bullet that never hit expires
+# Bullets fly in world units (GRID_SIZE per tile) like enemies, so the window size and zoom do not
+# change how fast they travel or what they hit
+BULLET_RETARGET_RANGE = 80   # world units - a bullet whose target is gone looks for a new one this close
+BULLET_SPEED = 160           # world units per second
+BULLET_HIT_SIZE = 20         # world units - hit box side, added to the enemy's size
+
+# Projectile mode - 'simulated' moves every bullet and tests it for collisions each frame,
+# 'scheduled' predicts the impact when the shot is fired and applies damage from an event queue
+PROJECTILE_MODE = 'simulated'
+RENDER_SCHEDULED_PROJECTILES = True  # False skips the cosmetic sprites (headless/turbo runs)
+
+# Floating combat text (MISS / Fire / Zap) - at most EFFECT_CAP effects are alive at once,
+# and their fade-out is drawn with EFFECT_ALPHA_LEVELS pre-rendered alpha steps
+EFFECT_CAP = 256
+EFFECT_ALPHA_LEVELS = 16
+
+# Redraw only the changed parts of the play screen instead of the whole window (F4 toggles in game)
+DIRTY_RECT_RENDERING = False
+
+# Frame profiler shown with the F3 overlay - timings are averaged over PROFILER_HISTORY frames
+# and the overlay text is refreshed every PROFILER_REFRESH seconds
+PROFILER_HISTORY = 120
+PROFILER_REFRESH = 0.25
+
+# Hot-path counters (asset loads, rescales, pathfinding, spawns, shots...) - always collected while
+# the F3 overlay is shown; with METRICS_ENABLED they are also written to METRICS_DIR after every wave
+METRICS_ENABLED = False
+METRICS_DIR = "metrics"
+
+# Logging - LOG_LEVEL applies to every subsystem ('game', 'level', 'enemy', 'tower', 'audio', 'map',
+# 'menu', 'library', 'editor', 'render', 'metrics', 'records', 'assets') unless LOG_LEVELS overrides it, e.g.
+# {'audio': 'DEBUG'}. Per-enemy, per-shot and per-sound messages are DEBUG. Records are written by a
+# background thread to the console and to LOG_DIR/LOG_FILE, rotated at LOG_MAX_BYTES
+LOG_LEVEL = "INFO"
+LOG_LEVELS = {}
+LOG_CONSOLE_LEVEL = "INFO"
+LOG_DIR = "logs"
+LOG_FILE = "forest_guard.log"
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Best times and run history, in the per-user data folder (level files are never written to)
+RECORDS_FILE = "records.sqlite3"
+
+# Level browser minimaps - composed by THUMBNAIL_WORKERS background threads, at most THUMBNAIL_SIZE
+# pixels, and cached as PNGs in THUMBNAIL_DIR in the user data folder under the level's grid hash
+THUMBNAIL_SIZE = (72, 48)
+THUMBNAIL_WORKERS = 2
+THUMBNAIL_DIR = "thumbnails"
+
+# Assets decoded ahead of use - PRELOAD_MANIFEST in assets/ lists the files of each scene ('startup',
+# 'game', 'library'). PRELOAD_WORKERS threads decode them while the loading screen converts up to
+# PRELOAD_FRAME_BUDGET_MS of them per frame to the display format
+PRELOAD_MANIFEST = "preload.json"
+PRELOAD_WORKERS = 4
+PRELOAD_FRAME_BUDGET_MS = 8
+
+# Internal render resolution of the play screen as a fraction of the window. Below 1.0 the scene
+# is drawn offscreen and scaled up once per frame, for 4K/5K displays where frames miss the FPS
+# budget. With AUTO_RENDER_SCALE the scale steps through RENDER_SCALE_STEPS by measured frame
+# time and keeps whichever step measured fastest (F5 cycles the steps by hand)
+RENDER_SCALE = 1.0
+RENDER_SCALE_STEPS = (0.5, 0.75, 1.0)
+AUTO_RENDER_SCALE = True
+RENDER_SCALE_SAMPLE_FRAMES = 60  # Frames measured before the automatic scale is reconsidered
+RENDER_SCALE_SMOOTH = False      # smoothscale looks softer but costs about 3x a plain scale
+
+# Camera over the play area - mouse wheel zooms, right/middle drag or the arrow keys pan, Home resets.
+# Map tiles are pre-rendered in chunks of up to CAMERA_CHUNK_TILES x CAMERA_CHUNK_TILES tiles,
+# fewer when zoomed in so a chunk stays within CAMERA_CHUNK_MAX_PX pixels
+CAMERA_MAX_ZOOM = 3.0
+CAMERA_ZOOM_STEP = 1.25
+CAMERA_PAN_SPEED = 600  # pixels per second with the arrow keys
+CAMERA_CHUNK_TILES = 16
+CAMERA_CHUNK_MAX_PX = 1024
+CAMERA_CHUNK_CACHE = 48  # Chunks kept around for panning back
+
 # Enemy colors
 ENEMY_COLORS = {
     'normal': BLUE,
@@ -94,68 +181,170 @@ TOWER_TYPES = [
 ]
 
 
-def grid_to_px(gx: int, gy: int, screen_width=None, screen_height=None) -> tuple[int,int]:
-    """Convert grid coordinates to pixel coordinates, with optional screen scaling"""
+def tile_center_world(gx, gy):
+    """World position of the centre of a grid tile
+
+    The simulation works in world units - GRID_SIZE per tile, independent of
+    the window size. Only drawing and mouse input go through a Viewport.
+    """
+    return ((gx + 0.5) * GRID_SIZE, (gy + 0.5) * GRID_SIZE)
+
+
+class Viewport:
+    """World/grid to screen transform for one window size
+
+    The scale, offsets and scaled tile size are worked out once per window
+    size instead of in every grid_to_px call; get one with get_viewport().
+    Without a camera view the whole map is fitted below the toolbar; with
+    one, the map is magnified by zoom around the world position center.
+    """
+
+    def __init__(self, screen_width, screen_height, zoom=1.0, center=None):
+        self.screen_size = (screen_width, screen_height)
+        self.zoom = zoom
+
+        # Scale the map to fit below the toolbar, keeping its aspect ratio
+        game_area_height = screen_height - UI_HEIGHT
+        scale_x = screen_width / (GRID_W * GRID_SIZE)
+        scale_y = game_area_height / (GRID_H * GRID_SIZE)
+        self.fit_scale = min(scale_x, scale_y)
+        self.scale = self.fit_scale * zoom
+
+        if center is None:
+            # Offset to centre the map in the game area
+            scaled_width = GRID_W * GRID_SIZE * self.scale
+            scaled_height = GRID_H * GRID_SIZE * self.scale
+            self.offset_x = (screen_width - scaled_width) // 2
+            self.offset_y = UI_HEIGHT + (game_area_height - scaled_height) // 2
+        else:
+            # Offset that puts the camera's centre in the middle of the game area
+            self.offset_x = (screen_width - 2 * center[0] * self.scale) // 2
+            self.offset_y = UI_HEIGHT + (game_area_height - 2 * center[1] * self.scale) // 2
+        self.play_area = pygame.Rect(0, UI_HEIGHT, screen_width, game_area_height)
+
+        # Tiles are drawn at a whole number of pixels
+        self.tile_size = int(GRID_SIZE * self.scale)
+        self.unit_scale = self.tile_size / GRID_SIZE  # Screen pixels per world unit for sizes and ranges
+
+        left, top = self.grid_to_px(0, 0)
+        right, bottom = self.grid_to_px(GRID_W, GRID_H)
+        self.game_area = pygame.Rect(left, top, right - left, bottom - top)  # The whole map, maybe partly off screen
+        self.visible_area = self.game_area.clip(self.play_area)  # The part of the map on screen, for culling
+
+    def grid_to_px(self, gx, gy):
+        """Top-left pixel of a grid tile"""
+        return int(gx * GRID_SIZE * self.scale + self.offset_x), int(gy * GRID_SIZE * self.scale + self.offset_y)
+
+    def px_to_grid(self, px, py):
+        """Grid tile under a pixel"""
+        gx = int((px - self.offset_x) / self.scale // GRID_SIZE)
+        gy = int((py - self.offset_y) / self.scale // GRID_SIZE)
+        return gx, gy
+
+    def tile_center(self, gx, gy):
+        """Centre pixel of a grid tile, as sprites are placed"""
+        px, py = self.grid_to_px(gx, gy)
+        return px + self.tile_size // 2, py + self.tile_size // 2
+
+    def world_to_px(self, wx, wy):
+        """Screen pixel of a world position"""
+        return wx * self.scale + self.offset_x, wy * self.scale + self.offset_y
+
+    def px_to_world(self, px, py):
+        """World position under a screen pixel"""
+        return (px - self.offset_x) / self.scale, (py - self.offset_y) / self.scale
+
+    def grid_to_px_many(self, gxs, gys):
+        """grid_to_px for sequences of coordinates at once; returns (xs, ys)
+
+        Uses NumPy arrays when available, lists otherwise.
+        """
+        if numpy is not None:
+            xs = (numpy.asarray(gxs) * GRID_SIZE * self.scale + self.offset_x).astype(int)
+            ys = (numpy.asarray(gys) * GRID_SIZE * self.scale + self.offset_y).astype(int)
+            return xs, ys
+        return ([int(gx * GRID_SIZE * self.scale + self.offset_x) for gx in gxs],
+                [int(gy * GRID_SIZE * self.scale + self.offset_y) for gy in gys])
+
+    def world_to_px_many(self, wxs, wys):
+        """world_to_px for sequences of coordinates at once; returns (xs, ys)"""
+        if numpy is not None:
+            return (numpy.asarray(wxs) * self.scale + self.offset_x,
+                    numpy.asarray(wys) * self.scale + self.offset_y)
+        return ([wx * self.scale + self.offset_x for wx in wxs],
+                [wy * self.scale + self.offset_y for wy in wys])
+
+
+_viewports = {}
+_render_size = None
+_camera_view = None
+
+
+def get_viewport(screen_width=None, screen_height=None) -> Viewport:
+    """Get the Viewport for a window size, defaulting to the default window size"""
     if screen_width is None:
         screen_width = DEFAULT_SCREEN_W
     if screen_height is None:
         screen_height = DEFAULT_SCREEN_H
-    
-    # Calculate scaling factors
-    game_area_height = screen_height - UI_HEIGHT
-    scale_x = screen_width / (GRID_W * GRID_SIZE)
-    scale_y = game_area_height / (GRID_H * GRID_SIZE)
-    scale = min(scale_x, scale_y)  # Maintain aspect ratio
-    
-    # Calculate offset to center the game area
-    scaled_width = GRID_W * GRID_SIZE * scale
-    scaled_height = GRID_H * GRID_SIZE * scale
-    offset_x = (screen_width - scaled_width) // 2
-    offset_y = UI_HEIGHT + (game_area_height - scaled_height) // 2
-    
-    return int(gx * GRID_SIZE * scale + offset_x), int(gy * GRID_SIZE * scale + offset_y)
+
+    key = (screen_width, screen_height, _camera_view)
+    viewport = _viewports.get(key)
+    if viewport is None:
+        if len(_viewports) >= 8:  # Only a few views are in use at a time; drop the old ones on resize or pan
+            _viewports.clear()
+        if _camera_view is None:
+            viewport = Viewport(screen_width, screen_height)
+        else:
+            viewport = Viewport(screen_width, screen_height, *_camera_view)
+        _viewports[key] = viewport
+    return viewport
+
+
+def set_camera_view(view):
+    """Make viewports show (zoom, world center) instead of the whole map; None fits the whole map"""
+    global _camera_view
+    _camera_view = view
+
+
+def get_camera_view():
+    """The (zoom, world center) set with set_camera_view(), or None"""
+    return _camera_view
+
+
+def set_render_size(size):
+    """Make current_viewport() describe an offscreen render target of this size; None means the window"""
+    global _render_size
+    _render_size = tuple(size) if size is not None else None
+
+
+def current_viewport() -> Viewport:
+    """Get the Viewport for the current render target - the window, or the default size without one"""
+    if _render_size is not None:
+        return get_viewport(*_render_size)
+    screen = pygame.display.get_surface()
+    if screen:
+        return get_viewport(*screen.get_size())
+    return get_viewport()
+
+
+def grid_to_px(gx: int, gy: int, screen_width=None, screen_height=None) -> tuple[int,int]:
+    """Convert grid coordinates to pixel coordinates, with optional screen scaling"""
+    return get_viewport(screen_width, screen_height).grid_to_px(gx, gy)
 
 
 def px_to_grid(px: int, py: int, screen_width=None, screen_height=None) -> tuple[int,int]:
     """Convert pixel coordinates to grid coordinates"""
-    if screen_width is None:
-        screen_width = DEFAULT_SCREEN_W
-    if screen_height is None:
-        screen_height = DEFAULT_SCREEN_H
-    
-    game_area_height = screen_height - UI_HEIGHT
-    scale_x = screen_width / (GRID_W * GRID_SIZE)
-    scale_y = game_area_height / (GRID_H * GRID_SIZE)
-    scale = min(scale_x, scale_y)
-    
-    scaled_width = GRID_W * GRID_SIZE * scale
-    scaled_height = GRID_H * GRID_SIZE * scale
-    offset_x = (screen_width - scaled_width) // 2
-    offset_y = UI_HEIGHT + (game_area_height - scaled_height) // 2
-    
-    # Adjust for UI offset and scaling
-    adjusted_x = (px - offset_x) / scale
-    adjusted_y = (py - offset_y) / scale
-    
-    gx = int(adjusted_x // GRID_SIZE)
-    gy = int(adjusted_y // GRID_SIZE)
-    
-    return gx, gy
+    return get_viewport(screen_width, screen_height).px_to_grid(px, py)
 
 
 def get_scaled_grid_size(screen_width=None, screen_height=None) -> int:
     """Get the scaled grid size for current screen dimensions"""
-    if screen_width is None:
-        screen_width = DEFAULT_SCREEN_W
-    if screen_height is None:
-        screen_height = DEFAULT_SCREEN_H
-    
-    game_area_height = screen_height - UI_HEIGHT
-    scale_x = screen_width / (GRID_W * GRID_SIZE)
-    scale_y = game_area_height / (GRID_H * GRID_SIZE)
-    scale = min(scale_x, scale_y)
-    
-    return int(GRID_SIZE * scale)
+    return get_viewport(screen_width, screen_height).tile_size
+
+
+def get_game_area_rect(screen_width=None, screen_height=None) -> pygame.Rect:
+    """Get the on-screen rectangle covered by the scaled map"""
+    return get_viewport(screen_width, screen_height).game_area.copy()
 
 
 pygame.init()
@@ -167,14 +356,14 @@ pygame.display.set_mode((DEFAULT_SCREEN_W, DEFAULT_SCREEN_H),
                         pygame.RESIZABLE | pygame.DOUBLEBUF)
 clock  = pygame.time.Clock()
 pygame.display.set_caption("Forest Guard - Tower Defense")
-FONT = pygame.font.SysFont(None, 24)
+FONT = get_font(None, 24)
 
 # Fonts dictionary for different UI elements - optimized font sizes
 FONTS = {
-    'title': pygame.font.SysFont('Arial', 72, bold=True),
-    'subtitle': pygame.font.SysFont('Arial', 28),  # increased from 24 to 28
-    'button': pygame.font.SysFont('Arial', 20, bold=True),  # reduced from 24 to 20 but kept clear
-    'hud': pygame.font.SysFont('Arial', 22),  # increased from 20 to 22
-    'small': pygame.font.SysFont('Arial', 18),  # increased from 16 to 18
-    'tiny': pygame.font.SysFont('Arial', 14)  # increased from 12 to 14
+    'title': get_font('Arial', 72, bold=True),
+    'subtitle': get_font('Arial', 28),  # increased from 24 to 28
+    'button': get_font('Arial', 20, bold=True),  # reduced from 24 to 20 but kept clear
+    'hud': get_font('Arial', 22),  # increased from 20 to 22
+    'small': get_font('Arial', 18),  # increased from 16 to 18
+    'tiny': get_font('Arial', 14)  # increased from 12 to 14
 }
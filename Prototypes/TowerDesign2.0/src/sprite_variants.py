@@ -0,0 +1,145 @@
+"""Scaled and recoloured sprite frames, generated once per resolution and cached"""
+
+import pygame
+from collections import OrderedDict
+
+try:
+    import numpy
+    from pygame import surfarray
+except ImportError:  # NumPy is optional - fall back to per-pixel loops
+    numpy = None
+
+
+# variant name -> RGBA colour blended over the sprite
+TINTS = {
+    'active': (255, 255, 0, 80),  # Yellow - enemies approaching the home
+    'hit': (255, 0, 0, 120),  # Red - home being attacked
+    'flash': (255, 255, 255, 120),  # White - hit flash
+}
+
+
+def grayscale(surface, darken=1):
+    """Greyscale copy of surface with per-pixel alpha; RGB is divided by darken
+
+    Fully transparent pixels come out as (0, 0, 0, 0).
+    """
+    width, height = surface.get_size()
+    result = pygame.Surface((width, height), pygame.SRCALPHA, 32)
+
+    if numpy is not None:
+        rgb = surfarray.array3d(surface)
+        alpha = surfarray.array_alpha(surface)
+        gray = (0.299 * rgb[..., 0] + 0.587 * rgb[..., 1] + 0.114 * rgb[..., 2]).astype(numpy.uint8) // darken
+        gray[alpha == 0] = 0
+
+        result_rgb = surfarray.pixels3d(result)
+        result_rgb[...] = gray[..., numpy.newaxis]
+        del result_rgb  # Release the surface lock
+        result_alpha = surfarray.pixels_alpha(result)
+        result_alpha[...] = alpha
+        del result_alpha
+        return result
+
+    for x in range(width):
+        for y in range(height):
+            color = surface.get_at((x, y))
+            if color.a > 0:
+                gray = int(0.299 * color.r + 0.587 * color.g + 0.114 * color.b) // darken
+                result.set_at((x, y), (gray, gray, gray, color.a))
+    return result
+
+
+def to_display_format(surface):
+    """Copy of surface in the window's pixel format, for fast blitting; no-op without a window"""
+    if not pygame.display.get_surface():
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def tint(surface, color):
+    """Copy of surface with an RGBA colour blended over it, keeping the surface's alpha"""
+    mask_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    mask_surface.fill(color)
+
+    combined = surface.copy()
+    combined.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+    return combined
+
+
+class SpriteVariants:
+    """Cache of sprite frames per (frame, size, variant), in the window's pixel format
+
+    Variants are None (just scaled), 'grayscale', 'disabled' (dark grey) or
+    a TINTS name. Frames are keyed by the Surface object itself, so callers
+    must share frame surfaces (e.g. one frame list per sprite sheet) rather
+    than reloading them. Both caches drop their least recently used entries,
+    so zooming through many sizes doesn't keep every old size alive.
+    """
+
+    max_frames = 512
+    max_overlays = 64
+    _frames = OrderedDict()
+    _overlays = OrderedDict()
+
+    @classmethod
+    def get(cls, frame, size=None, variant=None):
+        """Get frame scaled to size (None keeps its size) in the given variant"""
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+            if size == frame.get_size():
+                size = None
+        cache_key = (frame, size, variant)
+
+        surface = cls._frames.get(cache_key)
+        if surface is not None:
+            cls._frames.move_to_end(cache_key)
+            return surface
+
+        if variant is not None:
+            base = cls.get(frame, size)
+            if variant == 'grayscale':
+                surface = grayscale(base)
+            elif variant == 'disabled':
+                surface = grayscale(base, darken=3)
+            else:
+                surface = tint(base, TINTS[variant])
+        else:
+            surface = pygame.transform.scale(frame, size) if size is not None else frame
+        surface = cls._frames[cache_key] = to_display_format(surface)
+        if len(cls._frames) > cls.max_frames:
+            cls._frames.popitem(last=False)
+
+        return surface
+
+    @classmethod
+    def get_overlay(cls, size, color):
+        """Get a plain rectangle of an RGBA colour, e.g. for flashing a sprite's whole rect"""
+        cache_key = (tuple(size), tuple(color))
+
+        overlay = cls._overlays.get(cache_key)
+        if overlay is not None:
+            cls._overlays.move_to_end(cache_key)
+            return overlay
+
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill(color)
+        cls._overlays[cache_key] = overlay
+        if len(cls._overlays) > cls.max_overlays:
+            cls._overlays.popitem(last=False)
+
+        return overlay
+
+    @classmethod
+    def clear(cls):
+        cls._frames.clear()
+        cls._overlays.clear()
+
+    @classmethod
+    def get_stats(cls):
+        """Cache statistics for profiling"""
+        return {
+            'frames': len(cls._frames),
+            'overlays': len(cls._overlays),
+        }
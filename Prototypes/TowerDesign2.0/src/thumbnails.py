@@ -0,0 +1,177 @@
+"""Minimap thumbnails of level grids, composed in background threads and cached on disk"""
+
+import os
+import queue
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+try:
+    import numpy
+    from pygame import surfarray
+except ImportError:  # NumPy is optional - fall back to one blit per tile
+    numpy = None
+
+from settings import *
+from resource_manager import ResourceManager, get_tiles_path
+from level_format import load_level
+from assets import assets
+from sprite_variants import to_display_format
+from game_logging import get_logger
+
+logger = get_logger('render')
+
+
+TILE_FILES = ('path.png', 'grass.png')  # Indexed by grid value, as in MapComponent
+
+
+def compose_tiles(grid, tiles):
+    """Image of grid with tiles[value] in every cell
+
+    tiles is an array of shape (values, tile height, tile width, channels);
+    the result has shape (rows * tile height, columns * tile width, channels)
+    and is built with one NumPy gather instead of a blit per tile.
+    """
+    cells = numpy.clip(numpy.asarray(grid, dtype=numpy.intp), 0, len(tiles) - 1)
+    rows, columns = cells.shape
+    _, tile_h, tile_w, channels = tiles.shape
+    return tiles[cells].transpose(0, 2, 1, 3, 4).reshape(rows * tile_h, columns * tile_w, channels)
+
+
+def thumbnail_tile_px(columns, rows):
+    """Pixels per tile for a grid to fit in THUMBNAIL_SIZE"""
+    max_w, max_h = THUMBNAIL_SIZE
+    return max(1, min(max_w // max(columns, 1), max_h // max(rows, 1)))
+
+
+class ThumbnailCache:
+    """Thumbnails for the level browser, made off the UI thread
+
+    request() queues the visible levels on a small thread pool; each worker
+    loads a cached PNG or reads the level and composes its grid from
+    tile_px-sized copies of the map tiles, saving the PNG for next time.
+    Finished surfaces come back through a queue, and poll() converts them
+    to the display format on the UI thread. Thumbnails are keyed by grid
+    hash, so renamed or re-saved levels with the same map share one.
+    """
+
+    max_entries = 256
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or ResourceManager.get_user_data_path() / THUMBNAIL_DIR
+        self._surfaces = OrderedDict()  # (grid hash, tile px) -> converted surface
+        self._pending = {}  # (grid hash, tile px) -> future
+        self._done = queue.SimpleQueue()
+        self._tiles = {}  # tile px -> tiles scaled to tile_px, as an array or a list of surfaces
+        self._executor = None
+
+    def get(self, entry):
+        """Thumbnail for a catalog entry, or None until it has been made"""
+        key = (entry['grid_hash'], thumbnail_tile_px(entry['width'], entry['height']))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+        return surface
+
+    def request(self, entries, levels_dir):
+        """Make thumbnails for entries (the visible rows); requests for rows scrolled away are dropped"""
+        wanted = set()
+        for entry in entries:
+            tile_px = thumbnail_tile_px(entry['width'], entry['height'])
+            key = (entry['grid_hash'], tile_px)
+            wanted.add(key)
+            if key in self._surfaces or key in self._pending:
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(THUMBNAIL_WORKERS, thread_name_prefix="thumbnails")
+            tiles = self._scaled_tiles(tile_px)
+            self._pending[key] = self._executor.submit(self._make, key, levels_dir / entry['file'], tiles)
+
+        for key in [key for key in self._pending if key not in wanted]:
+            if self._pending[key].cancel():
+                del self._pending[key]
+
+    def poll(self):
+        """Take finished thumbnails from the workers; returns True if any arrived"""
+        arrived = False
+        while True:
+            try:
+                key, surface = self._done.get_nowait()
+            except queue.Empty:
+                return arrived
+            self._pending.pop(key, None)
+            if surface is None:
+                continue
+            self._surfaces[key] = to_display_format(surface)
+            if len(self._surfaces) > self.max_entries:
+                self._surfaces.popitem(last=False)
+            arrived = True
+
+    def cancel_pending(self):
+        """Drop queued requests, e.g. when the level browser closes"""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def _scaled_tiles(self, tile_px):
+        """Map tiles shrunk to tile_px, loaded on the UI thread the first time each size is needed"""
+        tiles = self._tiles.get(tile_px)
+        if tiles is None:
+            surfaces = [pygame.transform.smoothscale(assets.image(get_tiles_path(name)), (tile_px, tile_px))
+                        for name in TILE_FILES]
+            if numpy is not None:
+                # array3d is (x, y, rgb); compose_tiles works in rows
+                tiles = numpy.stack([surfarray.array3d(surface).transpose(1, 0, 2) for surface in surfaces])
+            else:
+                tiles = surfaces
+            self._tiles[tile_px] = tiles
+        return tiles
+
+    def _make(self, key, level_path, tiles):
+        """Worker thread: load or compose one thumbnail and hand it to the UI thread"""
+        grid_hash, tile_px = key
+        cache_path = self.cache_dir / f"{grid_hash}_{tile_px}.png"
+        surface = None
+        try:
+            if cache_path.exists():
+                surface = pygame.image.load(str(cache_path))
+            else:
+                surface = self._compose(load_level(level_path)['grid'], tiles, tile_px)
+                self._save(surface, cache_path)
+        except (OSError, ValueError, KeyError, IndexError, pygame.error) as e:
+            logger.warning("Could not make thumbnail for %s: %s", level_path.name, e)
+        self._done.put((key, surface))
+
+    @staticmethod
+    def _compose(grid, tiles, tile_px):
+        if numpy is not None:
+            # make_surface takes (x, y, rgb)
+            return surfarray.make_surface(compose_tiles(grid, tiles).transpose(1, 0, 2))
+
+        surface = pygame.Surface((len(grid[0]) * tile_px, len(grid) * tile_px))
+        for y, row in enumerate(grid):
+            for x, value in enumerate(row):
+                surface.blit(tiles[min(max(value, 0), len(tiles) - 1)], (x * tile_px, y * tile_px))
+        return surface
+
+    def _save(self, surface, cache_path):
+        """Write the PNG under a temporary name first, so a half-written file is never loaded"""
+        temp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".png")
+            os.close(fd)
+            pygame.image.save(surface, temp_path)
+            os.replace(temp_path, cache_path)
+        except (OSError, pygame.error) as e:
+            logger.debug("Could not cache thumbnail %s: %s", cache_path.name, e)
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+
+thumbnails = ThumbnailCache()
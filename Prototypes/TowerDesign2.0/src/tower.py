@@ -2,12 +2,21 @@ import pygame
 import os
 import math
 from settings import *
+from render_cache import get_font, render_text
 from bullet import BulletFactory
 from audio_manager import audio_manager
 from resource_manager import get_sprite_path
+from assets import assets
+from sprite_variants import SpriteVariants
+from renderer import LAYER_TOWERS
+from game_logging import get_logger
+
+logger = get_logger('tower')
 
 class TowerSprite:
     """Handles tower sprite loading and animation"""
+    _frame_sets = {}  # tower name -> (frames, idle frames, attack frames) shared by all towers of that type
+
     def __init__(self, tower_name):
         self.tower_name = tower_name
         self.frames = []
@@ -17,17 +26,24 @@ class TowerSprite:
         self.animation_timer = 0.0
         self.frame_duration = 0.5  # Half second per frame
         
-        # Load sprite sheet
-        sprite_path = get_sprite_path("tower", f"{tower_name}.png")
+        # Frames are loaded once per tower type and shared by every tower of
+        # that type, so their scaled variants are also built once per size
+        if tower_name not in TowerSprite._frame_sets:
+            self.load_sprite_sheet()
+            TowerSprite._frame_sets[tower_name] = (self.frames, self.idle_frames, self.attack_frames)
+        self.frames, self.idle_frames, self.attack_frames = TowerSprite._frame_sets[tower_name]
+
+    def load_sprite_sheet(self):
+        sprite_path = get_sprite_path("tower", f"{self.tower_name}.png")
         try:
             if sprite_path.exists():
-                self.sprite_sheet = pygame.image.load(str(sprite_path))
+                self.sprite_sheet = assets.image(sprite_path)
                 self.load_frames()
-                print(f"Loaded sprite for {tower_name}")
+                logger.debug("Loaded sprite for %s", self.tower_name)
             else:
                 raise FileNotFoundError(f"Sprite file not found: {sprite_path}")
         except (pygame.error, FileNotFoundError, OSError) as e:
-            print(f"Could not load sprite: {sprite_path}, using fallback - {e}")
+            logger.warning("Could not load sprite: %s, using fallback - %s", sprite_path, e)
             self.sprite_sheet = None
             self.create_fallback_frames()
     
@@ -75,8 +91,8 @@ class TowerSprite:
             pygame.draw.rect(frame, (255, 255, 255), frame.get_rect(), 2)
             
             # Add text
-            font = pygame.font.SysFont('Arial', 12, bold=True)
-            text = font.render(self.tower_name[:6], True, (255, 255, 255))
+            font = get_font('Arial', 12, bold=True)
+            text = render_text(font, self.tower_name[:6], (255, 255, 255))
             text_rect = text.get_rect(center=(32, 32))
             frame.blit(text, text_rect)
             
@@ -152,29 +168,28 @@ class BaseTower(pygame.sprite.Sprite):
         # Initial position (will be updated in update_position method)
         px, py = grid_to_px(gx, gy)
         self.rect = self.image.get_rect(topleft=(px+3, py+3))
+        self.world_pos = pygame.Vector2(tile_center_world(gx, gy))  # Ranges are measured from here
         self.cool = 0.0
 
     def get_scaled_image(self):
         """Get current frame scaled to appropriate size"""
         current_frame = self.sprite.get_current_frame(self.is_attacking)
-        screen = pygame.display.get_surface()
-        if screen:
-            screen_w, screen_h = screen.get_size()
-            scaled_grid_size = get_scaled_grid_size(screen_w, screen_h)
+        if pygame.display.get_surface():
             # Increase size by 1.25x and center on grid
-            size = max(int(scaled_grid_size * 1.25), 12)  # Minimum size is 12
+            size = max(int(current_viewport().tile_size * 1.25), 12)  # Minimum size is 12
         else:
             size = int(self.base_size * 1.25)
         
-        return pygame.transform.scale(current_frame, (size, size))
+        return SpriteVariants.get(current_frame, (size, size))
 
     def update_position(self, screen_width, screen_height):
         """Update tower position and size based on screen dimensions"""
         self.image = self.get_scaled_image()
         
         # Update position - center the larger image on the grid cell
-        px, py = grid_to_px(self.gx, self.gy, screen_width, screen_height)
-        scaled_grid_size = get_scaled_grid_size(screen_width, screen_height)
+        viewport = get_viewport(screen_width, screen_height)
+        px, py = viewport.grid_to_px(self.gx, self.gy)
+        scaled_grid_size = viewport.tile_size
         
         # Center the 1.25x sized image on the grid cell
         image_size = int(scaled_grid_size * 1.25)
@@ -207,6 +222,12 @@ class BaseTower(pygame.sprite.Sprite):
         self.update_position(screen_w, screen_h)
         screen.blit(self.image, self.rect)
 
+    def queue_draw(self, draw_list, screen_size):
+        """Queue the same blit as draw() on a DrawList"""
+        self.update_position(*screen_size)
+        if draw_list.visible(self.rect):
+            draw_list.add(LAYER_TOWERS, self.image, self.rect)
+
 class AttackingTower(BaseTower):
     """Tower that can attack enemies"""
     
@@ -221,22 +242,11 @@ class AttackingTower(BaseTower):
         if self.cool > 0:
             return
             
-        cx, cy = self.rect.center
-        
-        # Calculate scaled range
-        screen = pygame.display.get_surface()
-        if screen:
-            screen_w, screen_h = screen.get_size()
-            scale = get_scaled_grid_size(screen_w, screen_h) / GRID_SIZE
-            scaled_range = self.RANGE * scale
-        else:
-            scaled_range = self.RANGE
-        
-        # Find nearest enemy
-        nearest = min(enemies, key=lambda e:(cx-e.rect.centerx)**2+(cy-e.rect.centery)**2)
+        # Find nearest enemy - RANGE is in world units, so targeting does not depend on the window size
+        nearest = min(enemies, key=lambda e: self.world_pos.distance_squared_to(e.world_pos))
         
         # Check if nearest enemy is in range
-        if (cx-nearest.rect.centerx)**2 + (cy-nearest.rect.centery)**2 <= scaled_range**2:
+        if self.world_pos.distance_squared_to(nearest.world_pos) <= self.RANGE**2:
             # Play first enemy detection sound for detection towers
             if not self.has_played_detect_sound and (self.name == "Banana Blaster" or self.name == "Wood Sage"):
                 if self.name == "Banana Blaster":
@@ -246,8 +256,9 @@ class AttackingTower(BaseTower):
                 self.has_played_detect_sound = True
             
             # Attack the enemy
-            bullet = BulletFactory.create_bullet(self.name, self.rect.center, nearest, self.damage, enemies)
-            bullets.add(bullet)
+            bullet = BulletFactory.create_bullet(self.name, self.world_pos, nearest, self.damage, enemies)
+            if bullet is not None:
+                bullets.add(bullet)
             self.cool = self.rof
             self.start_attack_animation()
         else:
@@ -259,32 +270,21 @@ class ChronoCactusTower(BaseTower):
     
     def __init__(self, gx, gy, props):
         super().__init__(gx, gy, props)
-        self.slow_range = props.get('slow_range', 5) * GRID_SIZE  # Convert grid units to pixels
+        self.slow_range = props.get('slow_range', 5) * GRID_SIZE  # Convert grid units to world units
         self.slow_effect = props.get('slow_effect', 0.25)  # 25% speed reduction
         self.affected_enemies = set()  # Track which enemies are affected
     
     def update(self, dt, enemies, bullets):
         super().update(dt, enemies, bullets)
         
-        cx, cy = self.rect.center
-        
-        # Calculate scaled range
-        screen = pygame.display.get_surface()
-        if screen:
-            screen_w, screen_h = screen.get_size()
-            scale = get_scaled_grid_size(screen_w, screen_h) / GRID_SIZE
-            scaled_range = self.slow_range * scale
-        else:
-            scaled_range = self.slow_range
-        
         # Track enemies currently in range
         currently_in_range = set()
         
         # Check each enemy
         for enemy in enemies:
-            distance_sq = (cx - enemy.rect.centerx)**2 + (cy - enemy.rect.centery)**2
+            distance_sq = self.world_pos.distance_squared_to(enemy.world_pos)
             
-            if distance_sq <= scaled_range**2:
+            if distance_sq <= self.slow_range**2:
                 # Enemy is in range
                 currently_in_range.add(enemy)
                 
@@ -0,0 +1,147 @@
+"""Tests for bullet pooling and scheduled impacts; run with python -m pytest tests"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+import pytest
+
+from bullet import BulletFactory, BulletPool, ImpactScheduler, compute_intercept
+
+
+class Target(pygame.sprite.Sprite):
+    """Stand-in enemy at a fixed world position"""
+
+    base_size = 20
+
+    def __init__(self, world_pos, *groups):
+        super().__init__(*groups)
+        self.world_pos = pygame.Vector2(world_pos)
+        self.hits = []
+
+    def hit(self, damage):
+        self.hits.append(damage)
+        return True
+
+
+STRATEGY = BulletFactory._strategies['Wood Sage']
+
+
+def test_released_bullet_is_reused():
+    pool = BulletPool()
+    group = pygame.sprite.Group()
+    first = pool.acquire((100, 100), Target((300, 100)), 10, STRATEGY, 'Wood Sage')
+    group.add(first)
+    first.kill()
+
+    second = pool.acquire((50, 60), Target((50, 200)), 20, STRATEGY, 'Wood Sage')
+    assert second is first
+    assert pool.get_stats() == {'allocated': 1, 'in_use': 1, 'free': 0, 'high_water': 1}
+
+
+def test_reused_bullet_state_is_reset():
+    pool = BulletPool()
+    enemies = pygame.sprite.Group()
+    bullet = pool.acquire((100, 100), Target((300, 100), enemies), 10, STRATEGY, 'Wood Sage', enemies,
+                          impact_point=(300, 100), flight_time=1.0)
+    pygame.sprite.Group(bullet)
+    for _ in range(10):
+        bullet.update(1 / 60)
+    bullet.kill()
+    assert bullet.target is None and bullet.enemies_group is None  # Released bullets hold no enemies
+
+    target = Target((50, 200))
+    reused = pool.acquire((50, 60), target, 20, STRATEGY, 'Wood Sage')
+    assert reused is bullet
+    assert not reused.alive()
+    assert reused.pos == pygame.Vector2(50, 60)
+    assert reused.target is target
+    assert reused.damage == 20
+    assert reused.enemies_group is None
+    assert reused.flight_time is None
+    assert reused.age == 0.0
+    assert reused.rotation == 0
+    assert reused.dir == pygame.Vector2(0, 1)
+    assert reused.image is reused.frames[0]
+
+
+def test_pool_stats_track_peak_use():
+    pool = BulletPool()
+    bullets = [pool.acquire((0, 0), Target((10, 0)), 1, STRATEGY, 'Wood Sage') for _ in range(3)]
+    for bullet in bullets[:2]:
+        bullet.kill()
+    bullets[2].kill()  # Killing twice must not free the slot twice
+    bullets[2].kill()
+    pool.acquire((0, 0), Target((10, 0)), 1, STRATEGY, 'Wood Sage')
+
+    assert pool.get_stats() == {'allocated': 3, 'in_use': 1, 'free': 2, 'high_water': 3}
+
+
+class Runner(Target):
+    """Stand-in enemy moving right along the x axis"""
+
+    def __init__(self, world_pos, speed, *groups):
+        super().__init__(world_pos, *groups)
+        self.speed = speed
+
+    def predict_position(self, t):
+        return self.world_pos + pygame.Vector2(self.speed * t, 0)
+
+
+class RecordingEffect:
+    def __init__(self):
+        self.applied = []
+
+    def apply(self, enemy, damage, position, enemies_group=None):
+        self.applied.append(damage)
+
+
+def test_impacts_resolve_in_time_order():
+    scheduler = ImpactScheduler()
+    effect = RecordingEffect()
+    enemies = pygame.sprite.Group()
+    for flight_time, damage in ((0.3, 3), (0.1, 1), (0.2, 2), (0.2, 22), (0.9, 9)):
+        scheduler.schedule(flight_time, Target((0, 0), enemies), damage, effect)
+
+    scheduler.update(0.15)
+    assert effect.applied == [1]
+    scheduler.update(0.2)
+    assert effect.applied == [1, 2, 22, 3]
+    assert len(scheduler) == 1
+
+
+def test_impact_on_dead_target_is_dropped():
+    scheduler = ImpactScheduler()
+    effect = RecordingEffect()
+    enemies = pygame.sprite.Group()
+    doomed = Target((0, 0), enemies)
+    scheduler.schedule(0.1, doomed, 5, effect)
+    scheduler.schedule(0.1, Target((0, 0), enemies), 7, effect)
+    doomed.kill()
+
+    scheduler.update(0.2)
+    assert effect.applied == [7]
+    assert len(scheduler) == 0
+
+
+def test_intercept_of_stationary_target_is_its_position():
+    aim_point, flight_time = compute_intercept((0, 0), Runner((300, 400), 0), speed=100)
+    assert aim_point == pygame.Vector2(300, 400)
+    assert flight_time == pytest.approx(5.0)
+
+
+def test_intercept_leads_a_slower_target():
+    aim_point, flight_time = compute_intercept((0, 0), Runner((0, 100), 50), speed=100)
+    # Exact meeting point: (50 t)^2 + 100^2 = (100 t)^2
+    exact_time = 100 / 7500 ** 0.5
+    assert flight_time == pytest.approx(exact_time, rel=0.01)
+    assert aim_point.x == pytest.approx(50 * exact_time, rel=0.01)
+
+
+def test_intercept_of_faster_target_aims_at_its_position():
+    aim_point, flight_time = compute_intercept((0, 0), Runner((0, 100), 300), speed=100)
+    assert aim_point == pygame.Vector2(0, 100)
+    assert flight_time == pytest.approx(1.0)
@@ -0,0 +1,76 @@
+"""Tests for the incremental level catalog; run with python -m pytest tests"""
+import json
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+import level_catalog
+from level_catalog import CATALOG_VERSION, LevelCatalog
+from level_format import save_level
+from records import RecordsStore
+
+
+GRID = [[0, 0, 1], [1, 0, 1], [1, 0, 0]]
+
+
+@pytest.fixture
+def levels_dir(tmp_path, monkeypatch):
+    # Keep best time lookups away from the real user data folder
+    monkeypatch.setattr(level_catalog, 'records', RecordsStore(tmp_path / "records.sqlite3"))
+    levels = tmp_path / "levels"
+    levels.mkdir()
+    for name in ("a", "b", "c"):
+        save_level(levels / f"{name}.json", {'name': name.upper(), 'settings': {'wave_count': 3}, 'grid': GRID})
+    return levels
+
+
+def make_catalog(levels_dir):
+    return LevelCatalog(levels_dir, cache_path=levels_dir.parent / "catalog.json")
+
+
+def test_unchanged_files_are_not_read_again(levels_dir):
+    assert make_catalog(levels_dir).refresh() == 3
+
+    catalog = make_catalog(levels_dir)
+    assert catalog.refresh() == 0
+    assert [entry['name'] for entry in catalog.entries] == ["A", "B", "C"]
+
+
+def test_modified_file_is_read_again(levels_dir):
+    catalog = make_catalog(levels_dir)
+    catalog.refresh()
+
+    save_level(levels_dir / "b.json", {'name': "Renamed", 'settings': {'wave_count': 9}, 'grid': GRID})
+    stat = (levels_dir / "b.json").stat()
+    os.utime(levels_dir / "b.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert catalog.refresh() == 1
+    entry = catalog.search("renamed")[0]
+    assert (entry['file'], entry['waves']) == ("b.json", 9)
+
+
+def test_deleted_file_drops_out(levels_dir):
+    catalog = make_catalog(levels_dir)
+    catalog.refresh()
+
+    (levels_dir / "a.json").unlink()
+    assert catalog.refresh() == 0
+    assert [entry['file'] for entry in catalog.entries] == ["b.json", "c.json"]
+    assert [entry['file'] for entry in make_catalog(levels_dir)._load_cache().values()] == ["b.json", "c.json"]
+
+
+def test_catalog_from_an_older_version_is_rebuilt(levels_dir):
+    catalog = make_catalog(levels_dir)
+    catalog.refresh()
+    with open(catalog.cache_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data['version'] = CATALOG_VERSION - 1
+    with open(catalog.cache_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+    assert make_catalog(levels_dir).refresh() == 3
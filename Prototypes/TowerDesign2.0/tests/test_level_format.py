@@ -0,0 +1,68 @@
+"""Tests for the run-length encoded level file format; run with python -m pytest tests"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from level_format import (FORMAT_VERSION, convert_file, decode_row, dumps_level, encode_row,
+                          load_level, read_level_header, save_level)
+
+
+GRID = [[0, 0, 1, 1, 1], [1, 1, 1, 1, 1], [0, 1, 0, 1, 0]]
+LEVEL = {'name': "Test", 'settings': {'initial_money': 100, 'wave_count': 5}, 'grid': GRID}
+
+
+@pytest.mark.parametrize("row", [[], [1], [0, 0, 1], [1, 0, 1, 0], [1] * 20])
+def test_rows_round_trip(row):
+    assert decode_row(encode_row(row)) == row
+
+
+def test_empty_row_encodes_to_empty_text():
+    assert encode_row([]) == ""
+
+
+@pytest.mark.parametrize("text", ["0x", "0x2 x3", "0x2 1y3"])
+def test_corrupt_run_raises_value_error(text):
+    with pytest.raises(ValueError):
+        decode_row(text)
+
+
+def test_saved_level_loads_back(tmp_path):
+    path = tmp_path / "level.json"
+    save_level(path, LEVEL)
+
+    level_data = load_level(path)
+    assert level_data['grid'] == GRID
+    assert level_data['format'] == FORMAT_VERSION
+    assert level_data['size'] == [5, 3]
+
+
+def test_header_is_read_without_the_grid(tmp_path):
+    # Cut the file off in the middle of the grid - the header must still come back
+    path = tmp_path / "level.json"
+    text = dumps_level(LEVEL)
+    path.write_text(text[:text.index('"grid_rle"') + 20], encoding='utf-8')
+
+    header = read_level_header(path)
+    assert header['name'] == "Test"
+    assert header['settings'] == LEVEL['settings']
+    assert header['size'] == [5, 3]
+    assert 'grid_rle' not in header
+
+
+def test_legacy_level_loads_and_converts(tmp_path):
+    path = tmp_path / "legacy.json"
+    legacy = {'name': "Old", 'settings': {'initial_money': 50, 'best_time': None}, 'grid': GRID}
+    path.write_text(json.dumps(legacy, indent=2), encoding='utf-8')
+
+    assert load_level(path)['grid'] == GRID
+    assert read_level_header(path)['size'] == [5, 3]
+
+    assert convert_file(path)
+    assert not convert_file(path)
+    level_data = load_level(path)
+    assert level_data['grid'] == GRID
+    assert level_data['settings'] == {'initial_money': 50}
@@ -0,0 +1,19 @@
+"""Regression tests for the START/HOME sprites; run with python -m pytest tests"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from map_component import HomeSprite
+
+
+def test_home_sprite_draws_after_hit_ends_with_mask_shown():
+    home = HomeSprite()
+    home.on_hit()
+    home.show_mask = True
+    home.update(home.hit_duration + 0.01)
+
+    assert home.state == "checking"
+    assert home.get_current_sprite((40, 40)).get_size() == (40, 40)
@@ -0,0 +1,44 @@
+"""Tests for the SQLite records store; run with python -m pytest tests"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from records import RecordsStore
+
+
+def test_best_time_is_kept_only_when_beaten(tmp_path):
+    store = RecordsStore(tmp_path / "records.sqlite3")
+    store.record_run("level", "Level", 'victory', 100.0, 5)
+    store.record_run("level", "Level", 'victory', 120.0, 5)
+    store.record_run("level", "Level", 'defeat', 50.0, 2)
+    assert store.best_time("level") == 100.0
+
+    store.record_run("level", "Level", 'victory', 90.0, 5)
+    store.close()
+
+    reopened = RecordsStore(tmp_path / "records.sqlite3")
+    assert reopened.best_time("level") == 90.0
+    assert reopened.best_time("other level") is None
+
+
+def test_legacy_best_time_is_merged_with_the_stored_one(tmp_path):
+    store = RecordsStore(tmp_path / "records.sqlite3")
+    assert store.best_time("level", legacy_best=80.0) == 80.0
+
+    store.record_run("level", "Level", 'victory', 100.0, 5)
+    assert store.best_time("level", legacy_best=80.0) == 80.0
+    assert store.best_time("level", legacy_best=120.0) == 100.0
+    store.close()
+
+
+def test_runs_are_on_disk_after_close(tmp_path):
+    store = RecordsStore(tmp_path / "records.sqlite3")
+    store.record_run("level", "Level", 'defeat', 30.0, 2)
+    store.record_run("level", "Level", 'victory', 100.0, 5)
+    store.close()
+
+    runs = RecordsStore(tmp_path / "records.sqlite3").recent_runs("level")
+    assert [(result, time, wave) for result, time, wave, _ in runs] == [('victory', 100.0, 5), ('defeat', 30.0, 2)]
@@ -0,0 +1,27 @@
+"""Tests for the scaled sprite cache; run with python -m pytest tests"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+from sprite_variants import SpriteVariants
+
+
+def test_frames_stay_within_cap_while_zooming(monkeypatch):
+    monkeypatch.setattr(SpriteVariants, 'max_frames', 8)
+    frame = pygame.Surface((32, 32), pygame.SRCALPHA)
+    SpriteVariants.clear()
+    try:
+        for size in range(1, 20):
+            SpriteVariants.get(frame, (size, size))
+        SpriteVariants.get(frame, (1, 1))  # Evicted long ago - built again
+
+        assert SpriteVariants.get_stats()['frames'] == 8
+        assert (frame, (1, 1), None) in SpriteVariants._frames
+        assert (frame, (2, 2), None) not in SpriteVariants._frames
+    finally:
+        SpriteVariants.clear()
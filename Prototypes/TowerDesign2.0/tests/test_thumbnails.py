@@ -0,0 +1,28 @@
+"""Tests for the thumbnail disk cache; run with python -m pytest tests"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+import thumbnails
+from thumbnails import ThumbnailCache
+
+
+def test_saved_thumbnail_replaces_the_temporary_file(tmp_path):
+    cache = ThumbnailCache(tmp_path)
+    cache._save(pygame.Surface((8, 8)), tmp_path / "grid_2.png")
+    assert [path.name for path in tmp_path.iterdir()] == ["grid_2.png"]
+
+
+def test_failed_save_leaves_no_temporary_file(tmp_path, monkeypatch):
+    def fail(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(thumbnails.os, 'replace', fail)
+
+    cache = ThumbnailCache(tmp_path)
+    cache._save(pygame.Surface((8, 8)), tmp_path / "grid_2.png")
+    assert list(tmp_path.iterdir()) == []